@@ -0,0 +1,51 @@
+"""Compare the specialized and generic algorithms of the core filters.
+
+Run with ``python benchmarks/fast_filters.py [n]`` where ``n`` is the
+number of points along each axis of the benchmark volume.
+
+"""
+import sys
+import time
+
+import numpy as np
+
+import pyvista
+
+
+def _time(func, repeat=3):
+    """Return the best wall time of ``func`` in seconds."""
+    times = []
+    for _ in range(repeat):
+        tstart = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - tstart)
+    return min(times)
+
+
+def main(n=100):
+    volume = pyvista.UniformGrid((n, n, n))
+    x, y, z = volume.points.T
+    volume['values'] = np.sin(x / 7) * np.cos(y / 5) + z / n
+    grid = volume.cast_to_unstructured_grid()
+    normal = (1, 1, 0.3)
+
+    cases = [
+        ('contour', volume, lambda mesh, fast: mesh.contour(
+            [0.5], method=None if fast else 'contour')),
+        ('contour', grid, lambda mesh, fast: mesh.contour(
+            [0.5], method=None if fast else 'contour')),
+        ('slice', volume, lambda mesh, fast: mesh.slice(
+            normal, generate_triangles=True, fast=fast)),
+        ('crinkle slice', grid, lambda mesh, fast: mesh.slice(
+            normal, crinkle=True, fast=fast)),
+    ]
+    print(f'{"filter":<15}{"dataset":<18}{"generic (s)":>12}{"fast (s)":>12}{"speedup":>10}')
+    for name, mesh, func in cases:
+        generic = _time(lambda: func(mesh, False))
+        fast = _time(lambda: func(mesh, True))
+        print(f'{name:<15}{type(mesh).__name__:<18}{generic:>12.4f}{fast:>12.4f}'
+              f'{generic / fast:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
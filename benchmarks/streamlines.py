@@ -0,0 +1,46 @@
+"""Compare serial and parallel streamline integration.
+
+Run with ``python benchmarks/streamlines.py [n_seeds] [scale] [n_workers]``.
+The blood velocity of :func:`pyvista.examples.download_carotid` is
+resampled on a grid ``scale`` times finer along each axis and
+integrated from ``n_seeds`` random seeds.
+
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+import pyvista
+from pyvista import examples
+
+
+def main(n_seeds=10000, scale=2, n_workers=None):
+    mesh = examples.download_carotid()
+    fine = pyvista.UniformGrid([(n - 1) * scale + 1 for n in mesh.dimensions],
+                               [s / scale for s in mesh.spacing], mesh.origin)
+    fine = fine.sample(mesh)
+    fine.set_active_vectors('vectors')
+    bounds = np.array(fine.bounds).reshape(3, 2)
+    rng = np.random.default_rng(0)
+    seeds = pyvista.PolyData(rng.uniform(bounds[:, 0], bounds[:, 1], (n_seeds, 3)))
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    print(f'{fine.n_cells} cells, {n_seeds} seeds')
+
+    tstart = time.perf_counter()
+    serial = fine.streamlines_from_source(seeds, 'vectors')
+    serial_time = time.perf_counter() - tstart
+    tstart = time.perf_counter()
+    parallel = fine.streamlines_from_source(seeds, 'vectors', n_workers=n_workers)
+    parallel_time = time.perf_counter() - tstart
+    assert parallel.n_cells == serial.n_cells
+
+    print(f'{"workers":<10}{"time (s)":>12}{"speedup":>10}')
+    print(f'{1:<10}{serial_time:>12.3f}{1:>9.1f}x')
+    print(f'{n_workers:<10}{parallel_time:>12.3f}{serial_time / parallel_time:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
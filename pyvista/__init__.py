@@ -90,6 +90,13 @@ except Exception as e:
                   '`PYVISTA_USERDATA_PATH` to a writable path.')
     EXAMPLES_PATH = None
 
+# On-disk cache used by ``pyvista.read(..., cache=True)`` and bounded to
+# ``READ_CACHE_MAX_SIZE`` bytes
+READ_CACHE_PATH = os.path.join(USER_DATA_PATH, 'cache')
+READ_CACHE_MAX_SIZE = 2 * 1024**3
+if 'PYVISTA_READ_CACHE_SIZE' in os.environ:
+    READ_CACHE_MAX_SIZE = int(os.environ['PYVISTA_READ_CACHE_SIZE'])
+
 # Send VTK messages to the logging module:
 send_errors_to_logging()
 
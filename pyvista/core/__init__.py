@@ -4,7 +4,7 @@ from .common import Common, DataObject
 from .composite import MultiBlock
 from .datasetattributes import DataSetAttributes
 from .filters import (CompositeFilters, DataSetFilters, PolyDataFilters,
-                      UnstructuredGridFilters, UniformGridFilters)
+                      UnstructuredGridFilters, UniformGridFilters, merge)
 from .grid import Grid, RectilinearGrid, UniformGrid
 from .objects import Table, Texture
 from .pointset import PointGrid, PolyData, StructuredGrid, UnstructuredGrid
@@ -11,7 +11,10 @@ import vtk
 import pyvista
 from pyvista.utilities import (FieldAssociation, get_array, is_pyvista_dataset,
                                raise_not_matching, vtk_id_list_to_array, fileio,
-                               abstract_class, axis_rotation)
+                               helpers, abstract_class, axis_rotation)
+from pyvista.utilities.cells import _csr_from_pairs, cell_edges, dataset_cells
+from pyvista.utilities.interpolation import InterpolationOperator
+from pyvista.utilities.measures import cell_sizes
 from .datasetattributes import DataSetAttributes
 from .filters import DataSetFilters
 
@@ -116,6 +119,95 @@ class DataObject:
         writer.SetInputData(self)
         writer.Write()
 
+    def save_async(self, filename, binary=True, deep=True):
+        """Save this vtk object to file on a background writer thread.
+
+        The object is copied before the write is queued, so it may be
+        modified as soon as this method returns.  Writes are run on a
+        managed thread pool (see :func:`pyvista.set_async_writers`) and
+        this call blocks when too many writes are already pending.
+
+        Parameters
+        ----------
+        filename : str, pathlib.Path
+            Filename of output file. Writer type is inferred from
+            the extension of the filename.
+
+        binary : bool, optional
+            If True, write as binary, else ASCII.
+
+        deep : bool, optional
+            Snapshot the object with a deep copy.  A shallow copy is
+            cheaper but shares array memory with this object, so
+            arrays must not be modified in place until the write is
+            complete.
+
+        Return
+        ------
+        future : concurrent.futures.Future
+            Future that resolves to ``None`` once the file is written
+            and re-raises any error from the writer.
+
+        Examples
+        --------
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> future = sphere.save_async('sphere.vtk')  # doctest:+SKIP
+        >>> future.result()  # doctest:+SKIP
+
+        """
+        if self._WRITERS is None:
+            raise NotImplementedError(f'{self.__class__.__name__} writers are not specified,'
+                                      ' this should be a dict of (file extension: vtkWriter type)')
+
+        file_path = Path(filename).expanduser().resolve()
+        if file_path.suffix not in self._WRITERS:
+            raise ValueError('Invalid file extension for this data type.'
+                             f' Must be one of: {self._WRITERS.keys()}')
+
+        snapshot = self.copy(deep=deep)
+        return fileio._submit_write(snapshot.save, file_path, binary)
+
+    def submit(self, name, *args, **kwargs):
+        """Run a filter of this object on a background thread.
+
+        The filter is applied to a shallow copy of this object on a
+        managed thread pool (see :func:`pyvista.set_filter_workers`),
+        so this call returns immediately.  Arrays must not be modified
+        in place until the filter is complete.
+
+        Parameters
+        ----------
+        name : str
+            Name of the filter method, e.g. ``'decimate'``.
+
+        *args, **kwargs
+            Arguments passed to the filter.  In-place filters are not
+            supported.
+
+        Return
+        ------
+        future : pyvista.FilterFuture
+            Future that resolves to the filter output.  Its progress
+            can be observed and it can be cancelled while running.
+
+        Examples
+        --------
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> future = sphere.submit('decimate', 0.9)
+        >>> future.add_progress_callback(lambda fut, progress: None)
+        >>> decimated = future.result()
+
+        """
+        if kwargs.get('inplace'):
+            raise ValueError('In-place filters cannot be submitted.')
+        snapshot = self.copy(deep=False)
+        func = getattr(snapshot, name)
+        if not callable(func):
+            raise TypeError(f'`{name}` is not a filter of {self.__class__.__name__}.')
+        return helpers._submit_filter(func, *args, **kwargs)
+
     def get_data_range(self, arr=None, preference='field'):  # pragma: no cover
         """Get the non-NaN min and max of a named array.
 
@@ -822,8 +914,270 @@ class Common(DataSetFilters, DataObject):
             Total volume of the mesh.
 
         """
-        sizes = self.compute_cell_sizes(length=False, area=False, volume=True)
-        return np.sum(sizes.cell_arrays['Volume'])
+        sizes = cell_sizes(self, length=False, area=False, volume=True)
+        return np.sum(sizes['Volume'])
+
+    def _topology_mtime(self):
+        """Return the modification time of the mesh, ignoring its arrays."""
+        mtime = vtk.vtkObject.GetMTime(self)
+        if isinstance(self, vtk.vtkPointSet) and self.GetPoints() is not None:
+            mtime = max(mtime, self.GetPoints().GetMTime())
+        if isinstance(self, vtk.vtkPolyData):
+            cells = [self.GetVerts(), self.GetLines(), self.GetPolys(), self.GetStrips()]
+        elif isinstance(self, vtk.vtkUnstructuredGrid):
+            cells = [self.GetCells()]
+        else:
+            cells = []
+        return max([mtime] + [array.GetMTime() for array in cells if array is not None])
+
+    def _cached_adjacency(self, name, build):
+        """Return an adjacency, rebuilding it when the mesh is modified.
+
+        Changing the arrays of the mesh does not invalidate the cache.
+
+        """
+        cache = self.__dict__.setdefault('_adjacency_cache', {})
+        mtime = self._topology_mtime()
+        if name not in cache or cache[name][0] != mtime:
+            cache[name] = (mtime, build())
+        return cache[name][1]
+
+    @property
+    def cell_to_points(self):
+        """Return the points of each cell as a CSR adjacency.
+
+        Row ``i`` holds the ids of the points of cell ``i``, sorted and
+        without repetition.  The adjacency is built from the cell
+        connectivity when first accessed and cached until the mesh is
+        modified.  Call ``Modified()`` after changing the connectivity
+        arrays in place.
+
+        Return
+        ------
+        adjacency : pyvista.utilities.cells.Adjacency
+            ``(indptr, indices)`` of shape ``(n_cells, n_points)``.  Use
+            ``adjacency.to_sparse()`` for a ``scipy`` sparse matrix.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Plane(i_resolution=1, j_resolution=1)
+        >>> mesh.cell_to_points.row(0)
+        array([0, 1, 2, 3])
+
+        """
+        def build():
+            offsets, connectivity, _ = dataset_cells(self)
+            cells = np.repeat(np.arange(self.n_cells), np.diff(offsets))
+            return _csr_from_pairs(cells, connectivity, (self.n_cells, self.n_points))
+        return self._cached_adjacency('cell_to_points', build)
+
+    @property
+    def point_to_cells(self):
+        """Return the cells using each point as a CSR adjacency.
+
+        Row ``i`` holds the sorted ids of the cells using point ``i``.
+        Cached until the mesh is modified, see :attr:`cell_to_points`.
+
+        Return
+        ------
+        adjacency : pyvista.utilities.cells.Adjacency
+            ``(indptr, indices)`` of shape ``(n_points, n_cells)``.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Plane(i_resolution=2, j_resolution=1)
+        >>> mesh.point_to_cells.row(1)
+        array([0, 1])
+
+        """
+        def build():
+            cell_to_points = self.cell_to_points
+            cells = np.repeat(np.arange(self.n_cells), cell_to_points.counts)
+            return _csr_from_pairs(cell_to_points.indices, cells, (self.n_points, self.n_cells))
+        return self._cached_adjacency('point_to_cells', build)
+
+    @property
+    def point_neighbors(self):
+        """Return the points joined to each point by a cell edge.
+
+        Row ``i`` holds the sorted ids of the points sharing an edge
+        with point ``i``.  The points of 1D cells are joined to the
+        next point of the cell.  Cached until the mesh is modified, see
+        :attr:`cell_to_points`.
+
+        Return
+        ------
+        adjacency : pyvista.utilities.cells.Adjacency
+            ``(indptr, indices)`` of shape ``(n_points, n_points)``.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Plane(i_resolution=1, j_resolution=1)
+        >>> mesh.point_neighbors.row(0)
+        array([1, 2])
+
+        """
+        def build():
+            edges = cell_edges(self)
+            edges = edges[edges[:, 0] != edges[:, 1]]
+            return _csr_from_pairs(edges.ravel(), edges[:, ::-1].ravel(),
+                                   (self.n_points, self.n_points))
+        return self._cached_adjacency('point_neighbors', build)
+
+    @property
+    def cell_neighbors(self):
+        """Return the cells sharing at least one point with each cell.
+
+        Row ``i`` holds the sorted ids of the other cells using any
+        point of cell ``i``.  Cached until the mesh is modified, see
+        :attr:`cell_to_points`.
+
+        Return
+        ------
+        adjacency : pyvista.utilities.cells.Adjacency
+            ``(indptr, indices)`` of shape ``(n_cells, n_cells)``.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Plane(i_resolution=3, j_resolution=1)
+        >>> mesh.cell_neighbors.row(1)
+        array([0, 2])
+
+        """
+        def build():
+            # pair each cell of a point with all cells of that point
+            point_to_cells = self.point_to_cells
+            counts = point_to_cells.counts
+            rows = np.repeat(point_to_cells.indices, np.repeat(counts, counts))
+            starts = np.repeat(point_to_cells.indptr[:-1], counts**2)
+            within = np.arange(rows.size) - np.repeat(np.cumsum(counts**2) - counts**2,
+                                                      counts**2)
+            columns = point_to_cells.indices[starts + within % np.repeat(counts, counts**2)]
+            other = rows != columns
+            return _csr_from_pairs(rows[other], columns[other], (self.n_cells, self.n_cells))
+        return self._cached_adjacency('cell_neighbors', build)
+
+    @property
+    def cell_to_point_data_operator(self):
+        """Return the operator averaging cell data at the points.
+
+        Each point takes the mean of the cells using it, as done by
+        :func:`pyvista.DataSetFilters.cell_data_to_point_data`.  A cell
+        repeating a point counts once for it, where VTK counts each
+        repetition.  Points without cells are zero.  The operator is
+        built from :attr:`point_to_cells` and cached until the mesh is
+        modified, see :attr:`cell_to_points`.
+
+        Return
+        ------
+        operator : pyvista.InterpolationOperator
+            Operator from the cells to the points.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Plane(i_resolution=2, j_resolution=1)
+        >>> mesh.cell_to_point_data_operator.apply([1.0, 3.0])
+        array([1., 2., 3., 1., 2., 3.])
+
+        """
+        def build():
+            # the unique (point, cell) pairs weight each cell once
+            point_to_cells = self.point_to_cells
+            counts = point_to_cells.counts
+            weights = 1 / np.repeat(counts, counts)
+            return InterpolationOperator(point_to_cells.indptr, point_to_cells.indices,
+                                         weights, self.n_cells)
+        return self._cached_adjacency('cell_to_point_data_operator', build)
+
+    @property
+    def point_to_cell_data_operator(self):
+        """Return the operator averaging point data in the cells.
+
+        Each cell takes the mean of its points, as done by
+        :func:`pyvista.DataSetFilters.point_data_to_cell_data`.  Cached
+        until the mesh is modified, see :attr:`cell_to_points`.
+
+        Return
+        ------
+        operator : pyvista.InterpolationOperator
+            Operator from the points to the cells.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Plane(i_resolution=1, j_resolution=1)
+        >>> mesh.point_to_cell_data_operator.apply([0.0, 1.0, 2.0, 3.0])
+        array([1.5])
+
+        """
+        def build():
+            offsets, connectivity, _ = dataset_cells(self)
+            sizes = np.diff(offsets)
+            weights = 1 / np.repeat(sizes, sizes)
+            return InterpolationOperator(offsets, connectivity, weights, self.n_points)
+        return self._cached_adjacency('point_to_cell_data_operator', build)
+
+    def cell_array_to_point_array(self, values):
+        """Return a cell array averaged at the points.
+
+        Unlike :func:`pyvista.DataSetFilters.cell_data_to_point_data`,
+        only the given array is converted and the mesh is not copied.
+        The averaging operator is cached, so converting many arrays,
+        such as the timesteps of a simulation, costs a sparse
+        matrix-vector product each.
+
+        Parameters
+        ----------
+        values : str or np.ndarray
+            Name of a cell array of the mesh, or an array with one row
+            per cell and any number of components.
+
+        Return
+        ------
+        point_values : np.ndarray
+            Floating point array with one row per point.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere()
+        >>> point_values = mesh.cell_array_to_point_array(np.ones(mesh.n_cells))
+        >>> bool(np.allclose(point_values, 1))
+        True
+
+        """
+        if isinstance(values, str):
+            values = self.cell_arrays[values]
+        return self.cell_to_point_data_operator.apply(values)
+
+    def point_array_to_cell_array(self, values):
+        """Return a point array averaged in the cells.
+
+        Unlike :func:`pyvista.DataSetFilters.point_data_to_cell_data`,
+        only the given array is converted and the mesh is not copied.
+        See :func:`pyvista.Common.cell_array_to_point_array`.
+
+        Parameters
+        ----------
+        values : str or np.ndarray
+            Name of a point array of the mesh, or an array with one row
+            per point and any number of components.
+
+        Return
+        ------
+        cell_values : np.ndarray
+            Floating point array with one row per cell.
+
+        """
+        if isinstance(values, str):
+            values = self.point_arrays[values]
+        return self.point_to_cell_data_operator.apply(values)
 
     def get_array(self, name, preference='cell', info=False):
         """Search both point, cell and field data for an array."""
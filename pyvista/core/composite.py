@@ -241,7 +241,12 @@ class MultiBlock(vtkMultiBlockDataSet, CompositeFilters, DataObject):
     def append(self, data):
         """Add a data set to the next block index."""
         index = self.n_blocks # note off by one so use as index
-        self[index] = data
+        if data is not None and not is_pyvista_dataset(data):
+            data = wrap(data)
+        # set the block directly, as searching the references of
+        # ``__setitem__`` makes appending many blocks quadratic
+        self.SetBlock(index, data)
+        self.set_block_name(index, f'Block-{index:02}')
         self.refs.append(data)
 
     def get(self, index):
@@ -23,33 +23,64 @@ Example
 
 """
 import collections.abc
+import heapq
 import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from functools import wraps
 
 import numpy as np
 import vtk
-from vtk.util.numpy_support import vtk_to_numpy
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
 import pyvista
 from pyvista.utilities import (FieldAssociation, NORMALS, assert_empty_kwargs,
                                generate_plane, get_array, vtk_id_list_to_array,
-                               wrap, ProgressMonitor, abstract_class)
-from pyvista.utilities.cells import numpy_to_idarr
+                               wrap, FilterFuture, ProgressMonitor, abstract_class)
+from pyvista.utilities.cells import (_STRUCTURED_CELL_ORDER, CellArray, _cell_dimensions,
+                                     cell_array_to_numpy, dataset_cells, numpy_to_idarr)
+from pyvista.utilities.fileio import _dataset_cache_key, _load_cached, _store_cached
+from pyvista.utilities.interpolation import InterpolationOperator, cell_weights
+from pyvista.utilities.measures import (_quality_measures, _set_quality_measure,
+                                        cell_quality, cell_sizes)
+from pyvista.utilities.raytrace import TriangleBVH
+from pyvista.utilities.helpers import (_PROFILES, _profile_start, _profile_stop,
+                                       _profile_output)
 from pyvista.core.errors import NotAllTrianglesError
 
 
-def _update_alg(alg, progress_bar=False, message=''):
-    """Update an algorithm with or without a progress bar."""
-    if progress_bar:
-        with ProgressMonitor(alg, message=message):
+def _update_alg(alg, progress_bar=False, message='', name=None):
+    """Update an algorithm with or without a progress bar.
+
+    ``name`` is the filter recorded by :func:`pyvista.profile`, which
+    defaults to the class name of the algorithm.
+
+    """
+    future = FilterFuture.current()
+    if future is not None:
+        observer = alg.AddObserver(vtk.vtkCommand.ProgressEvent, future._on_progress)
+    profile = None
+    if _PROFILES:
+        profile = _profile_start(alg, name or alg.GetClassName())
+    try:
+        if progress_bar:
+            with ProgressMonitor(alg, message=message):
+                alg.Update()
+        else:
             alg.Update()
-    else:
-        alg.Update()
+    finally:
+        if future is not None:
+            alg.RemoveObserver(observer)
+        if profile is not None:
+            _profile_stop(alg, profile)
 
 
 def _get_output(algorithm, iport=0, iconnection=0, oport=0, active_scalars=None,
                 active_scalars_field='point'):
     """Get the algorithm's output and copy input's pyvista meta info."""
+    tstart = time.perf_counter() if _PROFILES else None
     ido = algorithm.GetInputDataObject(iport, iconnection)
     data = wrap(algorithm.GetOutputDataObject(oport))
     if not isinstance(data, pyvista.MultiBlock):
@@ -58,14 +89,1044 @@ def _get_output(algorithm, iport=0, iconnection=0, oport=0, active_scalars=None,
             data.field_arrays.update(ido.field_arrays)
         if active_scalars is not None:
             data.set_active_scalars(active_scalars, preference=active_scalars_field)
+    if tstart is not None:
+        _profile_output(algorithm, time.perf_counter() - tstart)
     return data
 
 
+_LINEAR_3D_CELL_TYPES = (vtk.VTK_TETRA, vtk.VTK_VOXEL, vtk.VTK_HEXAHEDRON,
+                         vtk.VTK_WEDGE, vtk.VTK_PYRAMID)
+
+
+def _is_linear_3d_grid(dataset):
+    """Return ``True`` when ``dataset`` is an unstructured grid of linear 3D cells."""
+    return (isinstance(dataset, vtk.vtkUnstructuredGrid) and dataset.n_cells > 0 and
+            bool(np.isin(dataset.celltypes, _LINEAR_3D_CELL_TYPES).all()))
+
+
+def _is_volume(dataset):
+    """Return ``True`` when ``dataset`` is image data spanning three dimensions."""
+    return isinstance(dataset, vtk.vtkImageData) and min(dataset.dimensions) > 1
+
+
+def _float_arrays_only(dataset, cell_data=True):
+    """Return ``True`` when the linear grid filters keep the arrays of ``dataset``.
+
+    ``vtkContour3DLinearGrid`` rejects integer scalars,
+    ``vtk3DLinearGridCrinkleExtractor`` converts integer arrays to
+    floats, and only some of the specialized filters pass cell data.
+
+    """
+    if not cell_data and dataset.GetCellData().GetNumberOfArrays():
+        return False
+    return all(attributes[name].dtype.kind == 'f'
+               for attributes in (dataset.point_arrays, dataset.cell_arrays)
+               for name in attributes.keys())
+
+
+def _plane_cutter(dataset, plane, generate_triangles=False, fast=True):
+    """Return an algorithm cutting ``dataset`` by an implicit plane.
+
+    The multithreaded flying edges cutter only outputs triangles and
+    drops cell data, so it is only used when the generic ``vtkCutter``
+    would produce the same cells.  It interpolates integer point arrays
+    as floats.  ``vtkCutter`` already delegates grids of linear 3D cells
+    without cell data to ``vtk3DLinearGridPlaneCutter``.
+
+    """
+    if (fast and generate_triangles and _is_volume(dataset)
+            and not dataset.GetCellData().GetNumberOfArrays()
+            and dataset.GetPointData().GetNumberOfArrays()):
+        alg = vtk.vtkFlyingEdgesPlaneCutter()
+        alg.SetPlane(plane)
+        alg.InterpolateAttributesOn()
+        return alg
+    alg = vtk.vtkCutter()
+    alg.SetCutFunction(plane)
+    if not generate_triangles:
+        alg.GenerateTrianglesOff()
+    return alg
+
+
+def _crinkle_extractor(dataset, function, fast=True):
+    """Return an algorithm extracting the cells intersected by an implicit function."""
+    if fast and _is_linear_3d_grid(dataset) and _float_arrays_only(dataset):
+        alg = vtk.vtk3DLinearGridCrinkleExtractor()
+        alg.SetImplicitFunction(function)
+        alg.CopyPointDataOn()
+        alg.CopyCellDataOn()
+        alg.RemoveUnusedPointsOn()
+        return alg
+    alg = vtk.vtkExtractGeometry()
+    alg.SetImplicitFunction(function)
+    alg.ExtractInsideOn()
+    alg.ExtractBoundaryCellsOn()
+    alg.ExtractOnlyBoundaryCellsOn()
+    return alg
+
+
+def _fast_contour_filter(dataset, n_values, compute_gradients=False,
+                         compute_scalars=True):
+    """Return a specialized contour filter for ``dataset`` or ``None``.
+
+    Flying edges contours integer scalars too, but only interpolates the
+    other point arrays for a single isovalue, as floats.  The linear grid
+    filter never computes gradients nor passes the contoured scalars.
+
+    """
+    if dataset.GetCellData().GetNumberOfArrays():
+        return None
+    if _is_volume(dataset):
+        if n_values > 1 and dataset.GetPointData().GetNumberOfArrays() > 1:
+            return None
+        alg = vtk.vtkFlyingEdges3D()
+        alg.InterpolateAttributesOn()
+        return alg
+    if (_is_linear_3d_grid(dataset) and not compute_gradients
+            and _float_arrays_only(dataset, cell_data=False)):
+        if compute_scalars and n_values > 1:
+            return None
+        alg = vtk.vtkContour3DLinearGrid()
+        alg.MergePointsOn()
+        alg.InterpolateAttributesOn()
+        return alg
+    return None
+
+
+def _polygon_triangles(poly_data):
+    """Fan triangulate the polygons of ``poly_data``.
+
+    Returns the point ids of each triangle and the id of its cell.
+
+    """
+    offsets, connectivity = cell_array_to_numpy(poly_data.GetPolys())
+    n_fan = np.clip(np.diff(offsets) - 2, 0, None)
+    cells = np.repeat(np.arange(n_fan.size), n_fan)
+    local = np.arange(n_fan.sum()) - np.repeat(np.cumsum(n_fan) - n_fan, n_fan)
+    first = offsets[:-1][cells]
+    triangles = np.stack([connectivity[first], connectivity[first + local + 1],
+                          connectivity[first + local + 2]], axis=1)
+    return triangles, cells + poly_data.GetNumberOfVerts() + poly_data.GetNumberOfLines()
+
+
+def _ray_bvh(poly_data):
+    """Return the ray casting hierarchy of ``poly_data`` and its cell ids.
+
+    The hierarchy is cached with the adjacencies of the mesh, so it is
+    rebuilt when the points or cells change but not its arrays.
+
+    """
+    def build():
+        triangles, cell_ids = _polygon_triangles(poly_data)
+        return TriangleBVH(poly_data.points[triangles]), cell_ids
+
+    return poly_data._cached_adjacency('ray_bvh', build)
+
+
+def _geodesic_field(dataset, sources):
+    """Run Dijkstra's algorithm from many sources over the edges of a mesh.
+
+    Edges are weighted by their length.  Returns the distance of each
+    point to its closest source, the previous point on the path from
+    that source, ``-1`` at sources and unreachable points, and the
+    closest source, ``-1`` if unreachable.
+
+    """
+    sources = np.unique(np.asarray(sources, dtype=pyvista.ID_TYPE).ravel())
+    if sources.size and (sources[0] < 0 or sources[-1] >= dataset.n_points):
+        raise IndexError('Invalid indices.')
+    neighbors = dataset.point_neighbors
+    rows = np.repeat(np.arange(dataset.n_points), neighbors.counts)
+    weights = np.linalg.norm(dataset.points[rows] - dataset.points[neighbors.indices], axis=1)
+
+    try:
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import dijkstra
+    except ImportError:
+        dijkstra = None
+    if dijkstra is not None and sources.size:
+        graph = csr_matrix((weights, neighbors.indices, neighbors.indptr),
+                           shape=neighbors.shape)
+        distances, predecessors, nearest = dijkstra(graph, indices=sources, min_only=True,
+                                                    return_predecessors=True)
+        predecessors = np.where(predecessors < 0, -1, predecessors).astype(pyvista.ID_TYPE)
+        nearest = np.where(nearest < 0, -1, nearest).astype(pyvista.ID_TYPE)
+    else:
+        distances = np.full(dataset.n_points, np.inf)
+        predecessors = np.full(dataset.n_points, -1, pyvista.ID_TYPE)
+        nearest = np.full(dataset.n_points, -1, pyvista.ID_TYPE)
+        distances[sources] = 0
+        nearest[sources] = sources
+        heap = [(0.0, source) for source in sources.tolist()]
+        indptr, indices = neighbors.indptr, neighbors.indices
+        while heap:
+            distance, point = heapq.heappop(heap)
+            if distance > distances[point]:
+                continue
+            for i in range(indptr[point], indptr[point + 1]):
+                neighbor = indices[i]
+                if distance + weights[i] < distances[neighbor]:
+                    distances[neighbor] = distance + weights[i]
+                    predecessors[neighbor] = point
+                    nearest[neighbor] = nearest[point]
+                    heapq.heappush(heap, (distances[neighbor], neighbor))
+    return distances, predecessors, nearest
+
+
+_POLYDATA_CELL_ARRAYS = (('GetVerts', 'SetVerts'), ('GetLines', 'SetLines'),
+                         ('GetPolys', 'SetPolys'), ('GetStrips', 'SetStrips'))
+
+
+def _split_polydata(poly_data, point_labels, n_groups):
+    """Split polydata into groups of cells labelled by their points.
+
+    Each cell belongs to the group of its first point, so no point may
+    be shared by cells of different groups.  All groups are built in a
+    single pass over the connectivity.
+
+    """
+    point_labels = np.asarray(point_labels)
+    n_points = poly_data.n_points
+
+    # renumber the points so that each group is a contiguous range
+    point_order = np.argsort(point_labels, kind='stable')
+    point_bounds = np.searchsorted(point_labels[point_order], np.arange(n_groups + 1))
+    local_ids = np.empty(n_points, pyvista.ID_TYPE)
+    local_ids[point_order] = (np.arange(n_points) -
+                              np.repeat(point_bounds[:-1], np.diff(point_bounds)))
+
+    topologies = []
+    cell_start = 0
+    for getter, setter in _POLYDATA_CELL_ARRAYS:
+        offsets, connectivity = cell_array_to_numpy(getattr(poly_data, getter)())
+        n_cells = offsets.size - 1
+        sizes = np.diff(offsets)
+        labels = np.zeros(n_cells, point_labels.dtype)
+        nonempty = sizes > 0
+        labels[nonempty] = point_labels[connectivity[offsets[:-1][nonempty]]]
+        order = np.argsort(labels, kind='stable')
+        bounds = np.searchsorted(labels[order], np.arange(n_groups + 1))
+        sizes = sizes[order]
+        new_offsets = np.zeros(n_cells + 1, pyvista.ID_TYPE)
+        np.cumsum(sizes, out=new_offsets[1:])
+        gather = (np.repeat(offsets[:-1][order] - new_offsets[:-1], sizes) +
+                  np.arange(new_offsets[-1]))
+        new_connectivity = local_ids[connectivity[gather]]
+        topologies.append((setter, new_offsets, new_connectivity, bounds,
+                           order + cell_start))
+        cell_start += n_cells
+
+    points = poly_data.points[point_order]
+    point_arrays = {name: poly_data.point_arrays[name][point_order]
+                    for name in poly_data.point_arrays.keys()}
+    cell_arrays = {name: poly_data.cell_arrays[name] for name in poly_data.cell_arrays.keys()}
+
+    groups = []
+    for i in range(n_groups):
+        mesh = pyvista.PolyData()
+        mesh.points = points[point_bounds[i]:point_bounds[i + 1]]
+        cell_ids = []
+        for setter, offsets, connectivity, bounds, order in topologies:
+            c0, c1 = bounds[i], bounds[i + 1]
+            getattr(mesh, setter)(CellArray.from_arrays(
+                offsets[c0:c1 + 1] - offsets[c0], connectivity[offsets[c0]:offsets[c1]]))
+            cell_ids.append(order[c0:c1])
+        cell_ids = np.concatenate(cell_ids)
+        for name, array in point_arrays.items():
+            mesh.point_arrays.append(array[point_bounds[i]:point_bounds[i + 1]], name,
+                                     active_scalars=False, active_vectors=False)
+        for name, array in cell_arrays.items():
+            mesh.cell_arrays.append(array[cell_ids], name,
+                                    active_scalars=False, active_vectors=False)
+        for source, target in ((poly_data.GetPointData(), mesh.GetPointData()),
+                               (poly_data.GetCellData(), mesh.GetCellData())):
+            for j in range(source.GetNumberOfArrays()):
+                attribute = source.IsArrayAnAttribute(j)
+                if attribute >= 0:
+                    target.SetActiveAttribute(source.GetArrayName(j), attribute)
+        mesh.copy_meta_from(poly_data)
+        groups.append(mesh)
+    return groups
+
+
+def _label_connected_cells(dataset):
+    """Label the regions of cells connected through shared points.
+
+    Regions are found by union-find on the cell adjacency and numbered
+    in the order of their first cell, like ``vtkConnectivityFilter``.
+    Returns the label of each cell and the number of regions.
+
+    """
+    point_to_cells = dataset.point_to_cells
+    counts = point_to_cells.counts
+    used = counts > 0
+    # join every cell of a point to the first cell of that point
+    first = np.repeat(point_to_cells.indices[point_to_cells.indptr[:-1][used]], counts[used])
+    cells = point_to_cells.indices
+    parent = np.arange(dataset.n_cells)
+    while True:
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        roots_a, roots_b = parent[first], parent[cells]
+        differ = roots_a != roots_b
+        if not differ.any():
+            break
+        first, cells = first[differ], cells[differ]
+        roots_a, roots_b = roots_a[differ], roots_b[differ]
+        # hook each root to one of the lower roots it is joined to, so
+        # that the root of each region ends as its lowest cell
+        parent[np.maximum(roots_a, roots_b)] = np.minimum(roots_a, roots_b)
+    roots, labels = np.unique(parent, return_inverse=True)
+    return labels, roots.size
+
+
+def _take_attributes(attributes, ids):
+    """Return the tuples ``ids`` of all arrays of point or cell data."""
+    taken = attributes.NewInstance()
+    for i in range(attributes.GetNumberOfArrays()):
+        array = attributes.GetAbstractArray(i)
+        array_type = None
+        if isinstance(array, vtk.vtkDataArray) and not isinstance(array, vtk.vtkBitArray):
+            array_type = array.GetDataType()
+        taken.AddArray(pyvista.utilities.convert_array(
+            pyvista.utilities.convert_array(array)[ids], array.GetName(), deep=True,
+            array_type=array_type))
+        attribute = attributes.IsArrayAnAttribute(i)
+        if attribute >= 0:
+            taken.SetActiveAttribute(i, attribute)
+    return taken
+
+
+def _reduce_cells(offsets, values, ufunc, identity):
+    """Reduce the values of the connectivity of each cell with ``ufunc``.
+
+    Cells without points are given ``identity``.
+
+    """
+    sizes = np.diff(offsets)
+    if not values.size:
+        return np.full(sizes.size, identity, dtype=values.dtype)
+    if (sizes == sizes[0]).all():
+        return ufunc.reduce(values.reshape(sizes.size, -1), axis=1)
+    # keep the start of trailing empty cells in range
+    reduced = ufunc.reduceat(values, np.minimum(offsets[:-1], values.size - 1))
+    reduced[sizes == 0] = identity
+    return reduced
+
+
+def _selection_mask(ind, size, wrap=False):
+    """Return the boolean mask of indices or of a mask of ``size`` items.
+
+    Indices must be between ``0`` and ``size - 1``, unless ``wrap``
+    allows negative indices counted from the end, as numpy does.
+
+    """
+    ind = np.asarray(ind)
+    if ind.dtype == np.bool_:
+        if ind.size != size:
+            raise ValueError(f'Mask length ({ind.size}) must match the number of '
+                             f'items ({size}).')
+        return ind.ravel()
+    if not issubclass(ind.dtype.type, np.integer):
+        raise TypeError('Indices must be either a mask or an integer array-like')
+    if not wrap and ind.size and (ind.min() < 0 or ind.max() >= size):
+        raise ValueError(f'Indices must be between 0 and {size - 1}.')
+    mask = np.zeros(size, dtype=bool)
+    mask[ind] = True
+    return mask
+
+
+def _gather_cells(dataset, cell_mask, cells=None):
+    """Return the cells of a mask with their points renumbered.
+
+    Cells and points keep their order.  ``cells`` are the cells of the
+    dataset given by :func:`dataset_cells` when already known.
+
+    Return
+    ------
+    cell_ids : np.ndarray
+        Ids of the gathered cells in the dataset.
+
+    point_ids : np.ndarray
+        Ids of the points used by the gathered cells in the dataset.
+
+    offsets : np.ndarray
+        Start of each gathered cell in ``connectivity``, followed by its
+        length.
+
+    connectivity : np.ndarray
+        Renumbered point ids of the gathered cells.
+
+    celltypes : np.ndarray
+        Type of each gathered cell.
+
+    """
+    if cells is None:
+        cells = dataset_cells(dataset)
+    offsets, connectivity, celltypes = cells
+    cell_ids = np.nonzero(cell_mask)[0]
+    celltypes = celltypes[cell_ids]
+    all_sizes = np.diff(offsets)
+    if all_sizes.size and all_sizes[0] and (all_sizes == all_sizes[0]).all():
+        # cells of a single size are rows of the connectivity
+        cell_points = connectivity.reshape(-1, all_sizes[0])[cell_ids]
+        if isinstance(dataset, vtk.vtkStructuredGrid) and celltypes.size:
+            # curvilinear cells are hexahedra and quads rather than voxels and pixels
+            new_type, order = _STRUCTURED_CELL_ORDER.get(celltypes[0], (celltypes[0], None))
+            if order is not None:
+                cell_points = cell_points[:, order]
+                celltypes[:] = new_type
+        cell_points = cell_points.ravel()
+        new_offsets = np.arange(cell_ids.size + 1, dtype=pyvista.ID_TYPE) * all_sizes[0]
+    else:
+        sizes = all_sizes[cell_ids]
+        new_offsets = np.zeros(cell_ids.size + 1, pyvista.ID_TYPE)
+        np.cumsum(sizes, out=new_offsets[1:])
+        gather = (np.repeat(offsets[:-1][cell_ids] - new_offsets[:-1], sizes) +
+                  np.arange(new_offsets[-1]))
+        cell_points = connectivity[gather]
+
+    # number the used points in their original order with a lookup table
+    used = np.zeros(dataset.n_points, dtype=bool)
+    used[cell_points] = True
+    point_ids = np.nonzero(used)[0]
+    lookup = np.empty(dataset.n_points, pyvista.ID_TYPE)
+    lookup[point_ids] = np.arange(point_ids.size)
+    return cell_ids, point_ids, new_offsets, lookup[cell_points], celltypes
+
+
+def _unstructured_from_arrays(points, offsets, connectivity, celltypes):
+    """Return an unstructured grid of numpy points and cells."""
+    grid = pyvista.UnstructuredGrid()
+    grid.SetPoints(pyvista.vtk_points(points, deep=False))
+    cells = CellArray.from_arrays(offsets, connectivity)
+    vtk_celltypes = numpy_to_vtk(celltypes.astype(np.uint8), deep=True)
+    if hasattr(cells, 'GetConnectivityArray'):  # available >= VTK9
+        grid.SetCells(vtk_celltypes, cells)
+    else:
+        locations = offsets[:-1] + np.arange(offsets.size - 1)
+        grid.SetCells(vtk_celltypes, numpy_to_idarr(locations, deep=True), cells)
+    return grid
+
+
+def _polydata_from_arrays(points, offsets, connectivity, celltypes):
+    """Return a polydata of numpy points and cells.
+
+    Cells must be ordered as verts, lines, polys and strips.
+
+    """
+    mesh = pyvista.PolyData()
+    mesh.SetPoints(pyvista.vtk_points(points, deep=False))
+    # verts, lines, polys and strips, in the order of their ids
+    kinds = np.full(celltypes.shape, 2)
+    kinds[(celltypes == vtk.VTK_VERTEX) | (celltypes == vtk.VTK_POLY_VERTEX)] = 0
+    kinds[(celltypes == vtk.VTK_LINE) | (celltypes == vtk.VTK_POLY_LINE)] = 1
+    kinds[celltypes == vtk.VTK_TRIANGLE_STRIP] = 3
+    bounds = np.searchsorted(kinds, np.arange(5))
+    for kind, setter in enumerate((mesh.SetVerts, mesh.SetLines, mesh.SetPolys,
+                                   mesh.SetStrips)):
+        start, stop = bounds[kind], bounds[kind + 1]
+        if stop > start:
+            setter(CellArray.from_arrays(offsets[start:stop + 1] - offsets[start],
+                                         connectivity[offsets[start]:offsets[stop]],
+                                         deep=True))
+    return mesh
+
+
+def _extract_cells_numpy(dataset, cell_mask, cells=None):
+    """Extract the cells of a mask as done by ``vtkExtractSelection``.
+
+    Cells and points keep their order and are mapped back to the input
+    with the ``'vtkOriginalCellIds'`` and ``'vtkOriginalPointIds'``
+    arrays.  ``cells`` are the cells of the dataset given by
+    :func:`dataset_cells` when already known.  Polyhedra are not
+    supported.
+
+    """
+    cell_ids, point_ids, offsets, connectivity, celltypes = _gather_cells(dataset, cell_mask,
+                                                                          cells)
+    grid = _unstructured_from_arrays(dataset.points[point_ids], offsets, connectivity,
+                                     celltypes)
+    grid.GetPointData().ShallowCopy(_take_attributes(dataset.GetPointData(), point_ids))
+    grid.GetCellData().ShallowCopy(_take_attributes(dataset.GetCellData(), cell_ids))
+    grid.GetFieldData().DeepCopy(dataset.GetFieldData())
+    grid.point_arrays.append(point_ids.astype(pyvista.ID_TYPE), 'vtkOriginalPointIds',
+                             active_vectors=False, active_scalars=False)
+    grid.cell_arrays.append(cell_ids.astype(pyvista.ID_TYPE), 'vtkOriginalCellIds',
+                            active_vectors=False, active_scalars=False)
+    return grid
+
+
+def _remove_points(dataset, remove, mode, keep_scalars):
+    """Remove points and their cells from a polydata or unstructured grid.
+
+    Cells with any or all of their points removed, according to
+    ``mode``, are removed along with the points no longer used by a
+    cell.  Return the new mesh and the ids of its points in the
+    dataset.
+
+    """
+    remove_mask = _selection_mask(remove, dataset.n_points, wrap=True)
+
+    cells = dataset_cells(dataset)
+    offsets, connectivity, _ = cells
+    if mode == 'all':
+        ufunc = np.logical_and
+    else:
+        ufunc = np.logical_or
+    keep = ~_reduce_cells(offsets, remove_mask[connectivity], ufunc, False)
+
+    if _has_polyhedra(dataset):
+        # vtkExtractSelection adds the original ids to its input
+        mesh = dataset.copy(deep=False).extract_cells(keep)
+        point_ids = np.array(mesh.point_arrays['vtkOriginalPointIds'])
+        cell_ids = np.array(mesh.cell_arrays['vtkOriginalCellIds'])
+        mesh.clear_arrays()
+    else:
+        cell_ids, point_ids, offsets, connectivity, celltypes = _gather_cells(dataset, keep,
+                                                                              cells)
+        if isinstance(dataset, vtk.vtkPolyData):
+            from_arrays = _polydata_from_arrays
+        else:
+            from_arrays = _unstructured_from_arrays
+        mesh = from_arrays(dataset.points[point_ids], offsets, connectivity, celltypes)
+
+    # Add scalars back to mesh if requested
+    if keep_scalars:
+        mesh.GetPointData().ShallowCopy(_take_attributes(dataset.GetPointData(), point_ids))
+        mesh.GetCellData().ShallowCopy(_take_attributes(dataset.GetCellData(), cell_ids))
+    return mesh, point_ids
+
+
+def _merge_points(points, tolerance):
+    """Return a label for each point, shared by the points to merge.
+
+    Points are quantized on a grid of spacing ``tolerance`` and merged
+    when they fall in the same grid cell, or when they are equal for a
+    zero tolerance.
+
+    """
+    points = np.asarray(points, dtype=float)
+    if not points.size:
+        return np.empty(0, pyvista.ID_TYPE)
+    if tolerance > 0:
+        keys = np.floor((points - points.min(0)) / tolerance).astype(np.int64)
+        dimensions = keys.max(0) + 1
+        if np.prod(dimensions.astype(float)) < 2**62:
+            # sorting a single key is much faster than sorting rows
+            keys = np.ravel_multi_index(keys.T, dimensions)
+    else:
+        keys = points
+    if keys.ndim > 1:
+        # lexsort of the columns is several times faster than unique(axis=0)
+        order = np.lexsort(keys.T[::-1])
+        keys = keys[order]
+        new = np.ones(keys.shape[0], dtype=bool)
+        new[1:] = (keys[1:] != keys[:-1]).any(1)
+        labels = np.empty(keys.shape[0], pyvista.ID_TYPE)
+        labels[order] = np.cumsum(new) - 1
+        return labels
+    _, labels = np.unique(keys, return_inverse=True)
+    return labels
+
+
+def _remove_entries(offsets, connectivity, remove):
+    """Remove the entries of a mask from the connectivity of cells.
+
+    Return the new offsets and connectivity.
+
+    """
+    sizes = np.diff(offsets)
+    cells = np.repeat(np.arange(sizes.size), sizes)
+    sizes = sizes - np.bincount(cells[remove], minlength=sizes.size)
+    offsets = np.zeros(sizes.size + 1, pyvista.ID_TYPE)
+    np.cumsum(sizes, out=offsets[1:])
+    return offsets, connectivity[~remove]
+
+
+def _clean(dataset, tolerance=None):
+    """Merge the points of a polydata or unstructured grid and remove degenerate cells.
+
+    Points are merged with :func:`_merge_points` unless ``tolerance``
+    is ``None``, and take the data of their first point used by a cell.
+    As done by ``vtkCleanPolyData``, the lines and polygons of polydata
+    skip repeated consecutive points.  Cells left with too few distinct
+    points for their dimension and points no longer used by a cell are
+    removed.
+
+    """
+    if _has_polyhedra(dataset):
+        raise ValueError('Cleaning grids with polyhedra is not supported.')
+    offsets, connectivity, celltypes = dataset_cells(dataset)
+    if tolerance is None:
+        labels = np.arange(dataset.n_points)
+    else:
+        labels = _merge_points(dataset.points, tolerance)
+    # like vtkCleanPolyData, merged points are numbered in the order of
+    # their first use and take the data of the first point used
+    used, first_use = np.unique(connectivity, return_index=True)
+    order = np.lexsort((first_use, labels[used]))
+    first = np.ones(order.size, dtype=bool)
+    first[1:] = labels[used][order][1:] != labels[used][order][:-1]
+    first_points = used[order][first][np.argsort(first_use[order][first])]
+    merged = np.empty(labels.max() + 1 if labels.size else 0, pyvista.ID_TYPE)
+    merged[labels[first_points]] = np.arange(first_points.size)
+    connectivity = merged[labels[connectivity]]
+
+    if isinstance(dataset, vtk.vtkPolyData):
+        polygons = ~np.isin(celltypes, [vtk.VTK_VERTEX, vtk.VTK_POLY_VERTEX,
+                                        vtk.VTK_TRIANGLE_STRIP])
+        lines = np.isin(celltypes, [vtk.VTK_LINE, vtk.VTK_POLY_LINE])
+        polygons &= ~lines
+        sizes = np.diff(offsets)
+        cells = np.repeat(np.arange(sizes.size), sizes)
+        repeated = np.zeros(connectivity.size, dtype=bool)
+        repeated[1:] = (connectivity[1:] == connectivity[:-1]) & (cells[1:] == cells[:-1])
+        offsets, connectivity = _remove_entries(offsets, connectivity,
+                                                repeated & (polygons | lines)[cells])
+        # polygons are closed, so their last point must also differ from the first
+        sizes = np.diff(offsets)
+        starts = offsets[:-1][polygons & (sizes > 1)]
+        ends = offsets[1:][polygons & (sizes > 1)] - 1
+        closing = np.zeros(connectivity.size, dtype=bool)
+        closing[ends] = connectivity[ends] == connectivity[starts]
+        offsets, connectivity = _remove_entries(offsets, connectivity, closing)
+
+    # cells collapsed to a lower dimension are degenerate
+    sizes = np.diff(offsets)
+    if sizes.size and (sizes == sizes[0]).all():
+        rows = np.sort(connectivity.reshape(sizes.size, sizes[0]), axis=1)
+        n_distinct = 1 + (rows[:, 1:] != rows[:, :-1]).sum(1)
+    else:
+        cells = np.repeat(np.arange(sizes.size), sizes)
+        order = np.lexsort((connectivity, cells))
+        distinct = np.ones(order.size, dtype=bool)
+        distinct[1:] = ((cells[order][1:] != cells[order][:-1]) |
+                        (connectivity[order][1:] != connectivity[order][:-1]))
+        n_distinct = np.bincount(cells[order][distinct], minlength=sizes.size)
+    keep = n_distinct > _cell_dimensions(celltypes)
+
+    cell_ids, point_ids, offsets, connectivity, celltypes = _gather_cells(
+        dataset, keep, (offsets, connectivity, celltypes))
+    if isinstance(dataset, vtk.vtkPolyData):
+        from_arrays = _polydata_from_arrays
+    else:
+        from_arrays = _unstructured_from_arrays
+    point_ids = first_points[point_ids]
+    mesh = from_arrays(dataset.points[point_ids], offsets, connectivity, celltypes)
+    mesh.GetPointData().ShallowCopy(_take_attributes(dataset.GetPointData(), point_ids))
+    mesh.GetCellData().ShallowCopy(_take_attributes(dataset.GetCellData(), cell_ids))
+    mesh.GetFieldData().DeepCopy(dataset.GetFieldData())
+    return mesh
+
+
+def _has_polyhedra(dataset):
+    """Return whether a dataset contains polyhedral cells."""
+    return (isinstance(dataset, vtk.vtkUnstructuredGrid) and
+            vtk.VTK_POLYHEDRON in dataset.celltypes)
+
+
+def _extract_selection(dataset, node, name):
+    """Extract a selection node of a dataset with ``vtkExtractSelection``."""
+    selection = vtk.vtkSelection()
+    selection.AddNode(node)
+    extract_sel = vtk.vtkExtractSelection()
+    extract_sel.SetInputData(0, dataset)
+    extract_sel.SetInputData(1, selection)
+    _update_alg(extract_sel, name=name)
+    return _get_output(extract_sel)
+
+
+def _split_unstructured(grid, cell_labels, n_groups):
+    """Split an unstructured grid into groups of labelled cells.
+
+    The cells and points of each group keep their order, with points
+    numbered by their first use, as done by ``vtkThreshold``.  All
+    groups are built in a single pass over the connectivity.
+
+    """
+    offsets, connectivity = cell_array_to_numpy(grid.GetCells())
+    celltypes = grid.celltypes
+
+    # sort the cells so that each group is a contiguous range
+    order = np.argsort(cell_labels, kind='stable')
+    bounds = np.searchsorted(cell_labels[order], np.arange(n_groups + 1))
+    sizes = np.diff(offsets)[order]
+    new_offsets = np.zeros(order.size + 1, pyvista.ID_TYPE)
+    np.cumsum(sizes, out=new_offsets[1:])
+    gather = (np.repeat(offsets[:-1][order] - new_offsets[:-1], sizes) +
+              np.arange(new_offsets[-1]))
+    point_ids = connectivity[gather]
+
+    # number the points of each group by their first use
+    entry_labels = np.repeat(cell_labels[order], sizes)
+    keys = entry_labels * grid.n_points + point_ids
+    _, first_use, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    point_order = np.argsort(first_use, kind='stable')
+    rank = np.empty(point_order.size, pyvista.ID_TYPE)
+    rank[point_order] = np.arange(point_order.size)
+    group_points = point_ids[first_use[point_order]]
+    point_bounds = np.searchsorted(entry_labels[first_use[point_order]],
+                                   np.arange(n_groups + 1))
+    new_connectivity = rank[inverse] - point_bounds[entry_labels]
+
+    # gather the points and attributes of all groups once, so that
+    # each group copies a contiguous range
+    gathered_points = pyvista.vtk_points(grid.points[group_points])
+    gathered_point_data = _take_attributes(grid.GetPointData(), group_points)
+    gathered_cell_data = _take_attributes(grid.GetCellData(), order)
+    gathered_celltypes = numpy_to_vtk(celltypes[order], deep=True)
+    # the legacy layout keeps the cells of each group contiguous
+    legacy = np.insert(new_connectivity, new_offsets[:-1], sizes)
+    gathered_cells = numpy_to_idarr(legacy, deep=True)
+
+    groups = []
+    for i in range(n_groups):
+        c0, c1 = bounds[i], bounds[i + 1]
+        p0, p1 = point_bounds[i], point_bounds[i + 1]
+        mesh = pyvista.UnstructuredGrid()
+        points = vtk.vtkPoints()
+        points.SetDataType(gathered_points.GetDataType())
+        points.InsertPoints(0, p1 - p0, p0, gathered_points)
+        mesh.SetPoints(points)
+        vtk_celltypes = vtk.vtkUnsignedCharArray()
+        vtk_celltypes.InsertTuples(0, c1 - c0, c0, gathered_celltypes)
+        legacy_start = new_offsets[c0] + c0
+        vtk_cells = vtk.vtkIdTypeArray()
+        vtk_cells.InsertTuples(0, new_offsets[c1] + c1 - legacy_start, legacy_start,
+                               gathered_cells)
+        cells = CellArray()
+        cells.SetCells(c1 - c0, vtk_cells)
+        if hasattr(cells, 'GetConnectivityArray'):  # available >= VTK9
+            mesh.SetCells(vtk_celltypes, cells)
+        else:
+            locations = new_offsets[c0:c1] + np.arange(c0, c1) - legacy_start
+            mesh.SetCells(vtk_celltypes, numpy_to_idarr(locations), cells)
+        for source, target, start, stop in (
+                (gathered_point_data, mesh.GetPointData(), p0, p1),
+                (gathered_cell_data, mesh.GetCellData(), c0, c1)):
+            target.CopyAllocate(source, stop - start)
+            target.CopyData(source, 0, stop - start, start)
+        mesh.copy_meta_from(grid)
+        groups.append(mesh)
+    return groups
+
+
+def _cut_parallel_planes(dataset, normal, origin, distances, generate_triangles=False,
+                         name=None):
+    """Cut a dataset with many parallel planes in a single pass.
+
+    The planes are the contour values of a single implicit plane
+    function.  Returns the cut and the index of the plane each output
+    point lies on.  ``vtkCutter`` always triangulates the cut of image
+    data at several values.
+
+    """
+    distances = np.asarray(distances, dtype=float)
+    plane = generate_plane(normal, origin)
+    alg = vtk.vtkCutter()
+    alg.SetInputDataObject(dataset)
+    alg.SetCutFunction(plane)
+    alg.SetNumberOfContours(len(distances))
+    for i, value in enumerate(distances):
+        alg.SetValue(i, value)
+    if not generate_triangles:
+        alg.GenerateTrianglesOff()
+    _update_alg(alg, name=name)
+    output = _get_output(alg)
+
+    # recover the plane of each point from its signed distance
+    order = np.argsort(distances)
+    sorted_distances = distances[order]
+    point_distance = (output.points - np.asarray(origin)) @ np.asarray(plane.GetNormal())
+    if len(distances) < 2:
+        labels = np.zeros(output.n_points, int)
+    else:
+        pos = np.clip(np.searchsorted(sorted_distances, point_distance), 1, len(distances) - 1)
+        closer_left = (point_distance - sorted_distances[pos - 1]) < (sorted_distances[pos] - point_distance)
+        labels = order[pos - closer_left]
+    return output, labels
+
+
+def _planes_output(output, labels, names, combine, contour):
+    """Return the slices of ``_cut_parallel_planes`` as requested."""
+    if combine:
+        output.point_arrays.append(labels, 'SliceIndex', active_scalars=False)
+        if contour:
+            return output.contour()
+        return output
+    multi = pyvista.MultiBlock()
+    for i, slc in enumerate(_split_polydata(output, labels, len(names))):
+        multi[i, names[i]] = slc.contour() if contour else slc
+    return multi
+
+
+def _carry_arrays(mesh, source):
+    """Copy the arrays of ``source`` missing in ``mesh`` from its closest points and cells."""
+    for attributes, centers in ((mesh.point_arrays, False), (mesh.cell_arrays, True)):
+        source_attributes = source.cell_arrays if centers else source.point_arrays
+        names = [name for name in source_attributes if name not in attributes]
+        if not names or not getattr(mesh, 'n_cells' if centers else 'n_points'):
+            continue
+        if centers:
+            operator = mesh.cell_centers().interpolation_operator(source.cell_centers(),
+                                                                  n_points=1)
+        else:
+            operator = mesh.interpolation_operator(source, n_points=1)
+        active = source_attributes.GetScalars()
+        for name in names:
+            attributes.append(source_attributes[name][operator.indices], name,
+                              active_vectors=False, active_scalars=False)
+        if active is not None and active.GetName() in names:
+            attributes.SetActiveScalars(active.GetName())
+
+
+def _stream_tracer(dataset, settings):
+    """Return a ``vtkStreamTracer`` integrating ``dataset`` without a source."""
+    alg = vtk.vtkStreamTracer()
+    alg.SetInputDataObject(dataset)
+    # general parameters
+    alg.SetComputeVorticity(settings['compute_vorticity'])
+    alg.SetInitialIntegrationStep(settings['initial_step_length'])
+    alg.SetIntegrationStepUnit(settings['step_unit'])
+    alg.SetMaximumError(settings['max_error'])
+    alg.SetMaximumIntegrationStep(settings['max_step_length'])
+    alg.SetMaximumNumberOfSteps(settings['max_steps'])
+    alg.SetMaximumPropagation(settings['max_time'])
+    alg.SetMinimumIntegrationStep(settings['min_step_length'])
+    alg.SetRotationScale(settings['rotation_scale'])
+    alg.SetStartPosition(settings['start_position'])
+    alg.SetSurfaceStreamlines(settings['surface_streamlines'])
+    alg.SetTerminalSpeed(settings['terminal_speed'])
+    # Model parameters
+    integration_direction = settings['integration_direction']
+    if integration_direction == 'forward':
+        alg.SetIntegrationDirectionToForward()
+    elif integration_direction in ['backward', 'back']:
+        alg.SetIntegrationDirectionToBackward()
+    else:
+        alg.SetIntegrationDirectionToBoth()
+    # set integrator type
+    if settings['integrator_type'] == 2:
+        alg.SetIntegratorTypeToRungeKutta2()
+    elif settings['integrator_type'] == 4:
+        alg.SetIntegratorTypeToRungeKutta4()
+    else:
+        alg.SetIntegratorTypeToRungeKutta45()
+    # set interpolator type
+    if settings['interpolator_type'] in ['c', 'cell']:
+        alg.SetInterpolatorTypeToCellLocator()
+    else:
+        alg.SetInterpolatorTypeToDataSetPointLocator()
+    return alg
+
+
+# tracer of the dataset shared by the chunks run in a worker process
+_STREAM_WORKER = {}
+
+
+def _serialize_dataset(dataset):
+    """Return a dataset as the bytes of a binary legacy VTK file."""
+    writer = vtk.vtkDataSetWriter()
+    writer.SetInputDataObject(dataset)
+    writer.SetFileTypeToBinary()
+    writer.WriteToOutputStringOn()
+    writer.Write()
+    return writer.GetOutputStdString()
+
+
+def _deserialize_dataset(data):
+    """Return the dataset of ``_serialize_dataset``."""
+    reader = vtk.vtkDataSetReader()
+    reader.ReadFromInputStringOn()
+    reader.SetBinaryInputString(data, len(data))
+    reader.ReadAllScalarsOn()
+    reader.ReadAllVectorsOn()
+    reader.Update()
+    return pyvista.wrap(reader.GetOutput())
+
+
+def _init_stream_worker(dataset, settings, process=False):
+    """Build the tracer of a worker process once for all its chunks.
+
+    A worker ``process`` drops the profiles and filter future it may
+    inherit from a forked parent, since its records and progress
+    events would never reach the parent.
+
+    """
+    if process:
+        _PROFILES.clear()
+        FilterFuture._local.future = None
+    if isinstance(dataset, bytes):
+        dataset = _deserialize_dataset(dataset)
+    _STREAM_WORKER['dataset'] = dataset
+    _STREAM_WORKER['tracer'] = _stream_tracer(dataset, settings)
+
+
+def _trace_chunk(seeds):
+    """Integrate a chunk of seeds in a worker process.
+
+    The streamlines are returned as arrays, which unlike VTK objects
+    can be sent back to the parent process.
+
+    """
+    alg = _STREAM_WORKER['tracer']
+    alg.SetSourceData(pyvista.PolyData(seeds))
+    _update_alg(alg, name='streamlines_from_source')
+    output = pyvista.wrap(alg.GetOutput())
+    offsets, connectivity = cell_array_to_numpy(output.GetLines())
+    scalars = output.GetPointData().GetScalars()
+    vectors = output.GetPointData().GetVectors()
+    return {
+        'points': np.array(output.points),
+        'offsets': np.array(offsets),
+        'connectivity': np.array(connectivity),
+        'point_arrays': {name: np.array(output.point_arrays[name])
+                         for name in output.point_arrays},
+        'cell_arrays': {name: np.array(output.cell_arrays[name])
+                        for name in output.cell_arrays},
+        'active_scalars': None if scalars is None else scalars.GetName(),
+        'active_vectors': None if vectors is None else vectors.GetName(),
+    }
+
+
+def _merge_stream_chunks(chunks, starts):
+    """Merge the streamlines of chunks of seeds starting at ``starts``.
+
+    ``vtkStreamTracer`` outputs the forward streamlines of all seeds
+    followed by the backward ones, which is restored so that the merged
+    output matches integrating all seeds at once.
+
+    """
+    # chunks without streamlines have no arrays
+    starts = [start for chunk, start in zip(chunks, starts) if chunk['offsets'].size > 1]
+    chunks = [chunk for chunk in chunks if chunk['offsets'].size > 1]
+    if not chunks:
+        return pyvista.PolyData()
+    n_points = np.cumsum([0] + [chunk['points'].shape[0] for chunk in chunks])
+    n_ids = np.cumsum([0] + [chunk['connectivity'].size for chunk in chunks])
+    offsets = np.concatenate([chunk['offsets'][:-1] + n_ids[i]
+                              for i, chunk in enumerate(chunks)] + [n_ids[-1:]])
+    connectivity = np.concatenate([chunk['connectivity'] + n_points[i]
+                                   for i, chunk in enumerate(chunks)])
+    point_arrays = {name: np.concatenate([chunk['point_arrays'][name] for chunk in chunks])
+                    for name in chunks[0]['point_arrays']}
+    cell_arrays = {}
+    for name in chunks[0]['cell_arrays']:
+        values = [chunk['cell_arrays'][name] for chunk in chunks]
+        if name == 'SeedIds':
+            # seed ids of each chunk start from zero
+            values = [ids + start for ids, start in zip(values, starts)]
+        cell_arrays[name] = np.concatenate(values)
+
+    # order the lines by direction then seed, and their points by line
+    backward = point_arrays['IntegrationTime'][connectivity[offsets[1:] - 1]] < 0
+    order = np.lexsort((cell_arrays['SeedIds'], backward))
+    sizes = np.diff(offsets)[order]
+    new_offsets = np.concatenate(([0], np.cumsum(sizes)))
+    shift = np.repeat(offsets[:-1][order] - new_offsets[:-1], sizes)
+    point_ids = connectivity[shift + np.arange(connectivity.size)]
+    offsets = new_offsets
+
+    output = pyvista.PolyData()
+    output.points = np.concatenate([chunk['points'] for chunk in chunks])[point_ids]
+    output.SetLines(CellArray.from_arrays(offsets, np.arange(point_ids.size)))
+    for name, values in point_arrays.items():
+        output.point_arrays.append(values[point_ids], name, active_vectors=False,
+                                   active_scalars=False)
+    for name, values in cell_arrays.items():
+        output.cell_arrays.append(values[order], name, active_vectors=False,
+                                  active_scalars=False)
+    if chunks[0]['active_vectors'] is not None:
+        output.GetPointData().SetActiveVectors(chunks[0]['active_vectors'])
+    if chunks[0]['active_scalars'] is not None:
+        output.GetPointData().SetActiveScalars(chunks[0]['active_scalars'])
+    return output
+
+
+def _flatten_datasets(datasets):
+    """Return the datasets of a list or nested composite dataset."""
+    flat = []
+    for dataset in datasets:
+        if isinstance(dataset, (vtk.vtkMultiBlockDataSet, list, tuple)):
+            flat.extend(_flatten_datasets(dataset))
+        elif dataset is not None:
+            flat.append(pyvista.wrap(dataset))
+    return flat
+
+
+def merge(datasets, merge_points=False, source_ids=None):
+    """Merge many datasets into a single unstructured grid.
+
+    All datasets are appended by a single ``vtkAppendFilter``, so
+    merging ``n`` parts takes linear time, unlike adding them one at a
+    time with ``+``.
+
+    Parameters
+    ----------
+    datasets : sequence or pyvista.MultiBlock
+        Datasets to merge.  Nested sequences and composite datasets
+        are flattened and empty blocks are skipped.
+
+    merge_points : bool, optional
+        Merge points in exactly the same location.
+
+    source_ids : str, optional
+        Name of the arrays holding the index of the dataset of each
+        cell and point, in the flattened order.  With ``merge_points``,
+        only the cell array is added.  Not added by default.
+
+    Return
+    ------
+    merged : pyvista.UnstructuredGrid
+        Merged datasets.
+
+    Notes
+    -----
+    The arrays of the output are those shared by all datasets, with
+    the same name, type and number of components.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> spheres = [pyvista.Sphere(center=(i, 0, 0)) for i in range(10)]
+    >>> merged = pyvista.merge(spheres, source_ids='part')
+    >>> merged.n_cells
+    16800
+    >>> int(merged.cell_arrays['part'][-1])
+    9
+
+    """
+    datasets = _flatten_datasets([datasets])
+    if not datasets:
+        return pyvista.UnstructuredGrid()
+    alg = vtk.vtkAppendFilter()
+    for dataset in datasets:
+        alg.AddInputData(dataset)
+    alg.SetMergePoints(merge_points)
+    _update_alg(alg, name='merge')
+    output = _get_output(alg)
+
+    if source_ids is not None:
+        indices = np.arange(len(datasets), dtype=pyvista.ID_TYPE)
+        n_cells = [dataset.n_cells for dataset in datasets]
+        output.cell_arrays.append(np.repeat(indices, n_cells), source_ids,
+                                  active_vectors=False, active_scalars=False)
+        if not merge_points:
+            n_points = [dataset.n_points for dataset in datasets]
+            output.point_arrays.append(np.repeat(indices, n_points), source_ids,
+                                       active_vectors=False, active_scalars=False)
+    return output
+
+
 @abstract_class
 class DataSetFilters:
     """A set of common filters that can be applied to any vtkDataSet."""
 
-    def _clip_with_function(dataset, function, invert=True, value=0.0):
+    def _clip_with_function(dataset, function, invert=True, value=0.0, name=None):
         """Clip using an implicit function (internal helper)."""
         if isinstance(dataset, vtk.vtkPolyData):
             alg = vtk.vtkClipPolyData()
@@ -78,7 +1139,7 @@ class DataSetFilters:
         alg.SetValue(value)
         alg.SetClipFunction(function) # the implicit function
         alg.SetInsideOut(invert) # invert the clip if needed
-        alg.Update() # Perform the Cut
+        _update_alg(alg, name=name) # Perform the Cut
         return _get_output(alg)
 
     def clip(dataset, normal='x', origin=None, invert=True, value=0.0, inplace=False):
@@ -140,7 +1201,8 @@ class DataSetFilters:
         function = generate_plane(normal, origin)
         # run the clip
         result = DataSetFilters._clip_with_function(dataset, function,
-                                                    invert=invert, value=value)
+                                                    invert=invert, value=value,
+                                                    name='clip')
         if inplace:
             dataset.overwrite(result)
         else:
@@ -218,7 +1280,7 @@ class DataSetFilters:
             # invert the clip if needed
             port = 1
             alg.GenerateClippedOutputOn()
-        alg.Update()
+        _update_alg(alg, name='clip_box')
         return _get_output(alg, oport=port)
 
     def compute_implicit_distance(dataset, surface, inplace=False):
@@ -327,7 +1389,7 @@ class DataSetFilters:
         # SetInputArrayToProcess(idx, port, connection, field, name)
         alg.SetInputArrayToProcess(0, 0, 0, field.value, scalars)
         alg.SetInsideOut(invert)  # invert the clip if needed
-        alg.Update()  # Perform the Cut
+        _update_alg(alg, name='clip_scalar')  # Perform the Cut
         result = _get_output(alg)
 
         if inplace:
@@ -374,11 +1436,12 @@ class DataSetFilters:
             dataset['implicit_distance'] = pyvista.convert_array(dists)
         # run the clip
         result = DataSetFilters._clip_with_function(dataset, function,
-                                                    invert=invert, value=value)
+                                                    invert=invert, value=value,
+                                                    name='clip_surface')
         return result
 
     def slice(dataset, normal='x', origin=None, generate_triangles=False,
-              contour=False):
+              contour=False, crinkle=False, fast=True):
         """Slice a dataset by a plane at the specified origin and normal vector orientation.
 
         If no origin is specified, the center of the input dataset will be used.
@@ -400,6 +1463,31 @@ class DataSetFilters:
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
+        crinkle : bool, optional
+            Extract the whole cells intersected by the plane as a
+            :class:`pyvista.UnstructuredGrid` instead of cutting them.
+
+        fast : bool, optional
+            Use the multithreaded ``vtkFlyingEdgesPlaneCutter`` for
+            volumes, and ``vtk3DLinearGridCrinkleExtractor`` for grids of
+            linear 3D cells when all their arrays are floating point.
+            Plane cuts of volumes only qualify when
+            ``generate_triangles=True`` and there is no cell data, and
+            their integer point arrays are interpolated as floats.
+            Crinkle slices may then also include cells that only touch
+            the plane.  Set to ``False`` to always use the generic
+            ``vtkCutter`` or ``vtkExtractGeometry`` filters.
+
+        Examples
+        --------
+        Slice a volume with the flying edges plane cutter.
+
+        >>> import pyvista
+        >>> import numpy as np
+        >>> grid = pyvista.UniformGrid((50, 50, 50))
+        >>> grid['values'] = np.random.random(grid.n_points)
+        >>> slc = grid.slice(normal=(1, 1, 0), generate_triangles=True)
+
         """
         if isinstance(normal, str):
             normal = NORMALS[normal.lower()]
@@ -409,19 +1497,20 @@ class DataSetFilters:
         # create the plane for clipping
         plane = generate_plane(normal, origin)
         # create slice
-        alg = vtk.vtkCutter() # Construct the cutter object
+        if crinkle:
+            alg = _crinkle_extractor(dataset, plane, fast=fast)
+        else:
+            alg = _plane_cutter(dataset, plane, generate_triangles, fast=fast)
         alg.SetInputDataObject(dataset) # Use the grid as the data we desire to cut
-        alg.SetCutFunction(plane) # the cutter to use the plane we made
-        if not generate_triangles:
-            alg.GenerateTrianglesOff()
-        alg.Update() # Perform the Cut
+        _update_alg(alg, name='slice') # Perform the Cut
         output = _get_output(alg)
         if contour:
             return output.contour()
         return output
 
     def slice_orthogonal(dataset, x=None, y=None, z=None,
-                         generate_triangles=False, contour=False):
+                         generate_triangles=False, contour=False, combine=False,
+                         fast=True):
         """Create three orthogonal slices through the dataset on the three cartesian planes.
 
         Yields a MutliBlock dataset of the three slices.
@@ -444,6 +1533,15 @@ class DataSetFilters:
         contour : bool, optional
             If True, apply a ``contour`` filter after slicing
 
+        combine : bool, optional
+            Return a single ``pyvista.PolyData`` with a ``'SliceIndex'``
+            point array instead of a ``pyvista.MultiBlock``.
+
+        fast : bool, optional
+            Cut with the same specialized algorithms as
+            :func:`DataSetFilters.slice`.  Set to ``False`` to always use
+            the generic ``vtkCutter``.
+
         """
         # Create the three slices
         if x is None:
@@ -457,18 +1555,41 @@ class DataSetFilters:
             for i in range(dataset.n_blocks):
                 output[i] = dataset[i].slice_orthogonal(x=x, y=y, z=z,
                     generate_triangles=generate_triangles,
-                    contour=contour)
+                    contour=contour, combine=combine, fast=fast)
             return output
-        output[0, 'YZ'] = dataset.slice(normal='x', origin=[x,y,z], generate_triangles=generate_triangles)
-        output[1, 'XZ'] = dataset.slice(normal='y', origin=[x,y,z], generate_triangles=generate_triangles)
-        output[2, 'XY'] = dataset.slice(normal='z', origin=[x,y,z], generate_triangles=generate_triangles)
-        return output
+        # The three planes are not parallel, so each is a separate cut
+        # through the plane cutter of ``slice``
+        origin = [x, y, z]
+        names = ['YZ', 'XZ', 'XY']
+        slices = []
+        for normal in 'xyz':
+            alg = _plane_cutter(dataset, generate_plane(NORMALS[normal], origin),
+                                generate_triangles, fast=fast)
+            alg.SetInputDataObject(dataset)
+            _update_alg(alg, name='slice_orthogonal')
+            slices.append(_get_output(alg))
+        if not combine:
+            for i, slc in enumerate(slices):
+                output[i, names[i]] = slc.contour() if contour else slc
+            return output
+        alg = vtk.vtkAppendPolyData()
+        for slc in slices:
+            alg.AddInputData(slc)
+        _update_alg(alg, name='slice_orthogonal')
+        merged = _get_output(alg)
+        labels = np.repeat(np.arange(3), [slc.n_points for slc in slices])
+        return _planes_output(merged, labels, names, True, contour)
 
     def slice_along_axis(dataset, n=5, axis='x', tolerance=None,
                          generate_triangles=False, contour=False,
-                         bounds=None, center=None):
+                         bounds=None, center=None, combine=False):
         """Create many slices of the input dataset along a specified axis.
 
+        All slices are computed in a single pass over the dataset by
+        cutting with one implicit plane function at several values.
+        The slices of image data are always triangulated, since
+        ``vtkCutter`` triangulates its cut at several values.
+
         Parameters
         ----------
         n : int
@@ -487,7 +1608,19 @@ class DataSetFilters:
             triangles otherwise, the output will be the intersection polygons.
 
         contour : bool, optional
-            If True, apply a ``contour`` filter after slicing
+            If True, apply a ``contour`` filter after slicing.  With
+            ``combine=True`` the contour values span all slices.
+
+        combine : bool, optional
+            Return a single ``pyvista.PolyData`` with a ``'SliceIndex'``
+            point array instead of a ``pyvista.MultiBlock`` of slices.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> mesh = examples.load_uniform()
+        >>> slices = mesh.slice_along_axis(n=200, axis='z', combine=True)
 
         """
         axes = {'x':0, 'y':1, 'z':2}
@@ -514,15 +1647,13 @@ class DataSetFilters:
             for i in range(dataset.n_blocks):
                 output[i] = dataset[i].slice_along_axis(n=n, axis=axis,
                     tolerance=tolerance, generate_triangles=generate_triangles,
-                    contour=contour, bounds=bounds, center=center)
+                    contour=contour, bounds=bounds, center=center, combine=combine)
             return output
-        for i in range(n):
-            center[ax] = rng[i]
-            slc = DataSetFilters.slice(dataset, normal=axis, origin=center,
-                                       generate_triangles=generate_triangles,
-                                       contour=contour)
-            output[i, f'slice{i}'] = slc
-        return output
+        slices, labels = _cut_parallel_planes(dataset, NORMALS[axis], center,
+                                              rng - center[ax], generate_triangles,
+                                              name='slice_along_axis')
+        names = [f'slice{i}' for i in range(n)]
+        return _planes_output(slices, labels, names, combine, contour)
 
     def slice_along_line(dataset, line, generate_triangles=False,
                          contour=False):
@@ -558,7 +1689,7 @@ class DataSetFilters:
         alg.SetCutFunction(polyplane) # the cutter to use the poly planes
         if not generate_triangles:
             alg.GenerateTrianglesOff()
-        alg.Update() # Perform the Cut
+        _update_alg(alg, name='slice_along_line') # Perform the Cut
         output = _get_output(alg)
         if contour:
             return output.contour()
@@ -634,7 +1765,7 @@ class DataSetFilters:
             appender = vtk.vtkAppendFilter()
             appender.AddInputData(t1)
             appender.AddInputData(t2)
-            appender.Update()
+            _update_alg(appender, name='threshold')
             return _get_output(appender)
 
         # Run a standard threshold algorithm
@@ -661,7 +1792,7 @@ class DataSetFilters:
             else:
                 alg.ThresholdByUpper(value)
         # Run the threshold
-        alg.Update()
+        _update_alg(alg, name='threshold')
         return _get_output(alg)
 
     def threshold_percent(dataset, percent=0.50, scalars=None, invert=False,
@@ -728,6 +1859,158 @@ class DataSetFilters:
                                         invert=invert, continuous=continuous,
                                         preference=preference)
 
+    def threshold_multi(dataset, ranges, scalars=None, preference='cell',
+                        all_scalars=True, combine=False):
+        """Extract the cells of many ranges or values of a scalar array at once.
+
+        All cells are labelled with numpy and extracted in a single pass,
+        rather than running :func:`DataSetFilters.threshold` once per
+        range.  A cell belongs to the first range containing it, so the
+        output parts do not overlap.  Values, and ranges that do not
+        overlap, are labelled with a single search of their sorted
+        bounds.  Overlapping ranges are labelled one range at a time.
+
+        Parameters
+        ----------
+        ranges : sequence
+            Either ``(min, max)`` pairs of inclusive ranges, or single
+            values matched exactly, such as material ids.
+
+        scalars : str, optional
+            Name of scalars to threshold on. Defaults to currently active scalars.
+            The first component of vectors is used.
+
+        preference : str, optional
+            When scalars is specified, this is the preferred array type to
+            search for in the dataset.  Must be either ``'point'`` or ``'cell'``
+
+        all_scalars : bool, optional
+            If using scalars from point data, all scalars for all
+            points in a cell must satisfy the threshold when this
+            value is ``True``.  When ``False``, any point of the cell
+            with a scalar value satisfying the threshold criterion
+            will extract the cell.
+
+        combine : bool, optional
+            Return a single grid of the cells in any range, with the index
+            of their range in the ``'RangeId'`` cell array, instead of a
+            :class:`pyvista.MultiBlock` with one grid per range.
+
+        Return
+        ------
+        output : pyvista.MultiBlock or pyvista.UnstructuredGrid
+            One grid per range, named after the range, or a single grid
+            when ``combine=True``.
+
+        Examples
+        --------
+        Extract three materials of a grid
+
+        >>> import numpy as np
+        >>> import pyvista
+        >>> grid = pyvista.UniformGrid((5, 5, 5))
+        >>> grid.cell_arrays['material'] = np.arange(grid.n_cells) % 4
+        >>> parts = grid.threshold_multi([0, 1, 3], scalars='material')
+        >>> [part.n_cells for part in parts]
+        [16, 16, 16]
+
+        """
+        if scalars is None:
+            field, scalars = dataset.active_scalars_info
+        arr, field = get_array(dataset, scalars, preference=preference, info=True)
+        if arr is None:
+            raise ValueError('No arrays present to threshold.')
+        arr = np.asarray(arr)
+        if arr.ndim > 1:
+            arr = arr[:, 0]
+        ranges = np.asarray(ranges)
+        if ranges.ndim == 2 and ranges.shape[1] == 2:
+            names = [f'{low}-{high}' for low, high in ranges]
+        elif ranges.ndim == 1:
+            names = [str(value) for value in ranges]
+        else:
+            raise ValueError('`ranges` must be a sequence of values or of (min, max) pairs.')
+        n_ranges = len(names)
+        if not n_ranges:
+            raise ValueError('`ranges` must contain at least one range or value.')
+        # ranges that do not overlap are searched by their sorted bounds
+        disjoint = ranges.ndim == 2
+        if disjoint:
+            range_order = np.argsort(ranges[:, 0], kind='stable')
+            lows, highs = ranges[range_order].T
+            disjoint = np.all(lows[1:] > highs[:-1])
+
+        def label(values):
+            """Return the first range containing each value, or ``n_ranges``."""
+            labels = np.full(values.shape, n_ranges, dtype=pyvista.ID_TYPE)
+            if ranges.ndim == 1:
+                # match the values against the sorted values in one pass
+                order = np.argsort(ranges, kind='stable')
+                keys, first = np.unique(ranges[order], return_index=True)
+                pos = np.searchsorted(keys, values).clip(max=keys.size - 1)
+                match = keys[pos] == values
+                labels[match] = order[first[pos[match]]]
+            elif disjoint:
+                # the only range that may contain a value starts right below it
+                pos = np.searchsorted(lows, values, side='right') - 1
+                match = (pos >= 0) & (values <= highs[pos.clip(min=0)])
+                labels[match] = range_order[pos[match]]
+            else:
+                for i in range(n_ranges - 1, -1, -1):
+                    low, high = ranges[i]
+                    labels[(values >= low) & (values <= high)] = i
+            return labels
+
+        if field == FieldAssociation.POINT:
+            offsets, connectivity, _ = dataset_cells(dataset)
+            if ranges.ndim == 1 or disjoint:
+                # each point is in a single range
+                point_labels = label(arr)[connectivity]
+                low = _reduce_cells(offsets, point_labels, np.minimum, n_ranges)
+                if all_scalars:
+                    high = _reduce_cells(offsets, point_labels, np.maximum, -1)
+                    cell_labels = np.where(low == high, low, n_ranges)
+                else:
+                    cell_labels = low
+            else:
+                cell_labels = np.full(dataset.n_cells, n_ranges, dtype=pyvista.ID_TYPE)
+                values = arr[connectivity]
+                for i in range(n_ranges - 1, -1, -1):
+                    low, high = ranges[i]
+                    inside = (values >= low) & (values <= high)
+                    if all_scalars:
+                        keep = _reduce_cells(offsets, inside, np.logical_and, False)
+                    else:
+                        keep = _reduce_cells(offsets, inside, np.logical_or, False)
+                    cell_labels[keep] = i
+        else:
+            cell_labels = label(arr)
+
+        if isinstance(dataset, vtk.vtkUnstructuredGrid):
+            grid = dataset.copy(deep=False)
+        else:
+            grid = dataset.cast_to_unstructured_grid()
+        parts = pyvista.MultiBlock()
+        if vtk.VTK_POLYHEDRON in grid.celltypes:
+            # the faces of polyhedra are not split
+            label_name = 'RangeId' if combine else 'vtkRangeId'
+            grid.cell_arrays.append(cell_labels, label_name, active_scalars=False,
+                                    active_vectors=False)
+            if combine:
+                return grid.threshold([-0.5, n_ranges - 0.5], scalars=label_name)
+            for i, name in enumerate(names):
+                part = grid.threshold([i - 0.5, i + 0.5], scalars=label_name)
+                part.cell_arrays.remove(label_name)
+                parts[-1, name] = part
+            return parts
+        if combine:
+            grid.cell_arrays.append(cell_labels, 'RangeId', active_scalars=False,
+                                    active_vectors=False)
+            return _split_unstructured(grid, (cell_labels == n_ranges).astype(int), 1)[0]
+        for name, part in zip(names, _split_unstructured(grid, cell_labels, n_ranges)):
+            parts[-1, name] = part
+        return parts
+
     def outline(dataset, generate_faces=False):
         """Produce an outline of the full extent for the input dataset.
 
@@ -740,7 +2023,7 @@ class DataSetFilters:
         alg = vtk.vtkOutlineFilter()
         alg.SetInputDataObject(dataset)
         alg.SetGenerateFaces(generate_faces)
-        alg.Update()
+        _update_alg(alg, name='outline')
         return wrap(alg.GetOutputDataObject(0))
 
     def outline_corners(dataset, factor=0.2):
@@ -756,7 +2039,7 @@ class DataSetFilters:
         alg = vtk.vtkOutlineCornerFilter()
         alg.SetInputDataObject(dataset)
         alg.SetCornerFactor(factor)
-        alg.Update()
+        _update_alg(alg, name='outline_corners')
         return wrap(alg.GetOutputDataObject(0))
 
     def extract_geometry(dataset):
@@ -768,7 +2051,7 @@ class DataSetFilters:
         """
         alg = vtk.vtkGeometryFilter()
         alg.SetInputDataObject(dataset)
-        alg.Update()
+        _update_alg(alg, name='extract_geometry')
         return _get_output(alg)
 
     def extract_all_edges(dataset, progress_bar=False):
@@ -784,7 +2067,7 @@ class DataSetFilters:
         """
         alg = vtk.vtkExtractEdges()
         alg.SetInputDataObject(dataset)
-        _update_alg(alg, progress_bar, 'Extracting All Edges')
+        _update_alg(alg, progress_bar, 'Extracting All Edges', name='extract_all_edges')
         return _get_output(alg)
 
     @wraps(extract_all_edges)
@@ -867,7 +2150,7 @@ class DataSetFilters:
         alg.SetScalarRange(scalar_range)
         alg.SetLowPoint(low_point)
         alg.SetHighPoint(high_point)
-        _update_alg(alg, progress_bar, 'Computing Elevation')
+        _update_alg(alg, progress_bar, 'Computing Elevation', name='elevation')
         # Decide on updating active scalars array
         name = 'Elevation' # Note that this is added to the PointData
         if not set_active:
@@ -876,7 +2159,7 @@ class DataSetFilters:
 
     def contour(dataset, isosurfaces=10, scalars=None, compute_normals=False,
                 compute_gradients=False, compute_scalars=True, rng=None,
-                preference='point', method='contour', progress_bar=False):
+                preference='point', method=None, progress_bar=False):
         """Contour an input dataset by an array.
 
         ``isosurfaces`` can be an integer specifying the number of isosurfaces in
@@ -911,27 +2194,25 @@ class DataSetFilters:
         method : str, optional
             Specify to choose which vtk filter is used to create the contour.
             Must be one of ``'contour'``, ``'marching_cubes'`` and
-            ``'flying_edges'``. Defaults to ``'contour'``.
+            ``'flying_edges'``.  By default, the multithreaded
+            ``vtkFlyingEdges3D`` or ``vtkContour3DLinearGrid`` filters
+            are used for volumes and grids of linear 3D cells without
+            cell data, the latter only with floating point arrays, and
+            ``vtkContourFilter`` otherwise.  Use
+            ``'contour'`` to force the generic filter.
 
         progress_bar : bool, optional
             Display a progress bar to indicate progress.
 
         """
-        if method is None or method == 'contour':
-            alg = vtk.vtkContourFilter()
-        elif method == 'marching_cubes':
-            alg = vtk.vtkMarchingCubes()
-        elif method == 'flying_edges':
-            alg = vtk.vtkFlyingEdges3D()
-        else:
+        filters = {'contour': vtk.vtkContourFilter,
+                   'marching_cubes': vtk.vtkMarchingCubes,
+                   'flying_edges': vtk.vtkFlyingEdges3D}
+        if method is not None and method not in filters:
             raise ValueError(f"Method '{method}' is not supported")
         # Make sure the input has scalars to contour on
         if dataset.n_arrays < 1:
             raise ValueError('Input dataset for the contour filter must have scalar data.')
-        alg.SetInputDataObject(dataset)
-        alg.SetComputeNormals(compute_normals)
-        alg.SetComputeGradients(compute_gradients)
-        alg.SetComputeScalars(compute_scalars)
         # set the array to contour on
         if scalars is None:
             field, scalars = dataset.active_scalars_info
@@ -940,21 +2221,39 @@ class DataSetFilters:
         # NOTE: only point data is allowed? well cells works but seems buggy?
         if field != FieldAssociation.POINT:
             raise TypeError(f'Contour filter only works on Point data. Array ({scalars}) is in the Cell data.')
-        alg.SetInputArrayToProcess(0, 0, 0, field.value, scalars) # args: (idx, port, connection, field, name)
         # set the isosurfaces
         if isinstance(isosurfaces, int):
             # generate values
             if rng is None:
                 rng = dataset.get_data_range(scalars)
-            alg.GenerateValues(isosurfaces, rng)
-        elif isinstance(isosurfaces, (np.ndarray, collections.abc.Sequence)):
-            alg.SetNumberOfContours(len(isosurfaces))
-            for i, val in enumerate(isosurfaces):
-                alg.SetValue(i, val)
-        else:
+            values = vtk.vtkContourValues()
+            values.GenerateValues(isosurfaces, rng)
+            isosurfaces = [values.GetValue(i) for i in range(isosurfaces)]
+        elif not isinstance(isosurfaces, (np.ndarray, collections.abc.Sequence)):
             raise TypeError('isosurfaces not understood.')
-        _update_alg(alg, progress_bar, 'Computing Contour')
-        return _get_output(alg)
+
+        alg = None
+        if method is None:
+            alg = _fast_contour_filter(dataset, len(isosurfaces), compute_gradients,
+                                       compute_scalars)
+        if alg is None:
+            alg = filters[method or 'contour']()
+        if not isinstance(alg, vtk.vtkContour3DLinearGrid):
+            alg.SetComputeGradients(compute_gradients)
+            alg.SetComputeScalars(compute_scalars)
+        alg.SetInputDataObject(dataset)
+        alg.SetComputeNormals(compute_normals)
+        alg.SetInputArrayToProcess(0, 0, 0, field.value, scalars) # args: (idx, port, connection, field, name)
+        alg.SetNumberOfContours(len(isosurfaces))
+        for i, val in enumerate(isosurfaces):
+            alg.SetValue(i, val)
+        _update_alg(alg, progress_bar, 'Computing Contour', name='contour')
+        output = _get_output(alg)
+        if isinstance(alg, vtk.vtkContour3DLinearGrid) and compute_scalars and len(isosurfaces):
+            # the linear grid filter does not pass the contoured scalars
+            dtype = dataset.point_arrays[scalars].dtype
+            output.point_arrays.append(np.full(output.n_points, isosurfaces[0], dtype), scalars)
+        return output
 
     def texture_map_to_plane(dataset, origin=None, point_u=None, point_v=None,
                              inplace=False, name='Texture Coordinates',
@@ -1006,7 +2305,7 @@ class DataSetFilters:
             alg.SetPoint1(point_u) # BOTTOM RIGHT CORNER
             alg.SetPoint2(point_v) # TOP LEFT CORNER
         alg.SetInputDataObject(dataset)
-        alg.Update()
+        _update_alg(alg, name='texture_map_to_plane')
         output = _get_output(alg)
         if not inplace:
             return output
@@ -1067,7 +2366,7 @@ class DataSetFilters:
             alg.SetCenter(center)
         alg.SetPreventSeam(prevent_seam)
         alg.SetInputDataObject(dataset)
-        alg.Update()
+        _update_alg(alg, name='texture_map_to_sphere')
         output = _get_output(alg)
         if not inplace:
             return output
@@ -1081,7 +2380,7 @@ class DataSetFilters:
         return # No return type because it is inplace
 
     def compute_cell_sizes(dataset, length=True, area=True, volume=True,
-                           progress_bar=False):
+                           progress_bar=False, engine='vtk'):
         """Compute sizes for 1D (length), 2D (area) and 3D (volume) cells.
 
         Parameters
@@ -1096,17 +2395,35 @@ class DataSetFilters:
             Specify whether or not to compute the volume of 3D cells.
 
         progress_bar : bool, optional
-            Display a progress bar to indicate progress.
+            Display a progress bar to indicate progress.  Only used by
+            the ``'vtk'`` engine.
+
+        engine : str, optional
+            ``'vtk'`` to use ``vtkCellSizeFilter`` or ``'numpy'`` to use
+            :func:`pyvista.utilities.measures.cell_sizes`.  The
+            ``'numpy'`` engine is much faster for hexahedra and polygons,
+            which ``vtkCellSizeFilter`` triangulates, but slower for
+            simplices.  Composite datasets always use ``'vtk'``.
 
         """
-        alg = vtk.vtkCellSizeFilter()
-        alg.SetInputDataObject(dataset)
-        alg.SetComputeArea(area)
-        alg.SetComputeVolume(volume)
-        alg.SetComputeLength(length)
-        alg.SetComputeVertexCount(False)
-        _update_alg(alg, progress_bar, 'Computing Cell Sizes')
-        return _get_output(alg)
+        if engine not in ('vtk', 'numpy'):
+            raise ValueError(f"Engine '{engine}' is not supported. Use 'vtk' or 'numpy'.")
+        if engine == 'vtk' or isinstance(dataset, vtk.vtkCompositeDataSet):
+            alg = vtk.vtkCellSizeFilter()
+            alg.SetInputDataObject(dataset)
+            alg.SetComputeArea(area)
+            alg.SetComputeVolume(volume)
+            alg.SetComputeLength(length)
+            alg.SetComputeVertexCount(False)
+            _update_alg(alg, progress_bar, 'Computing Cell Sizes', name='compute_cell_sizes')
+            return _get_output(alg)
+
+        sizes = cell_sizes(dataset, length=length, area=area, volume=volume)
+        output = dataset.copy(deep=False)
+        for name, array in sizes.items():
+            output.cell_arrays.append(array, name, active_vectors=False,
+                                      active_scalars=False)
+        return output
 
     def cell_centers(dataset, vertex=True):
         """Generate points at the center of the cells in this dataset.
@@ -1122,7 +2439,7 @@ class DataSetFilters:
         alg = vtk.vtkCellCenters()
         alg.SetInputDataObject(dataset)
         alg.SetVertexCells(vertex)
-        alg.Update()
+        _update_alg(alg, name='cell_centers')
         output = _get_output(alg)
         return output
 
@@ -1179,7 +2496,7 @@ class DataSetFilters:
         # Make glyphing geometry
         if geom is None:
             arrow = vtk.vtkArrowSource()
-            arrow.Update()
+            _update_alg(arrow, name='glyph')
             geom = arrow.GetOutput()
         # Run the algorithm
         alg = vtk.vtkGlyph3D()
@@ -1205,7 +2522,7 @@ class DataSetFilters:
         alg.SetVectorModeToUseVector()
         alg.SetScaleFactor(factor)
         alg.SetClamping(clamping)
-        _update_alg(alg, progress_bar, 'Computing Glyphs')
+        _update_alg(alg, progress_bar, 'Computing Glyphs', name='glyph')
         return _get_output(alg)
 
     def connectivity(dataset, largest=False):
@@ -1231,7 +2548,7 @@ class DataSetFilters:
         else:
             alg.SetExtractionModeToAllRegions()
         alg.SetColorRegions(True)
-        alg.Update()
+        _update_alg(alg, name='connectivity')
         return _get_output(alg)
 
     def extract_largest(dataset, inplace=False):
@@ -1259,10 +2576,13 @@ class DataSetFilters:
         else:
             return mesh
 
-    def split_bodies(dataset, label=False):
+    def split_bodies(dataset, label=False, min_n_cells=None, max_n_cells=None):
         """Find, label, and split connected bodies/volumes.
 
         This splits different connected bodies into blocks in a MultiBlock dataset.
+        Bodies are cells connected through shared points, as found by
+        the ``connectivity`` filter.  They are labelled with a single
+        union-find pass over the cell adjacency and all split together.
 
         Parameters
         ----------
@@ -1270,22 +2590,65 @@ class DataSetFilters:
             A flag on whether to keep the ID arrays given by the
             ``connectivity`` filter.
 
+        min_n_cells : int, optional
+            Discard bodies with fewer cells.
+
+        max_n_cells : int, optional
+            Discard bodies with more cells.
+
+        Return
+        ------
+        bodies : pyvista.MultiBlock
+            One unstructured grid per body, in the order of their
+            first cell.  ``RegionId`` numbers the bodies before
+            discarding any.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere() + pyvista.Cube(center=(2, 0, 0))
+        >>> bodies = mesh.split_bodies(min_n_cells=10)
+        >>> bodies.n_blocks
+        1
+
         """
-        # Get the connectivity and label different bodies
-        labeled = DataSetFilters.connectivity(dataset)
-        classifier = labeled.cell_arrays['RegionId']
-        bodies = pyvista.MultiBlock()
-        for vid in np.unique(classifier):
-            # Now extract it:
-            b = labeled.threshold([vid-0.5, vid+0.5], scalars='RegionId')
-            if not label:
-                # strange behavior:
-                # must use this method rather than deleting from the point_arrays
-                # or else object is collected.
-                b.cell_arrays.remove('RegionId')
-                b.point_arrays.remove('RegionId')
-            bodies.append(b)
+        labels, n_bodies = _label_connected_cells(dataset)
+        sizes = np.bincount(labels, minlength=n_bodies)
+        keep = np.ones(n_bodies, dtype=bool)
+        if min_n_cells is not None:
+            keep &= sizes >= min_n_cells
+        if max_n_cells is not None:
+            keep &= sizes <= max_n_cells
+
+        if isinstance(dataset, vtk.vtkUnstructuredGrid):
+            grid = dataset.copy(deep=False)
+        else:
+            grid = dataset.cast_to_unstructured_grid()
+        if label:
+            point_labels = np.zeros(grid.n_points, pyvista.ID_TYPE)
+            point_labels[dataset.cell_to_points.indices] = np.repeat(
+                labels, dataset.cell_to_points.counts)
+            grid.point_arrays.append(point_labels, 'RegionId',
+                                     active_scalars=False, active_vectors=False)
+            grid.cell_arrays.append(labels.astype(pyvista.ID_TYPE), 'RegionId',
+                                    active_scalars=False, active_vectors=False)
 
+        bodies = pyvista.MultiBlock()
+        if vtk.VTK_POLYHEDRON in grid.celltypes:
+            # the faces of polyhedra are not split
+            grid.cell_arrays.append(labels, 'vtkRegionId', active_scalars=False,
+                                    active_vectors=False)
+            for vid in np.nonzero(keep)[0]:
+                body = grid.threshold([vid - 0.5, vid + 0.5], scalars='vtkRegionId')
+                body.cell_arrays.remove('vtkRegionId')
+                bodies.append(body)
+            return bodies
+
+        # discarded bodies are given the label after the kept ones
+        new_labels = np.full(n_bodies, keep.sum())
+        new_labels[keep] = np.arange(keep.sum())
+        for body in _split_unstructured(grid, new_labels[labels], keep.sum()):
+            bodies.append(body)
         return bodies
 
     def warp_by_scalar(dataset, scalars=None, factor=1.0, normal=None,
@@ -1327,7 +2690,7 @@ class DataSetFilters:
         if normal is not None:
             alg.SetNormal(normal)
             alg.SetUseNormal(True)
-        alg.Update()
+        _update_alg(alg, name='warp_by_scalar')
         output = _get_output(alg)
         if inplace:
             if isinstance(dataset, (vtk.vtkImageData, vtk.vtkRectilinearGrid)):
@@ -1379,7 +2742,7 @@ class DataSetFilters:
         alg.SetInputDataObject(dataset)
         alg.SetInputArrayToProcess(0, 0, 0, field.value, vectors)
         alg.SetScaleFactor(factor)
-        alg.Update()
+        _update_alg(alg, name='warp_by_vector')
         warped_mesh = _get_output(alg)
         if inplace:
             dataset.overwrite(warped_mesh)
@@ -1396,7 +2759,9 @@ class DataSetFilters:
         all cells using a particular point. Optionally, the input cell data can
         be passed through to the output as well.
 
-        See also: :func:`pyvista.DataSetFilters.point_data_to_cell_data`
+        See also: :func:`pyvista.DataSetFilters.point_data_to_cell_data`,
+        and :func:`pyvista.Common.cell_array_to_point_array` to convert
+        single arrays without copying the mesh.
 
         Parameters
         ----------
@@ -1407,7 +2772,7 @@ class DataSetFilters:
         alg = vtk.vtkCellDataToPointData()
         alg.SetInputDataObject(dataset)
         alg.SetPassCellData(pass_cell_data)
-        alg.Update()
+        _update_alg(alg, name='cell_data_to_point_data')
         active_scalars = None
         if not isinstance(dataset, pyvista.MultiBlock):
             active_scalars = dataset.active_scalars_name
@@ -1430,7 +2795,9 @@ class DataSetFilters:
         Point data are specified per node and cell data specified within cells.
         Optionally, the input point data can be passed through to the output.
 
-        See also: :func:`pyvista.DataSetFilters.cell_data_to_point_data`
+        See also: :func:`pyvista.DataSetFilters.cell_data_to_point_data`,
+        and :func:`pyvista.Common.point_array_to_cell_array` to convert
+        single arrays without copying the mesh.
 
         Parameters
         ----------
@@ -1441,7 +2808,7 @@ class DataSetFilters:
         alg = vtk.vtkPointDataToCellData()
         alg.SetInputDataObject(dataset)
         alg.SetPassPointData(pass_point_data)
-        alg.Update()
+        _update_alg(alg, name='point_data_to_cell_data')
         active_scalars = None
         if not isinstance(dataset, pyvista.MultiBlock):
             active_scalars = dataset.active_scalars_name
@@ -1476,7 +2843,7 @@ class DataSetFilters:
         """
         alg = vtk.vtkDataSetTriangleFilter()
         alg.SetInputData(dataset)
-        alg.Update()
+        _update_alg(alg, name='triangulate')
 
         mesh = _get_output(alg)
         if inplace:
@@ -1514,7 +2881,7 @@ class DataSetFilters:
         alg.SetAlpha(alpha)
         alg.SetTolerance(tol)
         alg.SetOffset(offset)
-        _update_alg(alg, progress_bar, 'Computing 3D Triangulation')
+        _update_alg(alg, progress_bar, 'Computing 3D Triangulation', name='delaunay_3d')
         return _get_output(alg)
 
     def select_enclosed_points(dataset, surface, tolerance=0.001,
@@ -1570,7 +2937,7 @@ class DataSetFilters:
         alg.SetSurfaceData(surface)
         alg.SetTolerance(tolerance)
         alg.SetInsideOut(inside_out)
-        alg.Update()
+        _update_alg(alg, name='select_enclosed_points')
         result = _get_output(alg)
         out = dataset.copy()
         bools = result['SelectedPoints'].astype(np.uint8)
@@ -1634,7 +3001,7 @@ class DataSetFilters:
         if tolerance is not None:
             alg.SetComputeTolerance(False)
             alg.SetTolerance(tolerance)
-        alg.Update() # Perform the resampling
+        _update_alg(alg, name='probe') # Perform the resampling
         return _get_output(alg)
 
     def sample(dataset, target, tolerance=None, pass_cell_arrays=True,
@@ -1679,7 +3046,7 @@ class DataSetFilters:
         if tolerance is not None:
             alg.SetComputeTolerance(False)
             alg.SetTolerance(tolerance)
-        alg.Update() # Perform the resampling
+        _update_alg(alg, name='sample') # Perform the resampling
         return _get_output(alg)
 
     def interpolate(dataset, target, sharpness=2, radius=1.0,
@@ -1777,9 +3144,220 @@ class DataSetFilters:
             raise ValueError(f'strategy `{strategy}` not supported.')
         interpolator.SetPassPointArrays(pass_point_arrays)
         interpolator.SetPassCellArrays(pass_cell_arrays)
-        _update_alg(interpolator, progress_bar, 'Interpolating')
+        _update_alg(interpolator, progress_bar, 'Interpolating', name='interpolate')
         return _get_output(interpolator)
 
+    def probe_operator(dataset, points, tolerance=None, categorical=False):
+        """Precompute the interpolation performed by :func:`DataSetFilters.probe`.
+
+        The cells of ``dataset`` containing the points and the
+        interpolation weights are found once.  The returned operator then
+        interpolates any array of ``dataset`` with a sparse matrix-vector
+        product, which is much faster than probing again when the same
+        meshes are probed for many arrays or timesteps.
+
+        :func:`DataSetFilters.sample` is the same operation with the
+        meshes swapped, use ``target.probe_operator(dataset)``.
+
+        Parameters
+        ----------
+        dataset: pyvista.Common
+            The mesh to probe from.
+
+        points: pyvista.Common
+            The points to probe values on to. This should be a PyVista mesh
+            or something :func:`pyvista.wrap` can handle.
+
+        tolerance: float, optional
+            Tolerance used to compute whether a point in the source is in a
+            cell of the input.  If not given, tolerance is automatically generated.
+
+        categorical : bool, optional
+            Treat the point data as categorical, using the value of the
+            point of the cell with the largest weight.
+
+        Return
+        ------
+        operator : pyvista.InterpolationOperator
+            Operator interpolating the point and cell arrays of ``dataset``
+            onto ``points``.  Points outside of ``dataset`` are given zero.
+
+        Examples
+        --------
+        Probe the active scalars in ``grid`` at the points in ``mesh``
+
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> mesh = pyvista.Sphere(center=(4.5, 4.5, 4.5), radius=4.5)
+        >>> grid = examples.load_uniform()
+        >>> operator = grid.probe_operator(mesh)
+        >>> values = operator.apply(grid['Spatial Point Data'])
+        >>> bool(np.allclose(values, grid.probe(mesh)['Spatial Point Data']))
+        True
+
+        """
+        if not pyvista.is_pyvista_dataset(points):
+            points = pyvista.wrap(points)
+        # probe the cell ids of a copy of the geometry without its arrays
+        source = type(dataset)()
+        source.CopyStructure(dataset)
+        source.cell_arrays['cell_ids'] = np.arange(dataset.n_cells, dtype=pyvista.ID_TYPE)
+        alg = vtk.vtkProbeFilter()
+        alg.SetInputData(points)
+        alg.SetSourceData(source)
+        alg.SetPassCellArrays(False)
+        alg.SetPassPointArrays(False)
+        alg.SetPassFieldArrays(False)
+        if tolerance is not None:
+            alg.SetComputeTolerance(False)
+            alg.SetTolerance(tolerance)
+        _update_alg(alg, name='probe_operator')
+        output = _get_output(alg)
+        valid = output.point_arrays[alg.GetValidPointMaskArrayName()].astype(bool)
+        cell_ids = np.where(valid, output.point_arrays['cell_ids'], -1)
+
+        inside = np.nonzero(valid)[0]
+        indptr = np.zeros(points.n_points + 1, dtype=pyvista.ID_TYPE)
+        cell_indptr, indices, weights = cell_weights(dataset, cell_ids[inside],
+                                                     points.points[inside])
+        sizes = np.zeros(points.n_points, dtype=pyvista.ID_TYPE)
+        sizes[inside] = np.diff(cell_indptr)
+        if categorical and inside.size:
+            # keep the point of largest weight of each cell
+            largest = np.maximum.reduceat(weights, cell_indptr[:-1])
+            first = np.nonzero(weights == np.repeat(largest, np.diff(cell_indptr)))[0]
+            rows = np.repeat(np.arange(inside.size), np.diff(cell_indptr))[first]
+            keep = first[np.unique(rows, return_index=True)[1]]
+            indices, weights = indices[keep], np.ones(keep.size)
+            sizes[inside] = 1
+        np.cumsum(sizes, out=indptr[1:])
+        return InterpolationOperator(indptr, indices, weights, dataset.n_points,
+                                     cell_ids=cell_ids, valid_mask=valid)
+
+    def interpolation_operator(dataset, target, sharpness=2, radius=1.0,
+                               strategy='null_value', null_value=0.0, n_points=None):
+        """Precompute the interpolation performed by :func:`DataSetFilters.interpolate`.
+
+        The neighbors and Gaussian weights of the points of ``target``
+        are found once.  The returned operator then interpolates any
+        point array of ``target`` onto the points of this mesh with a
+        sparse matrix-vector product.
+
+        Neighbors are found with :class:`scipy.spatial.cKDTree` when
+        ``scipy`` is installed, and with :class:`vtk.vtkStaticPointLocator`
+        otherwise.
+
+        Parameters
+        ----------
+        target: pyvista.Common
+            The vtk data object to interpolate from.
+
+        sharpness : float
+            Sharpness (i.e., falloff) of the Gaussian.
+
+        radius : float
+            Radius within which the basis points must lie.
+
+        strategy : str, optional
+            Strategy for the points without neighbors, either
+            ``'null_value'``, ``'mask_points'`` or ``'closest_point'``.
+            See :func:`DataSetFilters.interpolate`.
+
+        null_value : float, optional
+            Value of the points without neighbors.
+
+        n_points : int, optional
+            If given, use the number of the closest points instead of the
+            radius to find the neighbors.
+
+        Return
+        ------
+        operator : pyvista.InterpolationOperator
+            Operator interpolating the point arrays of ``target`` onto the
+            points of this mesh.  Its ``valid_mask`` marks the points with
+            neighbors.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import pyvista
+        >>> cloud = pyvista.PolyData(np.random.random((100, 3)))
+        >>> cloud['values'] = np.arange(100.0)
+        >>> plane = pyvista.Plane(center=(0.5, 0.5, 0.5))
+        >>> operator = plane.interpolation_operator(cloud, radius=0.2)
+        >>> values = operator.apply(cloud['values'])
+        >>> result = plane.interpolate(cloud, radius=0.2)
+        >>> bool(np.allclose(values, result['values']))
+        True
+
+        """
+        if not pyvista.is_pyvista_dataset(target):
+            raise TypeError('`target` must be a PyVista mesh type.')
+        if strategy not in ('null_value', 'mask_points', 'closest_point'):
+            raise ValueError(f'strategy `{strategy}` not supported.')
+        points = np.asarray(dataset.points, dtype=float)
+        sources = np.asarray(target.points, dtype=float)
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            cKDTree = None
+
+        if cKDTree is not None:
+            tree = cKDTree(sources)
+            if n_points:
+                k = min(n_points, target.n_points)
+                neighbors = tree.query(points, k=k)[1].reshape(points.shape[0], k)
+            else:
+                neighbors = list(tree.query_ball_point(points, radius))
+        else:
+            locator = vtk.vtkStaticPointLocator()
+            locator.SetDataSet(target)
+            locator.BuildLocator()
+            ids = vtk.vtkIdList()
+            neighbors = []
+            for point in points:
+                if n_points:
+                    locator.FindClosestNPoints(n_points, point, ids)
+                else:
+                    locator.FindPointsWithinRadius(radius, point, ids)
+                neighbors.append(vtk_id_list_to_array(ids))
+
+        if isinstance(neighbors, np.ndarray):
+            sizes = np.full(points.shape[0], neighbors.shape[1], dtype=pyvista.ID_TYPE)
+        else:
+            sizes = np.array([len(ids) for ids in neighbors], dtype=pyvista.ID_TYPE)
+        valid = sizes > 0
+        closest_only = np.zeros(points.shape[0], dtype=bool)
+        if strategy == 'closest_point' and not valid.all():
+            if cKDTree is not None:
+                closest = tree.query(points[~valid])[1]
+            else:
+                closest = [locator.FindClosestPoint(point) for point in points[~valid]]
+            for i, point_id in zip(np.nonzero(~valid)[0], closest):
+                neighbors[i] = [point_id]
+            sizes[~valid] = 1
+            closest_only = ~valid
+            valid = np.ones(points.shape[0], dtype=bool)
+
+        indptr = np.zeros(points.shape[0] + 1, dtype=pyvista.ID_TYPE)
+        np.cumsum(sizes, out=indptr[1:])
+        indices = np.zeros(indptr[-1], dtype=pyvista.ID_TYPE)
+        if isinstance(neighbors, np.ndarray):
+            indices = neighbors.ravel().astype(pyvista.ID_TYPE)
+        elif indices.size:
+            indices = np.concatenate([np.asarray(ids, dtype=pyvista.ID_TYPE)
+                                      for ids in neighbors]).astype(pyvista.ID_TYPE)
+        rows = np.repeat(np.arange(points.shape[0]), sizes)
+        dist2 = ((sources[indices] - points[rows])**2).sum(1)
+        weights = np.exp(-(sharpness / radius)**2 * dist2)
+        totals = np.bincount(rows, weights, minlength=points.shape[0])
+        nonzero = totals[rows] > 0
+        weights[nonzero] /= totals[rows][nonzero]
+        # the closest points are copied whatever their distance
+        weights[closest_only[rows]] = 1.0
+        return InterpolationOperator(indptr, indices, weights, target.n_points,
+                                     valid_mask=valid, null_value=null_value)
+
     def streamlines(dataset, vectors=None, source_center=None,
                     source_radius=None, n_points=100,
                     integrator_type=45, integration_direction='both',
@@ -1788,7 +3366,8 @@ class DataSetFilters:
                     max_steps=2000, terminal_speed=1e-12, max_error=1e-6,
                     max_time=None, compute_vorticity=True, rotation_scale=1.0,
                     interpolator_type='point', start_position=(0.0, 0.0, 0.0),
-                    return_source=False, pointa=None, pointb=None):
+                    return_source=False, pointa=None, pointb=None, n_workers=1,
+                    chunk_size=None):
         """Integrate a vector field to generate streamlines.
 
         The integration is performed using a specified integrator, by default
@@ -1894,6 +3473,104 @@ class DataSetFilters:
             The coordinates of a start and end point for a line source. This
             will override the sphere point source.
 
+        n_workers : int, optional
+            Number of processes integrating chunks of the source points.
+            See :func:`DataSetFilters.streamlines_from_source`.
+
+        chunk_size : int, optional
+            Number of source points of each chunk.
+
+        """
+        if pointa is not None and pointb is not None:
+            source = vtk.vtkLineSource()
+            source.SetPoint1(pointa)
+            source.SetPoint2(pointb)
+            source.SetResolution(n_points)
+        else:
+            if source_center is None:
+                source_center = dataset.center
+            if source_radius is None:
+                source_radius = dataset.length / 10.0
+            source = vtk.vtkPointSource()
+            source.SetCenter(source_center)
+            source.SetRadius(source_radius)
+            source.SetNumberOfPoints(n_points)
+        _update_alg(source, name='streamlines')
+        src = pyvista.wrap(source.GetOutput())
+        output = dataset.streamlines_from_source(
+            src, vectors, integrator_type=integrator_type,
+            integration_direction=integration_direction,
+            surface_streamlines=surface_streamlines,
+            initial_step_length=initial_step_length, step_unit=step_unit,
+            min_step_length=min_step_length, max_step_length=max_step_length,
+            max_steps=max_steps, terminal_speed=terminal_speed, max_error=max_error,
+            max_time=max_time, compute_vorticity=compute_vorticity,
+            rotation_scale=rotation_scale, interpolator_type=interpolator_type,
+            start_position=start_position, n_workers=n_workers, chunk_size=chunk_size)
+        if return_source:
+            return output, src
+        return output
+
+    def streamlines_from_source(dataset, source, vectors=None, integrator_type=45,
+                                integration_direction='both', surface_streamlines=False,
+                                initial_step_length=0.5, step_unit='cl',
+                                min_step_length=0.01, max_step_length=1.0,
+                                max_steps=2000, terminal_speed=1e-12, max_error=1e-6,
+                                max_time=None, compute_vorticity=True,
+                                rotation_scale=1.0, interpolator_type='point',
+                                start_position=(0.0, 0.0, 0.0), n_workers=1,
+                                chunk_size=None):
+        """Generate streamlines of vectors from the points of a source mesh.
+
+        See :func:`DataSetFilters.streamlines` for the integration
+        parameters.
+
+        The seeds can be split into chunks integrated concurrently by
+        ``n_workers`` processes.  Each worker builds the tracer and the
+        locator of this dataset once and reuses them for all its
+        chunks.  Worker processes use the default start method of the
+        platform.  They inherit the dataset when it forks, otherwise it
+        is serialized to each of them once.  Chunks integrated in worker
+        processes are not recorded by :func:`pyvista.profile`, and a
+        cancelled :class:`pyvista.FilterFuture` stops after the chunks
+        being integrated.  The streamlines are merged in the order of the seeds, so that the
+        lines and their arrays, including the ``'SeedIds'`` cell array,
+        are the same as when integrating all seeds at once.  Points not
+        used by any line are dropped.
+
+        Parameters
+        ----------
+        source : pyvista.Common
+            The points of the source are the seeds of the streamlines.
+
+        vectors : str, optional
+            The string name of the active vector field to integrate across.
+
+        n_workers : int, optional
+            Number of processes integrating chunks of seeds.  ``None``
+            uses the number of CPUs.  Default ``1`` integrates in this
+            process.
+
+        chunk_size : int, optional
+            Number of seeds of each chunk.  Defaults to splitting the
+            seeds into four chunks per worker when ``n_workers`` is more
+            than one, and to a single chunk otherwise.
+
+        Return
+        ------
+        streamlines : pyvista.PolyData
+            Streamlines of the seeds, with the index of their seed in
+            the ``'SeedIds'`` cell array.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> mesh = examples.download_carotid()  # doctest:+SKIP
+        >>> seeds = pyvista.PolyData(mesh.center + np.random.random((1000, 3)))  # doctest:+SKIP
+        >>> lines = mesh.streamlines_from_source(seeds, n_workers=4)  # doctest:+SKIP
+
         """
         integration_direction = str(integration_direction).strip().lower()
         if integration_direction not in ['both', 'back', 'backward', 'forward']:
@@ -1904,76 +3581,70 @@ class DataSetFilters:
             raise ValueError("interpolator type must be either 'cell' or 'point'")
         if step_unit not in ['l', 'cl']:
             raise ValueError("step unit must be either 'l' or 'cl'")
-        step_unit = {'cl': vtk.vtkStreamTracer.CELL_LENGTH_UNIT,
-                     'l': vtk.vtkStreamTracer.LENGTH_UNIT}[step_unit]
+        # a plain int, since the settings are pickled for worker processes
+        step_unit = int({'cl': vtk.vtkStreamTracer.CELL_LENGTH_UNIT,
+                         'l': vtk.vtkStreamTracer.LENGTH_UNIT}[step_unit])
+        if not pyvista.is_pyvista_dataset(source):
+            source = pyvista.wrap(source)
         if isinstance(vectors, str):
             dataset.set_active_scalars(vectors)
             dataset.set_active_vectors(vectors)
         if max_time is None:
             max_velocity = dataset.get_data_range()[-1]
             max_time = 4.0 * dataset.GetLength() / max_velocity
-        # Generate the source
-        if source_center is None:
-            source_center = dataset.center
-        if source_radius is None:
-            source_radius = dataset.length / 10.0
-        if pointa is not None and pointb is not None:
-            source = vtk.vtkLineSource()
-            source.SetPoint1(pointa)
-            source.SetPoint2(pointb)
-            source.SetResolution(n_points)
-        else:
-            source = vtk.vtkPointSource()
-            source.SetCenter(source_center)
-            source.SetRadius(source_radius)
-            source.SetNumberOfPoints(n_points)
-        # Build the algorithm
-        alg = vtk.vtkStreamTracer()
-        # Inputs
-        alg.SetInputDataObject(dataset)
-        # NOTE: not sure why we can't pass a PolyData object
-        #       setting the connection is the only I could get it to work
-        alg.SetSourceConnection(source.GetOutputPort())
-        # general parameters
-        alg.SetComputeVorticity(compute_vorticity)
-        alg.SetInitialIntegrationStep(initial_step_length)
-        alg.SetIntegrationStepUnit(step_unit)
-        alg.SetMaximumError(max_error)
-        alg.SetMaximumIntegrationStep(max_step_length)
-        alg.SetMaximumNumberOfSteps(max_steps)
-        alg.SetMaximumPropagation(max_time)
-        alg.SetMinimumIntegrationStep(min_step_length)
-        alg.SetRotationScale(rotation_scale)
-        alg.SetStartPosition(start_position)
-        alg.SetSurfaceStreamlines(surface_streamlines)
-        alg.SetTerminalSpeed(terminal_speed)
-        # Model parameters
-        if integration_direction == 'forward':
-            alg.SetIntegrationDirectionToForward()
-        elif integration_direction in ['backward', 'back']:
-            alg.SetIntegrationDirectionToBackward()
-        else:
-            alg.SetIntegrationDirectionToBoth()
-        # set integrator type
-        if integrator_type == 2:
-            alg.SetIntegratorTypeToRungeKutta2()
-        elif integrator_type == 4:
-            alg.SetIntegratorTypeToRungeKutta4()
-        else:
-            alg.SetIntegratorTypeToRungeKutta45()
-        # set interpolator type
-        if interpolator_type in ['c', 'cell']:
-            alg.SetInterpolatorTypeToCellLocator()
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers < 1:
+            raise ValueError('`n_workers` must be positive.')
+        settings = dict(
+            compute_vorticity=compute_vorticity, initial_step_length=initial_step_length,
+            step_unit=step_unit, max_error=max_error, max_step_length=max_step_length,
+            max_steps=max_steps, max_time=max_time, min_step_length=min_step_length,
+            rotation_scale=rotation_scale, start_position=start_position,
+            surface_streamlines=surface_streamlines, terminal_speed=terminal_speed,
+            integration_direction=integration_direction, integrator_type=integrator_type,
+            interpolator_type=interpolator_type)
+
+        if n_workers == 1 and chunk_size is None:
+            alg = _stream_tracer(dataset, settings)
+            alg.SetSourceData(source)
+            _update_alg(alg, name='streamlines_from_source')
+            return _get_output(alg)
+
+        seeds = np.asarray(source.points)
+        if chunk_size is None:
+            chunk_size = max(1, -(-seeds.shape[0] // (4 * n_workers)))
+        starts = list(range(0, seeds.shape[0], chunk_size)) or [0]
+        chunks = [seeds[start:start + chunk_size] for start in starts]
+        if n_workers == 1 or len(chunks) == 1:
+            _init_stream_worker(dataset, settings)
+            try:
+                results = [_trace_chunk(chunk) for chunk in chunks]
+            finally:
+                _STREAM_WORKER.clear()
         else:
-            alg.SetInterpolatorTypeToDataSetPointLocator()
-        # run the algorithm
-        alg.Update()
-        output = _get_output(alg)
-        if return_source:
-            source.Update()
-            src = pyvista.wrap(source.GetOutput())
-            return output, src
-        return output
+            # forking a process running VTK threads is not safe everywhere,
+            # so only share the dataset directly when the platform forks
+            context = multiprocessing.get_context()
+            if context.get_start_method() == 'fork':
+                shared = dataset
+            else:
+                shared = _serialize_dataset(dataset)
+            # a cancelled filter future stops waiting after the current chunk
+            future = FilterFuture.current()
+            results = []
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(chunks)),
+                                     mp_context=context,
+                                     initializer=_init_stream_worker,
+                                     initargs=(shared, settings, True)) as executor:
+                pending = [executor.submit(_trace_chunk, chunk) for chunk in chunks]
+                for chunk_future in pending:
+                    if future is not None and future._abort:
+                        for other in pending:
+                            other.cancel()
+                        break
+                    results.append(chunk_future.result())
+        return _merge_stream_chunks(results, starts)
 
     def decimate_boundary(dataset, target_reduction=0.5):
         """Return a decimated version of a triangulation of the boundary.
@@ -2108,32 +3779,43 @@ class DataSetFilters:
     def extract_cells(dataset, ind):
         """Return a subset of the grid.
 
+        Cells are extracted with numpy, except for grids of polyhedra
+        which use ``vtkExtractSelection``.
+
         Parameters
         ----------
         ind : np.ndarray
-            Numpy array of cell indices to be extracted.
+            Numpy array of cell indices or boolean mask of the cells to
+            be extracted.  Indices must be between ``0`` and
+            ``n_cells - 1``.
 
         Return
         ------
         subgrid : pyvista.UnstructuredGrid
-            Subselected grid
+            Subselected grid.  The ``'vtkOriginalCellIds'`` and
+            ``'vtkOriginalPointIds'`` arrays hold the ids of the cells and
+            points in this dataset.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> grid = examples.load_hexbeam()
+        >>> subgrid = grid.extract_cells(grid.cell_centers().points[:, 2] < 1)
+        >>> subgrid.cell_arrays['vtkOriginalCellIds']
+        pyvista_ndarray([0, 1, 2, 3, 4, 5, 6, 7])
 
         """
+        cell_mask = _selection_mask(ind, dataset.n_cells)
+        if not _has_polyhedra(dataset):
+            return _extract_cells_numpy(dataset, cell_mask)
+
         # Create selection objects
         selectionNode = vtk.vtkSelectionNode()
         selectionNode.SetFieldType(vtk.vtkSelectionNode.CELL)
         selectionNode.SetContentType(vtk.vtkSelectionNode.INDICES)
         selectionNode.SetSelectionList(numpy_to_idarr(ind))
-
-        selection = vtk.vtkSelection()
-        selection.AddNode(selectionNode)
-
-        # extract
-        extract_sel = vtk.vtkExtractSelection()
-        extract_sel.SetInputData(0, dataset)
-        extract_sel.SetInputData(1, selection)
-        extract_sel.Update()
-        subgrid = _get_output(extract_sel)
+        subgrid = _extract_selection(dataset, selectionNode, 'extract_cells')
 
         # extracts only in float32
         if dataset.points.dtype is not np.dtype('float32'):
@@ -2148,7 +3830,9 @@ class DataSetFilters:
         Parameters
         ----------
         ind : np.ndarray, list, or sequence
-            Numpy array of point indices to be extracted.
+            Numpy array of point indices or boolean mask of the points to
+            be extracted.  Indices must be between ``0`` and
+            ``n_points - 1``.
         adjacent_cells : bool, optional
             If True, extract the cells that contain at least one of the 
             extracted points. If False, extract the cells that contain 
@@ -2158,32 +3842,34 @@ class DataSetFilters:
         Return
         ------
         subgrid : pyvista.UnstructuredGrid
-            Subselected grid.
+            Subselected grid.  The ``'vtkOriginalCellIds'`` and
+            ``'vtkOriginalPointIds'`` arrays hold the ids of the cells and
+            points in this dataset.
 
         """
+        point_mask = _selection_mask(ind, dataset.n_points)
+        if not _has_polyhedra(dataset):
+            cells = dataset_cells(dataset)
+            offsets, connectivity, _ = cells
+            if adjacent_cells:
+                ufunc = np.logical_or
+            else:
+                ufunc = np.logical_and
+            cell_mask = _reduce_cells(offsets, point_mask[connectivity], ufunc, False)
+            return _extract_cells_numpy(dataset, cell_mask, cells)
+
         # Create selection objects
         selectionNode = vtk.vtkSelectionNode()
         selectionNode.SetFieldType(vtk.vtkSelectionNode.POINT)
         selectionNode.SetContentType(vtk.vtkSelectionNode.INDICES)
+        ind = np.nonzero(point_mask)[0]
         if not adjacent_cells:
-            # Build array of point indices to be removed.
-            ind_rem = np.ones(dataset.n_points, dtype='bool')
-            ind_rem[ind] = False
-            ind = np.arange(dataset.n_points)[ind_rem]
-            # Invert selection
+            # Select the points to be removed and invert the selection
+            ind = np.nonzero(~point_mask)[0]
             selectionNode.GetProperties().Set(vtk.vtkSelectionNode.INVERSE(), 1)
         selectionNode.SetSelectionList(numpy_to_idarr(ind))
         selectionNode.GetProperties().Set(vtk.vtkSelectionNode.CONTAINING_CELLS(), 1)
-        
-        selection = vtk.vtkSelection()
-        selection.AddNode(selectionNode)
-
-        # extract
-        extract_sel = vtk.vtkExtractSelection()
-        extract_sel.SetInputData(0, dataset)
-        extract_sel.SetInputData(1, selection)
-        extract_sel.Update()
-        return _get_output(extract_sel)
+        return _extract_selection(dataset, selectionNode, 'extract_points')
 
     def extract_selection_points(dataset, ind):  # pragma: no cover
         """Return a subset of the grid (with cells) that contains any of the given point indices.
@@ -2219,7 +3905,7 @@ class DataSetFilters:
             surf_filter.PassThroughCellIdsOn()
         if pass_cellid:
             surf_filter.PassThroughPointIdsOn()
-        surf_filter.Update()
+        _update_alg(surf_filter, name='extract_surface')
 
         # need to add
         # surf_filter.SetNonlinearSubdivisionLevel(subdivision)
@@ -2290,7 +3976,7 @@ class DataSetFilters:
         featureEdges.SetBoundaryEdges(boundary_edges)
         featureEdges.SetFeatureEdges(feature_edges)
         featureEdges.SetColoring(False)
-        featureEdges.Update()
+        _update_alg(featureEdges, name='extract_feature_edges')
 
         mesh = _get_output(featureEdges)
         if inplace:
@@ -2363,7 +4049,7 @@ class DataSetFilters:
         if main_has_priority:
             append_filter.AddInputData(dataset)
 
-        append_filter.Update()
+        _update_alg(append_filter, name='merge')
         merged = _get_output(append_filter)
         if inplace:
             if type(dataset) == type(merged):
@@ -2377,7 +4063,8 @@ class DataSetFilters:
         """Combine this mesh with another into an :class:`pyvista.UnstructuredGrid`."""
         return DataSetFilters.merge(dataset, grid)
 
-    def compute_cell_quality(dataset, quality_measure='scaled_jacobian', null_value=-1.0):
+    def compute_cell_quality(dataset, quality_measure='scaled_jacobian', null_value=-1.0,
+                             engine=None):
         """Compute a function of (geometric) quality for each cell of a mesh.
 
         The per-cell quality is added to the mesh's cell data, in an array
@@ -2386,7 +4073,13 @@ class DataSetFilters:
 
         Defaults to computing the scaled jacobian.
 
-        Options for cell quality measure:
+        Several measures are computed at once when ``quality_measure``
+        is a list, each in an array named after its measure.  Use
+        :func:`pyvista.utilities.measures.cell_quality` to get the
+        arrays and their statistics by cell type without an output mesh.
+
+        Options for cell quality measure, as available in the installed
+        VTK, see ``pyvista.utilities.measures.QUALITY_MEASURES``:
 
         - ``'area'``
         - ``'aspect_beta'``
@@ -2420,8 +4113,8 @@ class DataSetFilters:
 
         Parameters
         ----------
-        quality_measure : str
-            The cell quality measure to use
+        quality_measure : str or list of str
+            The cell quality measure or measures to use.
 
         null_value : float
             Float value for undefined quality. Undefined quality are qualities
@@ -2430,49 +4123,50 @@ class DataSetFilters:
             for a triangle. Undefined quality will always be undefined.
             The default value is -1.
 
+        engine : str, optional
+            ``'vtk'`` to use ``vtkCellQuality`` or ``'numpy'`` to compute
+            the common measures of triangles, quads, tetrahedra and
+            hexahedra with :func:`pyvista.utilities.measures.cell_quality`.
+            Only ``'numpy'`` gathers the points of the cells once for all
+            measures, ``'vtk'`` runs ``vtkCellQuality`` once per measure.
+            Defaults to ``'numpy'`` for a list of measures and to
+            ``'vtk'`` for a single measure.
+
+        Examples
+        --------
+        Compute the minimum angle and the aspect ratio of the cells of a
+        mesh.
+
+        >>> import pyvista
+        >>> mesh = pyvista.Sphere().compute_cell_quality(['min_angle', 'aspect_ratio'])
+        >>> mesh.cell_arrays['min_angle'].shape
+        (1680,)
+
         """
-        alg = vtk.vtkCellQuality()
-        measure_setters = {
-            'area': alg.SetQualityMeasureToArea,
-            'aspect_beta': alg.SetQualityMeasureToAspectBeta,
-            'aspect_frobenius': alg.SetQualityMeasureToAspectFrobenius,
-            'aspect_gamma': alg.SetQualityMeasureToAspectGamma,
-            'aspect_ratio': alg.SetQualityMeasureToAspectRatio,
-            'collapse_ratio': alg.SetQualityMeasureToCollapseRatio,
-            'condition': alg.SetQualityMeasureToCondition,
-            'diagonal': alg.SetQualityMeasureToDiagonal,
-            'dimension': alg.SetQualityMeasureToDimension,
-            'distortion': alg.SetQualityMeasureToDistortion,
-            'jacobian': alg.SetQualityMeasureToJacobian,
-            'max_angle': alg.SetQualityMeasureToMaxAngle,
-            'max_aspect_frobenius': alg.SetQualityMeasureToMaxAspectFrobenius,
-            'max_edge_ratio': alg.SetQualityMeasureToMaxEdgeRatio,
-            'med_aspect_frobenius': alg.SetQualityMeasureToMedAspectFrobenius,
-            'min_angle': alg.SetQualityMeasureToMinAngle,
-            'oddy': alg.SetQualityMeasureToOddy,
-            'radius_ratio': alg.SetQualityMeasureToRadiusRatio,
-            'relative_size_squared': alg.SetQualityMeasureToRelativeSizeSquared,
-            'scaled_jacobian': alg.SetQualityMeasureToScaledJacobian,
-            'shape': alg.SetQualityMeasureToShape,
-            'shape_and_size': alg.SetQualityMeasureToShapeAndSize,
-            'shear': alg.SetQualityMeasureToShear,
-            'shear_and_size': alg.SetQualityMeasureToShearAndSize,
-            'skew': alg.SetQualityMeasureToSkew,
-            'stretch': alg.SetQualityMeasureToStretch,
-            'taper': alg.SetQualityMeasureToTaper,
-            'volume': alg.SetQualityMeasureToVolume,
-            'warpage': alg.SetQualityMeasureToWarpage
-        }
-        try:
-            # Set user specified quality measure
-            measure_setters[quality_measure]()
-        except (KeyError, IndexError):
-            options = ', '.join([f"'{s}'" for s in list(measure_setters.keys())])
-            raise KeyError(f'Cell quality type ({quality_measure}) not available. Options are: {options}')
-        alg.SetInputData(dataset)
-        alg.SetUndefinedQuality(null_value)
-        alg.Update()
-        return _get_output(alg)
+        measures = _quality_measures(quality_measure)
+        if engine is None:
+            engine = 'vtk' if isinstance(quality_measure, str) else 'numpy'
+        if engine == 'numpy':
+            quality = cell_quality(dataset, measures, null_value=null_value)
+        elif engine == 'vtk':
+            alg = vtk.vtkCellQuality()
+            alg.SetUndefinedQuality(null_value)
+            alg.SetInputDataObject(dataset)
+            quality = {}
+            for measure in measures:
+                _set_quality_measure(alg, measure)
+                _update_alg(alg, name='compute_cell_quality')
+                if isinstance(quality_measure, str):
+                    return _get_output(alg)
+                quality[measure] = _get_output(alg).cell_arrays['CellQuality']
+        else:
+            raise ValueError(f"Engine '{engine}' is not supported. Use 'vtk' or 'numpy'.")
+        if isinstance(quality_measure, str):
+            quality = {'CellQuality': quality[quality_measure]}
+        output = dataset.copy(deep=False)
+        for name, array in quality.items():
+            output.cell_arrays.append(array, name, active_vectors=False)
+        return output
 
     def compute_derivative(dataset, scalars=None, gradient=True,
                            divergence=None, vorticity=None, qcriterion=None,
@@ -2557,7 +4251,7 @@ class DataSetFilters:
         # args: (idx, port, connection, field, name)
         alg.SetInputArrayToProcess(0, 0, 0, field.value, scalars)
         alg.SetInputData(dataset)
-        alg.Update()
+        _update_alg(alg, name='compute_derivative')
         return _get_output(alg)
 
     def compute_gradient(self, scalars=None, gradient_name='gradient',
@@ -2609,7 +4303,7 @@ class DataSetFilters:
         alg = vtk.vtkShrinkFilter()
         alg.SetInputData(dataset)
         alg.SetShrinkFactor(shrink_factor)
-        _update_alg(alg, progress_bar, 'Shrinking Mesh')
+        _update_alg(alg, progress_bar, 'Shrinking Mesh', name='shrink')
         output = pyvista.wrap(alg.GetOutput())
         if isinstance(dataset, vtk.vtkPolyData):
             return output.extract_surface()
@@ -2628,26 +4322,22 @@ class CompositeFilters:
         """
         gf = vtk.vtkCompositeDataGeometryFilter()
         gf.SetInputData(composite)
-        gf.Update()
+        _update_alg(gf, name='extract_geometry')
         return wrap(gf.GetOutputDataObject(0))
 
     def combine(composite, merge_points=False):
         """Append all blocks into a single unstructured grid.
 
+        Nested blocks are flattened and appended in one pass, see
+        :func:`pyvista.merge`.
+
         Parameters
         ----------
         merge_points : bool, optional
             Merge coincidental points.
 
         """
-        alg = vtk.vtkAppendFilter()
-        for block in composite:
-            if isinstance(block, vtk.vtkMultiBlockDataSet):
-                block = CompositeFilters.combine(block, merge_points=merge_points)
-            alg.AddInputData(block)
-        alg.SetMergePoints(merge_points)
-        alg.Update()
-        return wrap(alg.GetOutputDataObject(0))
+        return merge(composite, merge_points=merge_points)
 
     clip = DataSetFilters.clip
 
@@ -2736,7 +4426,7 @@ class PolyDataFilters(DataSetFilters):
         featureEdges.NonManifoldEdgesOff()
         featureEdges.ManifoldEdgesOff()
         featureEdges.SetFeatureAngle(angle)
-        featureEdges.Update()
+        _update_alg(featureEdges, name='edge_mask')
         edges = _get_output(featureEdges)
         orig_id = pyvista.point_array(edges, 'point_ind')
 
@@ -2773,7 +4463,7 @@ class PolyDataFilters(DataSetFilters):
         bfilter.SetInputData(0, poly_data)
         bfilter.ReorientDifferenceCellsOff()
         bfilter.SetTolerance(tolerance)
-        bfilter.Update()
+        _update_alg(bfilter, name='boolean_cut')
 
         mesh = _get_output(bfilter)
         if inplace:
@@ -2806,7 +4496,7 @@ class PolyDataFilters(DataSetFilters):
         vtkappend = vtk.vtkAppendPolyData()
         vtkappend.AddInputData(poly_data)
         vtkappend.AddInputData(mesh)
-        vtkappend.Update()
+        _update_alg(vtkappend, name='boolean_add')
 
         mesh = _get_output(vtkappend)
         if inplace:
@@ -2845,7 +4535,7 @@ class PolyDataFilters(DataSetFilters):
         bfilter.SetInputData(1, mesh)
         bfilter.SetInputData(0, poly_data)
         bfilter.ReorientDifferenceCellsOff()
-        bfilter.Update()
+        _update_alg(bfilter, name='boolean_union')
 
         mesh = _get_output(bfilter)
         if inplace:
@@ -2878,7 +4568,7 @@ class PolyDataFilters(DataSetFilters):
         bfilter.SetInputData(1, mesh)
         bfilter.SetInputData(0, poly_data)
         bfilter.ReorientDifferenceCellsOff()
-        bfilter.Update()
+        _update_alg(bfilter, name='boolean_difference')
 
         mesh = _get_output(bfilter)
         if inplace:
@@ -2923,7 +4613,7 @@ class PolyDataFilters(DataSetFilters):
         else:
             raise ValueError('Curv_Type must be either "Mean", '
                              '"Gaussian", "Maximum", or "Minimum"')
-        curvefilter.Update()
+        _update_alg(curvefilter, name='curvature')
 
         # Compute and return curvature
         curv = _get_output(curvefilter)
@@ -2974,7 +4664,7 @@ class PolyDataFilters(DataSetFilters):
         trifilter.SetInputData(poly_data)
         trifilter.PassVertsOff()
         trifilter.PassLinesOff()
-        trifilter.Update()
+        _update_alg(trifilter, name='triangulate')
 
         mesh = _get_output(trifilter)
         if inplace:
@@ -3056,7 +4746,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetEdgeAngle(edge_angle)
         alg.SetBoundarySmoothing(boundary_smoothing)
         alg.SetRelaxationFactor(relaxation_factor)
-        alg.Update()
+        _update_alg(alg, name='smooth')
 
         mesh = _get_output(alg)
         if inplace:
@@ -3118,7 +4808,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetSplitting(splitting)
         alg.SetSplitAngle(split_angle)
         alg.SetPreSplitMesh(pre_split_mesh)
-        alg.Update()
+        _update_alg(alg, name='decimate_pro')
 
         mesh = _get_output(alg)
         if inplace:
@@ -3194,7 +4884,7 @@ class PolyDataFilters(DataSetFilters):
             tube.SetInputArrayToProcess(0, 0, 0, field.value, scalars)
             tube.SetVaryRadiusToVaryRadiusByScalar()
         # Apply the filter
-        tube.Update()
+        _update_alg(tube, name='tube')
 
         mesh = _get_output(tube)
         if inplace:
@@ -3264,7 +4954,7 @@ class PolyDataFilters(DataSetFilters):
         # Subdivide
         sfilter.SetNumberOfSubdivisions(nsub)
         sfilter.SetInputData(poly_data)
-        sfilter.Update()
+        _update_alg(sfilter, name='subdivide')
 
         submesh = _get_output(sfilter)
         if inplace:
@@ -3384,7 +5074,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetTargetReduction(target_reduction)
 
         alg.SetInputData(poly_data)
-        _update_alg(alg, progress_bar, 'Decimating')
+        _update_alg(alg, progress_bar, 'Decimating', name='decimate')
 
         mesh = _get_output(alg)
         if inplace:
@@ -3392,6 +5082,103 @@ class PolyDataFilters(DataSetFilters):
         else:
             return mesh
 
+    def lod_pyramid(poly_data, levels=(0.5, 0.75, 0.9, 0.97), method='quadric',
+                    cache=False, progress_bar=False, **kwargs):
+        """Generate levels of detail of a triangular mesh.
+
+        Each level is decimated from the previous one rather than from
+        the full resolution mesh, so that the cost of the pyramid is
+        about that of decimating the full resolution mesh once.
+
+        The point and cell arrays dropped by the decimation are carried
+        to each level from the closest point or cell of the previous one.
+
+        Parameters
+        ----------
+        levels : sequence(float), optional
+            Increasing fractions of the triangles of the full resolution
+            mesh removed at each level.
+
+        method : str, optional
+            Decimation filter, either ``'quadric'`` for
+            :func:`PolyDataFilters.decimate` or ``'pro'`` for
+            :func:`PolyDataFilters.decimate_pro`.
+
+        cache : bool, optional
+            Keep the levels in ``pyvista.READ_CACHE_PATH`` and load them
+            instead of decimating again the same mesh with the same
+            parameters.  The cache is shared with
+            ``pyvista.read(..., cache=True)``.
+
+        progress_bar : bool, optional
+            Display a progress bar to indicate progress.
+
+        **kwargs : dict, optional
+            Additional arguments of the decimation filter.
+
+        Return
+        ------
+        pyramid : pyvista.MultiBlock
+            The full resolution mesh followed by each level, from the
+            finest to the coarsest.  The fraction of the triangles
+            targeted for removal is stored in the ``'TargetReduction'``
+            field array of each level.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere(theta_resolution=90, phi_resolution=90)
+        >>> pyramid = sphere.lod_pyramid([0.5, 0.9])
+        >>> [level.n_cells for level in pyramid]
+        [15840, 7920, 1584]
+
+        """
+        levels = [float(level) for level in levels]
+        if any(level < 0 or level >= 1 for level in levels) or \
+           any(b <= a for a, b in zip(levels[:-1], levels[1:])):
+            raise ValueError('`levels` must be increasing fractions in [0, 1).')
+        if method == 'quadric':
+            kwargs['progress_bar'] = progress_bar
+        elif method != 'pro':
+            raise ValueError(f'Decimation method `{method}` not supported.')
+
+        key = None
+        if cache:
+            options = {name: value for name, value in kwargs.items() if name != 'progress_bar'}
+            key = _dataset_cache_key(poly_data, 'lod_pyramid', levels, method,
+                                     sorted(options.items()))
+            cached = [_load_cached(f'{key}-{i}') for i in range(len(levels))]
+            if all(mesh is not None for mesh in cached):
+                pyramid = pyvista.MultiBlock()
+                pyramid.append(poly_data)
+                for mesh in cached:
+                    pyramid.append(mesh)
+                return pyramid
+
+        mesh = poly_data
+        if not mesh.is_all_triangles():
+            mesh = mesh.triangulate()
+        pyramid = pyvista.MultiBlock()
+        pyramid.append(poly_data)
+        n_cells = mesh.n_cells
+        for i, level in enumerate(levels):
+            target = (1 - level) * n_cells
+            reduction = 1 - target / mesh.n_cells if mesh.n_cells else 0.0
+            if reduction > 0:
+                previous = mesh
+                if method == 'quadric':
+                    mesh = previous.decimate(reduction, **kwargs)
+                else:
+                    mesh = previous.decimate_pro(reduction, **kwargs)
+                _carry_arrays(mesh, previous)
+            else:
+                mesh = mesh.copy()
+            mesh.field_arrays['TargetReduction'] = [level]
+            if key is not None:
+                _store_cached(mesh, f'{key}-{i}', 'the levels of detail')
+            pyramid.append(mesh)
+        return pyramid
+
     def compute_normals(poly_data, cell_normals=True, point_normals=True,
                         split_vertices=False, flip_normals=False,
                         consistent_normals=True,
@@ -3503,7 +5290,7 @@ class PolyDataFilters(DataSetFilters):
         normal.SetNonManifoldTraversal(non_manifold_traversal)
         normal.SetFeatureAngle(feature_angle)
         normal.SetInputData(poly_data)
-        normal.Update()
+        _update_alg(normal, name='compute_normals')
 
         mesh = _get_output(normal)
         if point_normals:
@@ -3603,7 +5390,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetInputDataObject(poly_data)
         alg.SetTolerance(tolerance)
         alg.SetClippingPlanes(collection)
-        alg.Update() # Perform the Cut
+        _update_alg(alg, name='clip_closed_surface') # Perform the Cut
         result = _get_output(alg)
 
         if inplace:
@@ -3655,7 +5442,7 @@ class PolyDataFilters(DataSetFilters):
         alg = vtk.vtkFillHolesFilter()
         alg.SetHoleSize(hole_size)
         alg.SetInputData(poly_data)
-        _update_alg(alg, progress_bar, 'Filling Holes')
+        _update_alg(alg, progress_bar, 'Filling Holes', name='fill_holes')
 
         mesh = _get_output(alg)
         if inplace:
@@ -3665,12 +5452,20 @@ class PolyDataFilters(DataSetFilters):
 
     def clean(poly_data, point_merging=True, tolerance=None, lines_to_points=True,
               polys_to_lines=True, strips_to_polys=True, inplace=False,
-              absolute=True, progress_bar=False, **kwargs):
+              absolute=True, progress_bar=False, engine='vtk', **kwargs):
         """Clean the mesh.
 
         This merges duplicate points, removes unused points, and/or removes
         degenerate cells.
 
+        The ``'numpy'`` engine merges the points falling in the same
+        cell of a grid of spacing ``tolerance``, found by sorting their
+        quantized coordinates, rather than the points within
+        ``tolerance`` of each other found by ``vtkCleanPolyData``.  It
+        is much faster on large meshes.  Merged points take the data of
+        their first point, and degenerate cells are removed rather than
+        converted to lower dimensional cells.
+
         Parameters
         ----------
         point_merging : bool, optional
@@ -3700,7 +5495,13 @@ class PolyDataFilters(DataSetFilters):
             Control if ``tolerance`` is an absolute distance or a fraction.
 
         progress_bar : bool, optional
-            Display a progress bar to indicate progress.
+            Display a progress bar to indicate progress.  Only used by
+            the ``'vtk'`` engine.
+
+        engine : str, optional
+            ``'vtk'`` to use ``vtkCleanPolyData`` or ``'numpy'``.  The
+            ``'numpy'`` engine ignores ``lines_to_points``,
+            ``polys_to_lines`` and ``strips_to_polys``.
 
         Return
         ------
@@ -3724,20 +5525,29 @@ class PolyDataFilters(DataSetFilters):
         if tolerance is None:
             tolerance = kwargs.pop('merge_tol', None)
         assert_empty_kwargs(**kwargs)
-        alg = vtk.vtkCleanPolyData()
-        alg.SetPointMerging(point_merging)
-        alg.SetConvertLinesToPoints(lines_to_points)
-        alg.SetConvertPolysToLines(polys_to_lines)
-        alg.SetConvertStripsToPolys(strips_to_polys)
-        if isinstance(tolerance, (int, float)):
-            if absolute:
-                alg.ToleranceIsAbsoluteOn()
-                alg.SetAbsoluteTolerance(tolerance)
-            else:
-                alg.SetTolerance(tolerance)
-        alg.SetInputData(poly_data)
-        _update_alg(alg, progress_bar, 'Cleaning')
-        output = _get_output(alg)
+        if engine == 'numpy':
+            if not isinstance(tolerance, (int, float)):
+                tolerance = 0.0
+            if not absolute:
+                tolerance *= poly_data.length
+            output = _clean(poly_data, tolerance if point_merging else None)
+        elif engine == 'vtk':
+            alg = vtk.vtkCleanPolyData()
+            alg.SetPointMerging(point_merging)
+            alg.SetConvertLinesToPoints(lines_to_points)
+            alg.SetConvertPolysToLines(polys_to_lines)
+            alg.SetConvertStripsToPolys(strips_to_polys)
+            if isinstance(tolerance, (int, float)):
+                if absolute:
+                    alg.ToleranceIsAbsoluteOn()
+                    alg.SetAbsoluteTolerance(tolerance)
+                else:
+                    alg.SetTolerance(tolerance)
+            alg.SetInputData(poly_data)
+            _update_alg(alg, progress_bar, 'Cleaning', name='clean')
+            output = _get_output(alg)
+        else:
+            raise ValueError(f"Engine '{engine}' is not supported. Use 'vtk' or 'numpy'.")
 
         # Check output so no segfaults occur
         if output.n_points < 1:
@@ -3790,7 +5600,7 @@ class PolyDataFilters(DataSetFilters):
         dijkstra.SetInputData(poly_data)
         dijkstra.SetStartVertex(start_vertex)
         dijkstra.SetEndVertex(end_vertex)
-        dijkstra.Update()
+        _update_alg(dijkstra, name='geodesic')
         original_ids = vtk_id_list_to_array(dijkstra.GetIdList())
 
         output = _get_output(dijkstra)
@@ -3836,6 +5646,107 @@ class PolyDataFilters(DataSetFilters):
         del sizes
         return distance
 
+    def geodesic_distance_field(poly_data, sources, inplace=False):
+        """Calculate the geodesic distance of all points to a set of sources.
+
+        Distances along the edges of the mesh to the closest of the
+        source vertices are found with a single pass of Dijkstra's
+        algorithm.  This gives the same distances as
+        :func:`PolyDataFilters.geodesic_distance` for every pair of
+        source and point at once, and works with any cells.  Uses
+        ``scipy`` when it is available.
+
+        This adds the ``'GeodesicDistance'`` point array, which is
+        infinite for points that no source reaches, and the
+        ``'GeodesicSource'`` point array of the id of the closest
+        source, ``-1`` for these points.
+
+        Parameters
+        ----------
+        sources : int or sequence of int
+            Indices of the source vertices.
+
+        inplace : bool, optional
+            Add the arrays to this mesh rather than to a copy.
+
+        Return
+        ------
+        mesh : pyvista.PolyData
+            Mesh with the distance arrays.
+
+        Examples
+        --------
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> field = sphere.geodesic_distance_field([0, 1])
+        >>> print(f"{field['GeodesicDistance'][100]:.3f}")
+        0.758
+        >>> field['GeodesicSource'][100]
+        1
+
+        """
+        distances, _, nearest = _geodesic_field(poly_data, sources)
+        mesh = poly_data if inplace else poly_data.copy()
+        mesh.point_arrays['GeodesicDistance'] = distances
+        mesh.point_arrays['GeodesicSource'] = nearest
+        if not inplace:
+            return mesh
+
+    def geodesic_paths(poly_data, start_vertex, end_vertices):
+        """Calculate the geodesic paths from one vertex to many vertices.
+
+        All paths are traced back through a single distance field from
+        the start vertex, see
+        :func:`PolyDataFilters.geodesic_distance_field`, rather than by
+        one search per path.
+
+        Parameters
+        ----------
+        start_vertex : int
+            Vertex index indicating the start point of all paths.
+
+        end_vertices : sequence of int
+            Vertex indices indicating the end point of each path.
+
+        Return
+        ------
+        paths : pyvista.MultiBlock
+            One path per end vertex, like the output of
+            :func:`PolyDataFilters.geodesic`.  The points of each path
+            run from the end vertex to the start vertex and their
+            ``vtkOriginalPointIds`` array holds the input point ids.
+            Paths to unreachable vertices are empty.
+
+        Examples
+        --------
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> paths = sphere.geodesic_paths(0, [100, 200, 300])
+        >>> [path.n_points for path in paths]
+        [16, 4, 20]
+
+        """
+        end_vertices = np.asarray(end_vertices, dtype=pyvista.ID_TYPE).ravel()
+        if end_vertices.size and (end_vertices.min() < 0 or
+                                  end_vertices.max() >= poly_data.n_points):
+            raise IndexError('Invalid indices.')
+        _, predecessors, nearest = _geodesic_field(poly_data, start_vertex)
+        paths = pyvista.MultiBlock()
+        for end_vertex in end_vertices:
+            ids = []
+            if nearest[end_vertex] >= 0:
+                ids.append(end_vertex)
+                while predecessors[ids[-1]] >= 0:
+                    ids.append(predecessors[ids[-1]])
+            ids = np.array(ids, dtype=pyvista.ID_TYPE)
+            path = pyvista.PolyData()
+            if ids.size:
+                path.points = poly_data.points[ids]
+                path.lines = np.append(ids.size, np.arange(ids.size))
+            path.point_arrays['vtkOriginalPointIds'] = ids
+            paths.append(path)
+        return paths
+
     def ray_trace(poly_data, origin, end_point, first_point=False, plot=False,
                   off_screen=False):
         """Perform a single ray trace calculation.
@@ -3986,25 +5897,83 @@ class PolyDataFilters(DataSetFilters):
             origins, directions, multiple_hits=not first_point
         )
         if retry:
-            ray_tuples = [(id_r, l, id_t) for id_r, l, id_t in zip(index_ray, locations, index_tri)]
-            for id_r in range(len(origins)):
-                if id_r not in index_ray:
-                    origin = np.array(origins[id_r])
-                    vector = np.array(directions[id_r])
-                    unit_vector = vector / np.sqrt(np.sum(np.power(vector, 2)))
-                    second_point = origin + (unit_vector * poly_data.length)
-                    locs, indexes = poly_data.ray_trace(origin, second_point, first_point=first_point)
-                    if locs.any():
-                        if first_point:
-                            locs = locs.reshape([1, 3])
-                        for loc, id_t in zip(locs, indexes):
-                            ray_tuples.append((id_r, loc, id_t))
-            sorted_results = sorted(ray_tuples, key=lambda x: x[0])
-            locations = np.array([loc for id_r, loc, id_t in sorted_results])
-            index_ray = np.array([id_r for id_r, loc, id_t in sorted_results])
-            index_tri = np.array([id_t for id_r, loc, id_t in sorted_results])
+            # trace the missed rays over the length of the mesh in one batch
+            origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+            directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+            missed = np.setdiff1d(np.arange(len(origins)), index_ray)
+            locs, rays, cells = PolyDataFilters.cast_rays(
+                poly_data, origins[missed], directions[missed], first_point=first_point,
+                max_distance=poly_data.length)
+            index_ray = np.concatenate([index_ray, missed[rays]])
+            order = np.argsort(index_ray, kind='stable')
+            locations = np.concatenate([np.reshape(locations, (-1, 3)), locs])[order]
+            index_ray = index_ray[order]
+            index_tri = np.concatenate([index_tri, cells]).astype(int)[order]
         return locations, index_ray, index_tri
 
+    def cast_rays(poly_data, origins, directions, first_point=False,
+                  max_distance=None, n_threads=None):
+        """Intersect many rays with the polygons of this mesh at once.
+
+        Unlike :func:`PolyDataFilters.multi_ray_trace`, this requires no
+        additional dependency.  Rays are traced with a bounding volume
+        hierarchy built with numpy, which is cached on the mesh until
+        it is modified, and chunks of rays are traced in parallel.
+        Polygons are assumed to be convex.
+
+        Parameters
+        ----------
+        origins : np.ndarray or list
+            Starting point for each ray.
+
+        directions : np.ndarray or list
+            Direction vector for each ray.
+
+        first_point : bool, optional
+            Returns the closest intersection of each ray only.
+
+        max_distance : float or np.ndarray, optional
+            Ignore intersections further than this from the origin of
+            all or each ray.  Rays are unbounded by default.
+
+        n_threads : int, optional
+            Number of threads used.  Defaults to the number of CPUs.
+
+        Return
+        ------
+        intersection_points : np.ndarray
+            Location of the intersection points, ordered by ray and by
+            distance along each ray.
+
+        intersection_rays : np.ndarray
+            Indices of the ray for each intersection point.
+
+        intersection_cells : np.ndarray
+            Indices of the intersection cells.
+
+        Examples
+        --------
+        Find which of three rays from the origin hit a sphere first.
+
+        >>> import pyvista as pv
+        >>> sphere = pv.Sphere()
+        >>> points, rays, cells = sphere.cast_rays([[0, 0, 0]]*3,
+        ...                                        [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        ...                                        first_point=True)
+        >>> rays
+        array([0, 1, 2])
+
+        """
+        bvh, cell_ids = _ray_bvh(poly_data)
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        rays, triangles, distances = bvh.intersect(origins, directions,
+                                                   first_point=first_point,
+                                                   max_distance=max_distance,
+                                                   n_threads=n_threads)
+        points = origins[rays] + directions[rays]*distances[:, None]
+        return points, rays, cell_ids[triangles]
+
     def plot_boundaries(poly_data, edge_color="red", **kwargs):
         """Plot boundaries of a mesh.
 
@@ -4045,7 +6014,9 @@ class PolyDataFilters(DataSetFilters):
     def remove_points(poly_data, remove, mode='any', keep_scalars=True, inplace=False):
         """Rebuild a mesh by removing points.
 
-        Only valid for all-triangle meshes.
+        Cells of any type, such as vertices, lines, triangles, quads and
+        polygons, are supported.  Points no longer used by a cell are
+        removed as well.
 
         Parameters
         ----------
@@ -4055,7 +6026,7 @@ class PolyDataFilters(DataSetFilters):
 
         mode : str, optional
             When 'all', only faces containing all points flagged for
-            removal will be removed.  Default 'all'
+            removal will be removed.  Default 'any'
 
         keep_scalars : bool, optional
             When True, point and cell scalars will be passed on to the
@@ -4068,11 +6039,11 @@ class PolyDataFilters(DataSetFilters):
         ------
         mesh : pyvista.PolyData
             Mesh without the points flagged for removal.  Not returned
-            when inplace=False.
+            when inplace=True.
 
         ridx : np.ndarray
             Indices of new points relative to the original mesh.  Not
-            returned when inplace=False.
+            returned when inplace=True.
 
         Examples
         --------
@@ -4083,52 +6054,7 @@ class PolyDataFilters(DataSetFilters):
         >>> reduced_sphere = sphere.remove_points(range(100))
 
         """
-        remove = np.asarray(remove)
-
-        # np.asarray will eat anything, so we have to weed out bogus inputs
-        if not issubclass(remove.dtype.type, (np.bool_, np.integer)):
-            raise TypeError('Remove must be either a mask or an integer array-like')
-
-        if remove.dtype == np.bool_:
-            if remove.size != poly_data.n_points:
-                raise ValueError('Mask different size than n_points')
-            remove_mask = remove
-        else:
-            remove_mask = np.zeros(poly_data.n_points, np.bool_)
-            remove_mask[remove] = True
-
-        if not poly_data.is_all_triangles():
-            raise NotAllTrianglesError
-
-        f = poly_data.faces.reshape(-1, 4)[:, 1:]
-        vmask = remove_mask.take(f)
-        if mode == 'all':
-            fmask = ~(vmask).all(1)
-        else:
-            fmask = ~(vmask).any(1)
-
-        # Regenerate face and point arrays
-        uni = np.unique(f.compress(fmask, 0), return_inverse=True)
-        new_points = poly_data.points.take(uni[0], 0)
-
-        nfaces = fmask.sum()
-        faces = np.empty((nfaces, 4), dtype=pyvista.ID_TYPE)
-        faces[:, 0] = 3
-        faces[:, 1:] = np.reshape(uni[1], (nfaces, 3))
-
-        newmesh = pyvista.PolyData(new_points, faces, deep=True)
-        ridx = uni[0]
-
-        # Add scalars back to mesh if requested
-        if keep_scalars:
-            for key in poly_data.point_arrays:
-                newmesh.point_arrays[key] = poly_data.point_arrays[key][ridx]
-
-            for key in poly_data.cell_arrays:
-                try:
-                    newmesh.cell_arrays[key] = poly_data.cell_arrays[key][fmask]
-                except:
-                    logging.warning(f'Unable to pass cell key {key} onto reduced mesh')
+        newmesh, ridx = _remove_points(poly_data, remove, mode, keep_scalars)
 
         # Return vtk surface and reverse indexing array
         if inplace:
@@ -4221,7 +6147,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetBoundingTriangulation(bound)
         if edge_source is not None:
             alg.SetSourceData(edge_source)
-        _update_alg(alg, progress_bar, 'Computing 2D Triangulation')
+        _update_alg(alg, progress_bar, 'Computing 2D Triangulation', name='delaunay_2d')
 
         # Sometimes lines are given in the output. The `.triangulate()` filter cleans those
         mesh = _get_output(alg).triangulate()
@@ -4274,7 +6200,7 @@ class PolyDataFilters(DataSetFilters):
         """
         alg = vtk.vtkAppendArcLength()
         alg.SetInputData(poly_data)
-        alg.Update()
+        _update_alg(alg, name='compute_arc_length')
         return _get_output(alg)
 
 
@@ -4395,7 +6321,7 @@ class PolyDataFilters(DataSetFilters):
                 alg.SetGenerateTCoordsToUseLength()
         else:
             alg.SetGenerateTCoordsToOff()
-        alg.Update()
+        _update_alg(alg, name='ribbon')
         return _get_output(alg)
 
     def extrude(poly_data, vector, inplace=False, progress_bar=False):
@@ -4453,7 +6379,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetExtrusionTypeToVectorExtrusion()
         alg.SetVector(*vector)
         alg.SetInputData(poly_data)
-        _update_alg(alg, progress_bar, 'Extruding')
+        _update_alg(alg, progress_bar, 'Extruding', name='extrude')
         output = pyvista.wrap(alg.GetOutput())
         if not inplace:
             return output
@@ -4520,7 +6446,7 @@ class PolyDataFilters(DataSetFilters):
         alg.SetPassCellDataAsFieldData(pass_cell_data)
         alg.SetPassThroughCellIds(pass_cell_ids)
         alg.SetPassThroughPointIds(pass_point_ids)
-        alg.Update()
+        _update_alg(alg, name='strip')
         return _get_output(alg)
 
 @abstract_class
@@ -4543,6 +6469,105 @@ class UnstructuredGridFilters(DataSetFilters):
                                                           bound=bound,
                                                           progress_bar=progress_bar)
 
+    def remove_points(ugrid, remove, mode='any', keep_scalars=True, inplace=False):
+        """Rebuild a grid by removing points.
+
+        Cells of any type are supported.  Points no longer used by a
+        cell are removed as well.
+
+        Parameters
+        ----------
+        remove : np.ndarray
+            If remove is a bool array, points that are True will be
+            removed.  Otherwise, it is treated as a list of indices.
+
+        mode : str, optional
+            When 'all', only cells containing all points flagged for
+            removal will be removed.  Default 'any'
+
+        keep_scalars : bool, optional
+            When True, point and cell scalars will be passed on to the
+            new grid.
+
+        inplace : bool, optional
+            Updates grid in-place while returning nothing.
+
+        Return
+        ------
+        grid : pyvista.UnstructuredGrid
+            Grid without the points flagged for removal.  Not returned
+            when inplace=True.
+
+        ridx : np.ndarray
+            Indices of new points relative to the original grid.  Not
+            returned when inplace=True.
+
+        Examples
+        --------
+        Remove the points of a beam below ``z = 1``
+
+        >>> from pyvista import examples
+        >>> grid = examples.load_hexbeam()
+        >>> reduced, ridx = grid.remove_points(grid.points[:, 2] < 1)
+        >>> reduced.n_cells
+        32
+
+        """
+        newgrid, ridx = _remove_points(ugrid, remove, mode, keep_scalars)
+        if inplace:
+            ugrid.overwrite(newgrid)
+        else:
+            return newgrid, ridx
+
+    def clean(ugrid, tolerance=None, absolute=True, inplace=False):
+        """Merge duplicate points, remove unused points and degenerate cells.
+
+        Points falling in the same cell of a grid of spacing
+        ``tolerance`` are merged by sorting their quantized coordinates,
+        and take the data of their first point used by a cell.  Cells
+        left with too few distinct points for their dimension, such as a
+        tetrahedron with three distinct points, are removed.  Grids with
+        polyhedra are not supported.
+
+        Parameters
+        ----------
+        tolerance : float, optional
+            Merging tolerance.  Only equal points are merged by default.
+
+        absolute : bool, optional
+            Control if ``tolerance`` is an absolute distance or a
+            fraction of the length of the bounding box.
+
+        inplace : bool, optional
+            Updates grid in-place while returning nothing.
+
+        Return
+        ------
+        grid : pyvista.UnstructuredGrid
+            Cleaned grid.  None when inplace=True
+
+        Examples
+        --------
+        Merge the coincident points of two copies of a grid.
+
+        >>> import pyvista
+        >>> from pyvista import examples
+        >>> hexbeam = examples.load_hexbeam()
+        >>> grid = hexbeam.merge(hexbeam, merge_points=False).clean()
+        >>> grid.n_points == hexbeam.n_points
+        True
+
+        """
+        if tolerance is None:
+            tolerance = 0.0
+        if not absolute:
+            tolerance *= ugrid.length
+        output = _clean(ugrid, tolerance)
+        if inplace:
+            ugrid.overwrite(output)
+        else:
+            return output
+
 
 @abstract_class
 class UniformGridFilters(DataSetFilters):
@@ -4585,7 +6610,7 @@ class UniformGridFilters(DataSetFilters):
             alg.SetStandardDeviations(std_dev)
         else:
             alg.SetStandardDeviations(std_dev, std_dev, std_dev)
-        _update_alg(alg, progress_bar, 'Performing Gaussian Smoothing')
+        _update_alg(alg, progress_bar, 'Performing Gaussian Smoothing', name='gaussian_smooth')
         return _get_output(alg)
 
     def extract_subset(dataset, voi, rate=(1, 1, 1), boundary=False):
@@ -4624,7 +6649,7 @@ class UniformGridFilters(DataSetFilters):
         alg.SetInputDataObject(dataset)
         alg.SetSampleRate(rate)
         alg.SetIncludeBoundary(boundary)
-        alg.Update()
+        _update_alg(alg, name='extract_subset')
         result = _get_output(alg)
         # Adjust for the confusing issue with the extents
         #   see https://gitlab.kitware.com/vtk/vtk/-/issues/17938
@@ -275,6 +275,46 @@ class PolyData(vtkPolyData, PointSet, PolyDataFilters):
         else:
             self.SetPolys(CellArray(faces))
 
+    def to_trimesh(self, process=False):
+        """Convert this mesh to a :class:`trimesh.Trimesh`.
+
+        Non-triangular meshes are triangulated first.  For an all
+        triangle mesh with double precision points, the vertices and
+        (on VTK 9) the faces are shared with this mesh rather than
+        copied.
+
+        Parameters
+        ----------
+        process : bool, optional
+            Passed to ``trimesh.Trimesh``.  When True, trimesh merges
+            duplicate vertices, which always copies the arrays.
+
+        Return
+        ------
+        tmesh : trimesh.Trimesh
+            Triangular surface mesh.
+
+        Examples
+        --------
+        >>> import pyvista
+        >>> sphere = pyvista.Sphere()
+        >>> tmesh = sphere.to_trimesh()  # doctest:+SKIP
+
+        """
+        try:
+            import trimesh
+        except ImportError:
+            raise ImportError('To use to_trimesh please install trimesh with:\n'
+                              '\tpip install trimesh')
+
+        mesh = self if self.is_all_triangles() else self.triangulate()
+        polys = mesh.GetPolys()
+        if hasattr(polys, 'GetConnectivityArray'):  # available >= VTK9
+            faces = vtk_to_numpy(polys.GetConnectivityArray()).reshape(-1, 3)
+        else:
+            faces = vtk_to_numpy(polys.GetData()).reshape(-1, 4)[:, 1:]
+        return trimesh.Trimesh(np.asarray(mesh.points), faces, process=process)
+
     def __sub__(self, cutting_mesh):
         """Subtract two meshes."""
         return self.boolean_cut(cutting_mesh)
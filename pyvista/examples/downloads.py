@@ -73,7 +73,7 @@ def _download_and_read(filename, texture=False, file_format=None):
     saved_file, _ = _download_file(filename)
     if texture:
         return pyvista.read_texture(saved_file)
-    return pyvista.read(saved_file, file_format=file_format)
+    return pyvista.read(saved_file, file_format=file_format, cache=True)
 
 
 ###############################################################################
@@ -6,5 +6,6 @@ from .features import *
 from .fileio import *
 from .geometric_objects import *
 from .helpers import *
+from .interpolation import InterpolationOperator
 from .parametric_objects import *
 from .sphinx_gallery import Scraper, _get_sg_image_scraper
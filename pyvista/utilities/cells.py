@@ -1,5 +1,8 @@
 """pyvista wrapping of vtkCellArray."""
+import collections
+
 import numpy as np
+import vtk
 from vtk.util.numpy_support import numpy_to_vtkIdTypeArray, vtk_to_numpy
 from vtk import vtkCellArray
 
@@ -28,6 +31,42 @@ def numpy_to_idarr(ind, deep=False, return_ind=False):
     return vtk_idarr
 
 
+def cell_array_to_numpy(cell_array):
+    """Return the offsets and connectivity arrays of a vtkCellArray.
+
+    On VTK 9 these are views of the arrays stored by VTK.  Older
+    versions of VTK store the legacy layout, which is converted.
+
+    Parameters
+    ----------
+    cell_array : vtk.vtkCellArray
+        Cell array to convert.
+
+    Return
+    ------
+    offsets : np.ndarray
+        Start of each cell in ``connectivity``, followed by its length.
+
+    connectivity : np.ndarray
+        Point ids of all cells, concatenated.
+
+    """
+    if hasattr(cell_array, 'GetConnectivityArray'):  # available >= VTK9
+        return (vtk_to_numpy(cell_array.GetOffsetsArray()),
+                vtk_to_numpy(cell_array.GetConnectivityArray()))
+    legacy = vtk_to_numpy(cell_array.GetData())
+    starts = []
+    c = 0
+    while c < legacy.size:
+        starts.append(c)
+        c += legacy[c] + 1
+    starts = np.array(starts, pyvista.ID_TYPE)
+    mask = np.ones(legacy.size, np.bool_)
+    mask[starts] = False
+    offsets = np.append(starts - np.arange(starts.size), mask.sum())
+    return offsets.astype(pyvista.ID_TYPE), legacy[mask]
+
+
 class CellArray(vtkCellArray):
     """pyvista wrapping of vtkCellArray.
 
@@ -68,6 +107,52 @@ class CellArray(vtkCellArray):
 
         self.SetCells(n_cells, vtk_idarr)
 
+    @classmethod
+    def from_arrays(cls, offsets, connectivity, deep=False):
+        """Create a CellArray from offset and connectivity arrays.
+
+        On VTK 9, these arrays are used directly by VTK and are not
+        copied when they are contiguous ``ID_TYPE`` arrays and
+        ``deep=False``.  Older versions of VTK require the legacy
+        layout, which is built from the arrays.
+
+        Parameters
+        ----------
+        offsets : np.ndarray
+            Start of each cell in ``connectivity`` followed by the
+            total length of ``connectivity``, i.e. ``n_cells + 1``
+            entries.
+
+        connectivity : np.ndarray
+            Point ids of all cells, concatenated.
+
+        deep : bool, optional
+            Copy the input arrays.
+
+        Examples
+        --------
+        Create a cell array containing two triangles.
+
+        >>> import numpy as np
+        >>> from pyvista.utilities.cells import CellArray
+        >>> cellarr = CellArray.from_arrays(np.array([0, 3, 6]), np.arange(6))
+
+        """
+        if not hasattr(vtkCellArray, 'GetConnectivityArray'):  # VTK < 9
+            offsets = np.asarray(offsets)
+            legacy = np.insert(connectivity, offsets[:-1], np.diff(offsets))
+            return cls(legacy, offsets.size - 1, deep)
+        vtk_offsets, offsets = numpy_to_idarr(offsets, deep=deep, return_ind=True)
+        vtk_conn, connectivity = numpy_to_idarr(connectivity, deep=deep, return_ind=True)
+        cellarr = cls()
+        cellarr.SetData(vtk_offsets, vtk_conn)
+        if not deep:
+            # VTK shares the buffers through its own array objects, so
+            # the numpy arrays must be kept alive with those objects
+            cellarr.GetOffsetsArray()._numpy_reference = offsets
+            cellarr.GetConnectivityArray()._numpy_reference = connectivity
+        return cellarr
+
     @property
     def cells(self):
         """Return a numpy array of the cells."""
@@ -77,3 +162,251 @@ class CellArray(vtkCellArray):
     def n_cells(self):
         """Return the number of cells."""
         return self.GetNumberOfCells()
+
+
+class Adjacency(collections.namedtuple('Adjacency', ['indptr', 'indices'])):
+    """Compressed sparse row (CSR) adjacency between points or cells.
+
+    The entries of row ``i`` are ``indices[indptr[i]:indptr[i + 1]]``,
+    sorted in ascending order.  Unpacks as ``indptr, indices``.
+
+    Attributes
+    ----------
+    indptr : np.ndarray
+        Start of each row in ``indices``, followed by its length.
+
+    indices : np.ndarray
+        Column indices of all rows, concatenated.
+
+    shape : tuple
+        Number of rows and columns.
+
+    """
+
+    def __new__(cls, indptr, indices, shape):
+        """Initialize the adjacency."""
+        adjacency = super().__new__(cls, indptr, indices)
+        adjacency.shape = tuple(shape)
+        return adjacency
+
+    def __getnewargs__(self):
+        """Return the arguments used to copy and pickle the adjacency."""
+        return self.indptr, self.indices, self.shape
+
+    @property
+    def counts(self):
+        """Return the number of entries of each row."""
+        return np.diff(self.indptr)
+
+    def row(self, i):
+        """Return the entries of row ``i``."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def to_sparse(self):
+        """Return the adjacency as a ``scipy.sparse.csr_matrix`` of ones.
+
+        Requires ``scipy``.
+
+        """
+        from scipy.sparse import csr_matrix
+        data = np.ones(self.indices.size, dtype=np.int8)
+        return csr_matrix((data, self.indices, self.indptr), shape=self.shape)
+
+
+def _csr_from_pairs(rows, columns, shape):
+    """Return the adjacency with an entry for each unique pair."""
+    # sorting a single key is much faster than a lexicographic sort
+    keys = np.unique(np.asarray(rows, dtype=pyvista.ID_TYPE) * max(shape[1], 1) +
+                     np.asarray(columns, dtype=pyvista.ID_TYPE))
+    rows, columns = np.divmod(keys, max(shape[1], 1))
+    indptr = np.zeros(shape[0] + 1, dtype=pyvista.ID_TYPE)
+    np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+    return Adjacency(indptr, columns, shape)
+
+
+# point order of the hexahedra and quads of structured grids in voxels and pixels
+_STRUCTURED_CELL_ORDER = {vtk.VTK_VOXEL: (vtk.VTK_HEXAHEDRON, [0, 1, 3, 2, 4, 5, 7, 6]),
+                          vtk.VTK_PIXEL: (vtk.VTK_QUAD, [0, 1, 3, 2])}
+
+
+def _structured_cells(dimensions):
+    """Return the offsets, connectivity and types of a structured grid.
+
+    The points of each cell are ordered as in ``GetCellPoints``, with
+    the first axis varying fastest, which is the order of voxels and
+    pixels.
+
+    """
+    dimensions = np.asarray(dimensions, dtype=pyvista.ID_TYPE)
+    strides = np.cumprod(np.append(1, dimensions[:-1]))
+    active = dimensions > 1
+    cell_types = {0: vtk.VTK_VERTEX, 1: vtk.VTK_LINE, 2: vtk.VTK_PIXEL, 3: vtk.VTK_VOXEL}
+    cell_type = cell_types[int(active.sum())]
+
+    # index of the first point of each cell, first axis fastest
+    ranges = [np.arange(dim - 1 if act else 1) * stride
+              for dim, act, stride in zip(dimensions, active, strides)]
+    first = (ranges[0][None, None, :] + ranges[1][None, :, None] +
+             ranges[2][:, None, None]).ravel()
+    corners = np.zeros(1, dtype=pyvista.ID_TYPE)
+    for stride in strides[active]:
+        corners = np.concatenate((corners, corners + stride))
+
+    connectivity = (first[:, None] + corners).ravel()
+    offsets = np.arange(first.size + 1, dtype=pyvista.ID_TYPE) * corners.size
+    cell_types = np.full(first.size, cell_type, dtype=np.uint8)
+    return offsets, connectivity, cell_types
+
+
+def _polydata_cells(poly_data):
+    """Return the offsets, connectivity and types of a polydata.
+
+    Cells are ordered as verts, lines, polys and strips, which is the
+    order of their ids.
+
+    """
+    offsets, connectivity, cell_types = [np.zeros(1, pyvista.ID_TYPE)], [], []
+    for cell_array, single, multiple in (
+            (poly_data.GetVerts(), {1: vtk.VTK_VERTEX}, vtk.VTK_POLY_VERTEX),
+            (poly_data.GetLines(), {2: vtk.VTK_LINE}, vtk.VTK_POLY_LINE),
+            (poly_data.GetPolys(), {3: vtk.VTK_TRIANGLE, 4: vtk.VTK_QUAD}, vtk.VTK_POLYGON),
+            (poly_data.GetStrips(), {}, vtk.VTK_TRIANGLE_STRIP)):
+        if not cell_array.GetNumberOfCells():
+            continue
+        cell_offsets, cell_connectivity = cell_array_to_numpy(cell_array)
+        sizes = np.diff(cell_offsets)
+        types = np.full(sizes.size, multiple, dtype=np.uint8)
+        for size, cell_type in single.items():
+            types[sizes == size] = cell_type
+        offsets.append(cell_offsets[1:] + offsets[-1][-1])
+        connectivity.append(cell_connectivity)
+        cell_types.append(types)
+    if not connectivity:
+        return offsets[0], np.empty(0, pyvista.ID_TYPE), np.empty(0, np.uint8)
+    return np.concatenate(offsets), np.concatenate(connectivity), np.concatenate(cell_types)
+
+
+def dataset_cells(dataset):
+    """Return the point ids and types of all cells of a dataset.
+
+    Parameters
+    ----------
+    dataset : pyvista.Common
+        Any dataset.
+
+    Return
+    ------
+    offsets : np.ndarray
+        Start of each cell in ``connectivity``, followed by its length.
+
+    connectivity : np.ndarray
+        Point ids of all cells, concatenated.
+
+    cell_types : np.ndarray
+        VTK type of each cell.  Structured datasets report voxels and
+        pixels, whose point order matches ``connectivity``.
+
+    """
+    if isinstance(dataset, vtk.vtkPolyData):
+        return _polydata_cells(dataset)
+    if isinstance(dataset, vtk.vtkUnstructuredGrid):
+        offsets, connectivity = cell_array_to_numpy(dataset.GetCells())
+        return offsets, connectivity, vtk_to_numpy(dataset.GetCellTypesArray())
+    if isinstance(dataset, (vtk.vtkImageData, vtk.vtkRectilinearGrid,
+                            vtk.vtkStructuredGrid)):
+        return _structured_cells(dataset.GetDimensions())
+    # other datasets only expose their cells one at a time
+    ids = vtk.vtkIdList()
+    cells = []
+    for i in range(dataset.GetNumberOfCells()):
+        dataset.GetCellPoints(i, ids)
+        cells.append([ids.GetId(j) for j in range(ids.GetNumberOfIds())])
+    offsets = np.cumsum([0] + [len(cell) for cell in cells]).astype(pyvista.ID_TYPE)
+    connectivity = np.array([pt for cell in cells for pt in cell], dtype=pyvista.ID_TYPE)
+    cell_types = np.array([dataset.GetCellType(i) for i in range(len(cells))], dtype=np.uint8)
+    return offsets, connectivity, cell_types
+
+
+def _cell_dimensions(cell_types):
+    """Return the topological dimension of each cell type."""
+    cell_types = np.asarray(cell_types)
+    dimensions = np.zeros(cell_types.shape, dtype=int)
+    cell = vtk.vtkGenericCell()
+    for cell_type in np.unique(cell_types):
+        cell.SetCellType(int(cell_type))
+        dimensions[cell_types == cell_type] = cell.GetCellDimension()
+    return dimensions
+
+
+def _edge_chains(cell_type, size):
+    """Return the local point ids along each edge of a cell type.
+
+    Each edge is listed from one end to the other, so that consecutive
+    ids are connected.  Returns ``None`` when the edges cannot be
+    derived from the type and number of points alone.
+
+    """
+    if cell_type in (vtk.VTK_POLYHEDRON, vtk.VTK_CONVEX_POINT_SET):
+        return None
+    if cell_type == vtk.VTK_TRIANGLE_STRIP:
+        return [[i, i + step] for step in (1, 2) for i in range(size - step)]
+    cell = vtk.vtkGenericCell()
+    cell.SetCellType(cell_type)
+    cell.GetPointIds().SetNumberOfIds(size)
+    cell.GetPoints().SetNumberOfPoints(size)
+    for i in range(size):
+        cell.GetPointIds().SetId(i, i)
+        cell.GetPoints().SetPoint(i, 0.0, 0.0, 0.0)
+    if cell.GetCellDimension() == 1:
+        edges = [list(range(size))]
+    else:
+        edges = []
+        for i in range(cell.GetNumberOfEdges()):
+            edge = cell.GetEdge(i)
+            edges.append([edge.GetPointId(j) for j in range(edge.GetNumberOfPoints())])
+    if not cell.IsLinear():
+        # nonlinear edges list both ends first, then the interior points
+        edges = [edge[:1] + edge[2:] + edge[1:2] for edge in edges]
+    return edges
+
+
+def cell_edges(dataset):
+    """Return the pairs of point ids joined by an edge of a cell.
+
+    Edges shared by several cells are repeated.  Edges of 1D cells
+    connect their consecutive points and vertices have none.
+
+    Parameters
+    ----------
+    dataset : pyvista.Common
+        Any dataset.
+
+    Return
+    ------
+    edges : np.ndarray
+        ``(n, 2)`` array of point ids.
+
+    """
+    offsets, connectivity, cell_types = dataset_cells(dataset)
+    sizes = np.diff(offsets)
+    edges = [np.empty((0, 2), dtype=pyvista.ID_TYPE)]
+    # a single key per cell is much faster to make unique than pairs
+    keys = cell_types.astype(pyvista.ID_TYPE) * (sizes.max(initial=0) + 1) + sizes
+    for key in np.unique(keys):
+        cell_type, size = divmod(key, sizes.max(initial=0) + 1)
+        cells = np.nonzero(keys == key)[0]
+        chains = _edge_chains(int(cell_type), int(size))
+        if chains is None:
+            # the edges of polyhedra depend on their faces
+            for cell_id in cells:
+                cell = dataset.GetCell(int(cell_id))
+                for i in range(cell.GetNumberOfEdges()):
+                    ids = cell.GetEdge(i).GetPointIds()
+                    edges.append([[ids.GetId(0), ids.GetId(1)]])
+            continue
+        local = np.array([(chain[j], chain[j + 1]) for chain in chains
+                          for j in range(len(chain) - 1)], dtype=pyvista.ID_TYPE)
+        if local.size:
+            points = connectivity[offsets[cells][:, None] + local.ravel()]
+            edges.append(points.reshape(-1, 2))
+    return np.concatenate([np.asarray(edge, dtype=pyvista.ID_TYPE) for edge in edges])
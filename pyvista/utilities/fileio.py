@@ -1,10 +1,15 @@
 """Contains a dictionary that maps file extensions to VTK readers."""
 
+import hashlib
 import pathlib
 import os
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 
 import numpy as np
 import vtk
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
 import pyvista
 
@@ -103,6 +108,99 @@ def set_vtkwriter_mode(vtk_writer, use_binary=True):
     return vtk_writer
 
 
+class _WriterPool:
+    """Managed thread pool for background file writes.
+
+    Submission blocks once ``max_pending`` writes are queued or
+    running, so a producer cannot accumulate an unbounded number of
+    dataset snapshots in memory.
+
+    """
+
+    def __init__(self, max_workers=2, max_pending=8):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='pyvista-writer')
+            return self._executor
+
+    def submit(self, func, *args, **kwargs):
+        """Submit a write, blocking while the pending queue is full."""
+        executor = self._get_executor()
+        self._slots.acquire()
+        try:
+            future = executor.submit(func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def wait(self):
+        """Wait for the writes pending when called, without blocking submissions."""
+        with self._lock:
+            pending = list(self._pending)
+        wait_futures(pending)
+
+    def shutdown(self, wait=True):
+        """Shut down the pool, optionally waiting for pending writes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_WRITER_POOL = _WriterPool()
+
+
+def set_async_writers(max_workers=2, max_pending=8):
+    """Configure the thread pool used by ``save_async``.
+
+    Any writes submitted to the previous pool are allowed to finish.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of writer threads.
+
+    max_pending : int, optional
+        Maximum number of queued or running writes.  Further calls to
+        ``save_async`` block until a slot is free.
+
+    """
+    global _WRITER_POOL
+    if max_workers < 1 or max_pending < 1:
+        raise ValueError('`max_workers` and `max_pending` must be positive.')
+    old_pool = _WRITER_POOL
+    _WRITER_POOL = _WriterPool(max_workers, max_pending)
+    old_pool.shutdown(wait=True)
+
+
+def wait_for_writes():
+    """Block until all writes submitted with ``save_async`` are complete."""
+    _WRITER_POOL.wait()
+
+
+def _submit_write(func, *args, **kwargs):
+    """Submit a write to the managed writer pool and return its future."""
+    return _WRITER_POOL.submit(func, *args, **kwargs)
+
+
 def standard_reader_routine(reader, filename, attrs=None):
     """Use a given reader in the common VTK reading pipeline routine.
 
@@ -160,7 +258,112 @@ def read_legacy(filename):
     return pyvista.wrap(output)
 
 
-def read(filename, attrs=None, file_format=None):
+_CACHE_EXTENSIONS = (('vtkUnstructuredGrid', '.vtu'), ('vtkPolyData', '.vtp'),
+                     ('vtkImageData', '.vti'), ('vtkRectilinearGrid', '.vtr'),
+                     ('vtkStructuredGrid', '.vts'))
+
+
+def _read_cache_key(filename, attrs, file_format):
+    """Hash the absolute path, size and modification time of a file."""
+    stat = os.stat(filename)
+    key = f'{filename}|{stat.st_size}|{stat.st_mtime_ns}|{attrs!r}|{file_format}'
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _evict_read_cache(cache_path, max_size):
+    """Remove the least recently used cache entries above ``max_size``."""
+    entries = []
+    for name in os.listdir(cache_path):
+        path = os.path.join(cache_path, name)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:  # pragma: no cover
+            pass
+
+
+def _dataset_cache_key(dataset, *params):
+    """Hash the geometry, arrays and the parameters of a filter of a dataset."""
+    digest = hashlib.sha1(f'{type(dataset).__name__}|{params!r}'.encode())
+    digest.update(np.ascontiguousarray(dataset.points).tobytes())
+    if isinstance(dataset, vtk.vtkPolyData):
+        cells = (dataset.GetVerts(), dataset.GetLines(), dataset.GetPolys(),
+                 dataset.GetStrips())
+    else:
+        cells = (dataset.GetCells(),)
+    for cell_array in cells:
+        digest.update(vtk_to_numpy(cell_array.GetData()).tobytes())
+    for attributes in (dataset.point_arrays, dataset.cell_arrays):
+        for name in attributes:
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(attributes[name]).tobytes())
+    return digest.hexdigest()
+
+
+def _load_cached(key):
+    """Return the dataset cached under ``key``, or ``None``."""
+    for _, ext in _CACHE_EXTENSIONS:
+        cached = os.path.join(pyvista.READ_CACHE_PATH, key + ext)
+        if os.path.isfile(cached):
+            # mark as recently used for eviction
+            os.utime(cached)
+            return read(cached)
+
+
+def _store_cached(mesh, key, description):
+    """Store a dataset in the cache under ``key``."""
+    cache_path = pyvista.READ_CACHE_PATH
+    writers = getattr(mesh, '_WRITERS', None) or {}
+    for vtk_class, ext in _CACHE_EXTENSIONS:
+        if mesh.IsA(vtk_class) and ext in writers:
+            break
+    else:
+        return
+
+    # store as uncompressed appended binary XML, which loads without parsing
+    cached = os.path.join(cache_path, key + ext)
+    tmp_file = os.path.join(cache_path, f'{key}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        os.makedirs(cache_path, exist_ok=True)
+        writer = mesh._WRITERS[ext]()
+        writer.SetFileName(tmp_file)
+        writer.SetInputData(mesh)
+        writer.SetDataModeToAppended()
+        writer.EncodeAppendedDataOff()
+        writer.SetCompressorTypeToNone()
+        writer.Write()
+        os.replace(tmp_file, cached)
+        _evict_read_cache(cache_path, pyvista.READ_CACHE_MAX_SIZE)
+    except OSError as e:
+        warnings.warn(f'Unable to cache {description} in {cache_path}:\n{e}')
+        if os.path.isfile(tmp_file):
+            os.remove(tmp_file)
+
+
+def _read_cached(filename, attrs=None, file_format=None):
+    """Read a file through the on-disk read cache."""
+    key = _read_cache_key(filename, attrs, file_format)
+    mesh = _load_cached(key)
+    if mesh is None:
+        mesh = read(filename, attrs=attrs, file_format=file_format)
+        _store_cached(mesh, key, f'"{filename}"')
+    return mesh
+
+
+def clear_read_cache():
+    """Remove all files cached by ``pyvista.read(..., cache=True)``."""
+    if os.path.isdir(pyvista.READ_CACHE_PATH):
+        _evict_read_cache(pyvista.READ_CACHE_PATH, 0)
+
+
+def read(filename, attrs=None, file_format=None, cache=False):
     """Read any VTK file.
 
     It will figure out what reader to use then wrap the VTK object for
@@ -182,6 +385,13 @@ def read(filename, attrs=None, file_format=None):
     file_format : str, optional
         Format of file to read with meshio.
 
+    cache : bool, optional
+        Keep a binary copy of the parsed dataset in
+        ``pyvista.READ_CACHE_PATH`` and load it instead of reparsing
+        the file while its size and modification time are unchanged.
+        The cache is limited to ``pyvista.READ_CACHE_MAX_SIZE`` bytes,
+        evicting the least recently used entries first.
+
     Examples
     --------
     Load an example mesh
@@ -197,6 +407,10 @@ def read(filename, attrs=None, file_format=None):
     Load a meshio file
 
     >>> mesh = pyvista.read("mesh.obj")  # doctest:+SKIP
+
+    Reuse the parsed dataset on later reads
+
+    >>> mesh = pyvista.read('my_mesh.vtk', cache=True)  # doctest:+SKIP
     """
     if isinstance(filename, (list, tuple)):
         multi = pyvista.MultiBlock()
@@ -205,11 +419,13 @@ def read(filename, attrs=None, file_format=None):
                 name = os.path.basename(str(each))
             else:
                 name = None
-            multi[-1, name] = read(each)
+            multi[-1, name] = read(each, cache=cache)
         return multi
     filename = os.path.abspath(os.path.expanduser(str(filename)))
     if not os.path.isfile(filename):
         raise FileNotFoundError(f'File ({filename}) not found')
+    if cache:
+        return _read_cached(filename, attrs, file_format)
     ext = get_ext(filename)
 
     # Read file using meshio.read if file_format is present
@@ -239,6 +455,8 @@ def read(filename, attrs=None, file_format=None):
         return read_legacy(filename)
     elif ext in ['.jpeg', '.jpg']:
         return pyvista.Texture(filename).to_image()
+    elif ext in VTKHDF_EXTENSIONS:
+        return read_vtkhdf(filename)
     else:
         # Attempt find a reader in the readers mapping
         try:
@@ -306,56 +524,76 @@ def read_exodus(filename,
     return pyvista.wrap(reader.GetOutput())
 
 
+def _native_array(arr):
+    """Return ``arr`` in native byte order, copying only when required."""
+    arr = np.asarray(arr)
+    if not arr.dtype.isnative:
+        arr = arr.astype(arr.dtype.newbyteorder('='))
+    return arr
+
+
 def from_meshio(mesh):
-    """Convert a ``meshio`` mesh instance to a PyVista mesh."""
-    from meshio.vtk._vtk import (
-        meshio_to_vtk_type,
-        vtk_type_to_numnodes,
-    )
+    """Convert a ``meshio`` mesh instance to a PyVista mesh.
 
-    # Extract cells from meshio.Mesh object
-    offset = []
-    cells = []
-    cell_type = []
-    next_offset = 0
+    Points, point data and cell data keep their native dtypes.  On
+    VTK 9, the connectivity of a single cell block that is already a
+    contiguous ``ID_TYPE`` array is shared with VTK rather than copied.
+
+    """
+    from meshio.vtk._vtk import meshio_to_vtk_type
+    from pyvista.utilities.cells import CellArray, numpy_to_idarr
+
+    # Each meshio cell block is a homogeneous (n_cells, n_nodes) array
+    blocks = []
+    celltypes = []
     for c in mesh.cells:
-        vtk_type = meshio_to_vtk_type[c.type]
-        numnodes = vtk_type_to_numnodes[vtk_type]
-        cells.append(
-            np.hstack((np.full((len(c.data), 1), numnodes), c.data)).ravel()
-        )
-        cell_type += [vtk_type] * len(c.data)
-        if not VTK9:
-            offset += [next_offset + i * (numnodes + 1) for i in range(len(c.data))]
-            next_offset = offset[-1] + numnodes + 1
-
-    # Extract cell data from meshio.Mesh object
-    cell_data = {k: np.concatenate(v) for k, v in mesh.cell_data.items()}
+        data = _native_array(c.data)
+        if c.type.startswith('polygon'):
+            vtk_type = meshio_to_vtk_type['polygon']
+        else:
+            vtk_type = meshio_to_vtk_type[c.type]
+        blocks.append(data.reshape(len(data), -1))
+        celltypes.append(np.full(len(data), vtk_type, np.uint8))
+
+    celltypes = np.concatenate(celltypes) if celltypes else np.empty(0, np.uint8)
+    sizes = np.concatenate([np.full(len(block), block.shape[1], pyvista.ID_TYPE)
+                            for block in blocks]) if blocks else np.empty(0, pyvista.ID_TYPE)
+    offset = np.zeros(len(sizes) + 1, pyvista.ID_TYPE)
+    np.cumsum(sizes, out=offset[1:])
 
     # Create pyvista.UnstructuredGrid object
-    points = mesh.points
+    points = _native_array(mesh.points)
     if points.shape[1] == 2:
-        points = np.hstack((points, np.zeros((len(points), 1))))
+        points = np.hstack((points, np.zeros((len(points), 1), points.dtype)))
 
+    grid = pyvista.UnstructuredGrid()
+    grid.SetPoints(pyvista.vtk_points(points, deep=False))
+    vtk_celltypes = numpy_to_vtk(celltypes, deep=False)
     if VTK9:
-        grid = pyvista.UnstructuredGrid(
-            np.concatenate(cells),
-            np.array(cell_type),
-            np.array(points, np.float64),
-        )
+        if len(blocks) == 1:
+            connectivity = blocks[0].ravel()
+        else:
+            connectivity = np.concatenate([block.ravel() for block in blocks]
+                                          + [np.empty(0, pyvista.ID_TYPE)])
+        grid.SetCells(vtk_celltypes, CellArray.from_arrays(offset, connectivity))
     else:
-        grid = pyvista.UnstructuredGrid(
-            np.array(offset),
-            np.concatenate(cells),
-            np.array(cell_type),
-            np.array(points, np.float64),
-        )
+        # legacy layout with the number of points preceding each cell
+        cells = np.empty(offset[-1] + len(sizes), pyvista.ID_TYPE)
+        legacy_offset = offset[:-1] + np.arange(len(sizes), dtype=pyvista.ID_TYPE)
+        cells[legacy_offset] = sizes
+        mask = np.ones(cells.size, np.bool_)
+        mask[legacy_offset] = False
+        cells[mask] = np.concatenate([block.ravel() for block in blocks]
+                                     + [np.empty(0, pyvista.ID_TYPE)])
+        grid.SetCells(vtk_celltypes, numpy_to_idarr(legacy_offset),
+                      CellArray(cells, len(sizes)))
 
     # Set point data
-    grid.point_arrays.update({k: np.array(v, np.float64) for k, v in mesh.point_data.items()})
+    grid.point_arrays.update({k: _native_array(v) for k, v in mesh.point_data.items()})
 
     # Set cell data
-    grid.cell_arrays.update(cell_data)
+    grid.cell_arrays.update({k: _native_array(np.concatenate(v))
+                             for k, v in mesh.cell_data.items()})
 
     return grid
 
@@ -391,54 +629,56 @@ def save_meshio(filename, mesh, file_format = None, **kwargs):
     if not isinstance(mesh, pyvista.UnstructuredGrid):
         mesh = mesh.cast_to_unstructured_grid()
 
-    # Copy useful arrays to avoid repeated calls to properties
-    vtk_offset = mesh.offset
-    vtk_cells = mesh.cells
-    vtk_cell_type = mesh.celltypes
-
-    # Check that meshio supports all cell types in input mesh
-    pixel_voxel = {8, 11}       # Handle pixels and voxels
-    for cell_type in np.unique(vtk_cell_type):
-        if cell_type not in vtk_to_meshio_type.keys() and cell_type not in pixel_voxel:
-            raise TypeError(f"meshio does not support VTK type {cell_type}.")
-
-    # Get cells
     cells = []
-    c = 0
-    for offset, cell_type in zip(vtk_offset, vtk_cell_type):
-        numnodes = vtk_cells[offset+c]
-        if VTK9:  # must offset by cell count
-            cell = vtk_cells[offset+1+c:offset+1+c+numnodes]
-            c += 1
-        else:
-            cell = vtk_cells[offset+1:offset+1+numnodes]
-        cell = (
-            cell if cell_type not in pixel_voxel
-            else cell[[0, 1, 3, 2]] if cell_type == 8
-            else cell[[0, 1, 3, 2, 4, 5, 7, 6]]
-        )
-        cell_type = cell_type if cell_type not in pixel_voxel else cell_type+1
-        cell_type = (
-            vtk_to_meshio_type[cell_type] if cell_type != 7
-            else f"polygon{numnodes}"
-        )
-
-        if len(cells) > 0 and cells[-1][0] == cell_type:
-            cells[-1][1].append(cell)
+    breaks = []
+    # Grids without cells have no cell types array to split
+    if mesh.n_cells:
+        vtk_cell_type = mesh.celltypes
+
+        # Check that meshio supports all cell types in input mesh
+        pixel_voxel = {8, 11}       # Handle pixels and voxels
+        for cell_type in np.unique(vtk_cell_type):
+            if cell_type not in vtk_to_meshio_type.keys() and cell_type not in pixel_voxel:
+                raise TypeError(f"meshio does not support VTK type {cell_type}.")
+
+        # Start and size of each cell in the connectivity array
+        if VTK9:
+            connectivity = mesh.cell_connectivity
+            offset = mesh.offset
+            starts = offset[:-1]
+            sizes = np.diff(offset)
         else:
-            cells.append((cell_type, [cell]))
-
-    for k, c in enumerate(cells):
-        cells[k] = (c[0], np.array(c[1]))
+            connectivity = mesh.cells
+            starts = mesh.offset + 1
+            sizes = connectivity[mesh.offset]
+
+        # Split the cells into runs of identical type and size, each of
+        # which becomes one meshio cell block
+        breaks = np.nonzero((np.diff(vtk_cell_type) != 0) | (np.diff(sizes) != 0))[0] + 1
+        bounds = np.hstack(([0], breaks, [mesh.n_cells]))
+
+        for i0, i1 in zip(bounds[:-1], bounds[1:]):
+            cell_type = vtk_cell_type[i0]
+            numnodes = sizes[i0]
+            block = connectivity[starts[i0:i1, None] + np.arange(numnodes)]
+            if cell_type == 8:
+                block = block[:, [0, 1, 3, 2]]
+            elif cell_type == 11:
+                block = block[:, [0, 1, 3, 2, 4, 5, 7, 6]]
+            cell_type = cell_type if cell_type not in pixel_voxel else cell_type+1
+            cell_type = (
+                vtk_to_meshio_type[cell_type] if cell_type != 7
+                else f"polygon{numnodes}"
+            )
+            cells.append((cell_type, block))
 
     # Get point data
     point_data = {k.replace(" ", "_"): v for k, v in mesh.point_arrays.items()}
 
     # Get cell data
     vtk_cell_data = mesh.cell_arrays
-    n_cells = np.cumsum([len(c[1]) for c in cells[:-1]])
     cell_data = (
-        {k.replace(" ", "_"): np.split(v, n_cells) for k, v in vtk_cell_data.items()}
+        {k.replace(" ", "_"): np.split(v, breaks) for k, v in vtk_cell_data.items()}
         if vtk_cell_data
         else {}
     )
@@ -446,10 +686,426 @@ def save_meshio(filename, mesh, file_format = None, **kwargs):
     # Save using meshio
     meshio.write_points_cells(
         filename=filename,
-        points=np.array(mesh.points),
+        points=np.asarray(mesh.points),
         cells=cells,
         point_data=point_data,
         cell_data=cell_data,
         file_format=file_format,
         **kwargs
     )
+
+
+VTKHDF_EXTENSIONS = ('.vtkhdf', '.hdf')
+_VTKHDF_TOPOLOGIES = (('Vertices', 'GetVerts', 'SetVerts'),
+                      ('Lines', 'GetLines', 'SetLines'),
+                      ('Polygons', 'GetPolys', 'SetPolys'),
+                      ('Strips', 'GetStrips', 'SetStrips'))
+
+
+def _import_h5py():
+    try:
+        import h5py
+    except ImportError:
+        raise ImportError('VTKHDF support requires h5py.  Install it with:\n'
+                          '\tpip install h5py')
+    return h5py
+
+
+def _vtkhdf_write_dataset(group, name, data, opts):
+    """Write an array as a chunked and compressed HDF5 dataset."""
+    data = np.asarray(data)
+    if data.size == 0 or data.ndim == 0:
+        return group.create_dataset(name, data=data)
+    return group.create_dataset(name, data=data, **opts)
+
+
+def _vtkhdf_write_arrays(group, parts, opts, image_shape=None):
+    """Write point, cell and field arrays of one or more partitions."""
+    for group_name, attr, shape in (('PointData', 'point_arrays', 0),
+                                    ('CellData', 'cell_arrays', 1)):
+        data_group = group.create_group(group_name)
+        names = [name for name in getattr(parts[0], attr).keys()
+                 if all(name in getattr(part, attr) for part in parts[1:])]
+        for name in names:
+            data = np.concatenate([np.asarray(getattr(part, attr)[name]) for part in parts])
+            if image_shape is not None:
+                data = data.reshape(image_shape[shape] + data.shape[1:])
+            _vtkhdf_write_dataset(data_group, name, data, opts)
+
+    field_group = group.create_group('FieldData')
+    for name in parts[0].field_arrays.keys():
+        data = np.asarray(parts[0].field_arrays[name])
+        if data.dtype.kind in 'biuf':
+            _vtkhdf_write_dataset(field_group, name, data, opts)
+
+
+def _vtkhdf_write_image(group, grid, opts):
+    group.attrs['Version'] = (2, 0)
+    group.attrs['Type'] = np.bytes_('ImageData')
+    group.attrs['WholeExtent'] = grid.GetExtent()
+    group.attrs['Origin'] = grid.origin
+    group.attrs['Spacing'] = grid.spacing
+    group.attrs['Direction'] = np.eye(3).ravel()
+    nx, ny, nz = grid.dimensions
+    point_shape = (nz, ny, nx)
+    cell_shape = (max(nz - 1, 1), max(ny - 1, 1), max(nx - 1, 1))
+    _vtkhdf_write_arrays(group, [grid], opts, (point_shape, cell_shape))
+
+
+def _vtkhdf_write_unstructured(group, parts, opts):
+    from pyvista.utilities.cells import cell_array_to_numpy
+    group.attrs['Version'] = (2, 0)
+    group.attrs['Type'] = np.bytes_('UnstructuredGrid')
+    cell_arrays = [cell_array_to_numpy(part.GetCells()) for part in parts]
+    _vtkhdf_write_dataset(group, 'NumberOfPoints', [part.n_points for part in parts], opts)
+    _vtkhdf_write_dataset(group, 'NumberOfCells', [part.n_cells for part in parts], opts)
+    _vtkhdf_write_dataset(group, 'NumberOfConnectivityIds',
+                          [conn.size for _, conn in cell_arrays], opts)
+    _vtkhdf_write_dataset(group, 'Points', np.concatenate([part.points for part in parts]), opts)
+    _vtkhdf_write_dataset(group, 'Offsets', np.concatenate([off for off, _ in cell_arrays]), opts)
+    _vtkhdf_write_dataset(group, 'Connectivity',
+                          np.concatenate([conn for _, conn in cell_arrays]), opts)
+    _vtkhdf_write_dataset(group, 'Types', np.concatenate([part.celltypes for part in parts]), opts)
+    _vtkhdf_write_arrays(group, parts, opts)
+
+
+def _vtkhdf_write_polydata(group, parts, opts):
+    from pyvista.utilities.cells import cell_array_to_numpy
+    group.attrs['Version'] = (2, 0)
+    group.attrs['Type'] = np.bytes_('PolyData')
+    _vtkhdf_write_dataset(group, 'NumberOfPoints', [part.n_points for part in parts], opts)
+    _vtkhdf_write_dataset(group, 'Points', np.concatenate([part.points for part in parts]), opts)
+    for topology, getter, _ in _VTKHDF_TOPOLOGIES:
+        cell_arrays = [cell_array_to_numpy(getattr(part, getter)()) for part in parts]
+        topo_group = group.create_group(topology)
+        _vtkhdf_write_dataset(topo_group, 'NumberOfCells',
+                              [off.size - 1 for off, _ in cell_arrays], opts)
+        _vtkhdf_write_dataset(topo_group, 'NumberOfConnectivityIds',
+                              [conn.size for _, conn in cell_arrays], opts)
+        _vtkhdf_write_dataset(topo_group, 'Offsets',
+                              np.concatenate([off for off, _ in cell_arrays]), opts)
+        _vtkhdf_write_dataset(topo_group, 'Connectivity',
+                              np.concatenate([conn for _, conn in cell_arrays]), opts)
+    _vtkhdf_write_arrays(group, parts, opts)
+
+
+def _vtkhdf_write_multiblock(root, assembly, multi, opts, counter):
+    for i in range(multi.n_blocks):
+        block = multi[i]
+        name = (multi.get_block_name(i) or f'Block-{i}').replace('/', '_')
+        # blocks may share a name but assembly entries may not
+        while name in assembly:
+            name = f'{name}_{i}'
+        if isinstance(block, pyvista.MultiBlock):
+            sub_assembly = assembly.create_group(name, track_order=True)
+            sub_assembly.attrs['Index'] = i
+            _vtkhdf_write_multiblock(root, sub_assembly, block, opts, counter)
+            continue
+        if block is None:
+            empty = assembly.create_group(name)
+            empty.attrs['Index'] = i
+            empty.attrs['Type'] = np.bytes_('Empty')
+            continue
+        # leaves of different assemblies may share a name too
+        leaf_name, n = name, 0
+        while leaf_name in counter:
+            n += 1
+            leaf_name = f'{name}_{n}'
+        counter.add(leaf_name)
+        leaf = root.create_group(leaf_name)
+        _vtkhdf_write(leaf, block, opts)
+        leaf.attrs['Index'] = i
+        assembly[name] = _import_h5py().SoftLink(leaf.name)
+
+
+def _vtkhdf_write(group, dataset, opts):
+    """Write a dataset, or a list of partitions, into a VTKHDF group."""
+    parts = list(dataset) if isinstance(dataset, (list, tuple)) else [dataset]
+    if not parts:
+        raise ValueError('At least one dataset must be given.')
+    kind = type(parts[0])
+    if any(type(part) is not kind for part in parts):
+        raise TypeError('All partitions must be of the same type.')
+
+    if isinstance(parts[0], pyvista.MultiBlock) and len(parts) == 1:
+        group.attrs['Version'] = (2, 1)
+        group.attrs['Type'] = np.bytes_('MultiBlockDataSet')
+        assembly = group.create_group('Assembly', track_order=True)
+        _vtkhdf_write_multiblock(group, assembly, parts[0], opts, {'Assembly'})
+    elif isinstance(parts[0], pyvista.UniformGrid) and len(parts) == 1:
+        _vtkhdf_write_image(group, parts[0], opts)
+    elif isinstance(parts[0], pyvista.UnstructuredGrid):
+        _vtkhdf_write_unstructured(group, parts, opts)
+    elif isinstance(parts[0], pyvista.PolyData):
+        _vtkhdf_write_polydata(group, parts, opts)
+    else:
+        raise TypeError(f'Type {kind.__name__} cannot be written to VTKHDF.  Partitions '
+                        'are only supported for UnstructuredGrid and PolyData.')
+
+
+def save_vtkhdf(filename, dataset, compression='gzip', compression_opts=None, chunks=True):
+    """Save a dataset to a VTKHDF (HDF5) file.
+
+    Supports :class:`pyvista.UnstructuredGrid`,
+    :class:`pyvista.PolyData`, :class:`pyvista.UniformGrid` and
+    :class:`pyvista.MultiBlock`.  All arrays are written as chunked
+    HDF5 datasets so that :func:`pyvista.read_vtkhdf` can load subsets
+    of the file.  Requires ``h5py``.
+
+    Parameters
+    ----------
+    filename : str, pathlib.Path
+        Output filename, usually with a ``.vtkhdf`` or ``.hdf``
+        extension.
+
+    dataset : pyvista.DataSet, pyvista.MultiBlock or list
+        Dataset to save.  A list of unstructured grids or a list of
+        polydata is written as partitions of a single dataset.
+
+    compression : str, optional
+        HDF5 compression filter, e.g. ``'gzip'`` or ``'lzf'``.  ``None``
+        disables compression.
+
+    compression_opts : int, optional
+        Compression level for ``'gzip'``.
+
+    chunks : bool or tuple, optional
+        HDF5 chunk shape.  ``True`` lets ``h5py`` choose one.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> from pyvista import examples
+    >>> grid = examples.load_hexbeam()
+    >>> pyvista.save_vtkhdf('hexbeam.vtkhdf', grid)  # doctest:+SKIP
+
+    """
+    h5py = _import_h5py()
+    filename = os.path.abspath(os.path.expanduser(str(filename)))
+    opts = {'chunks': chunks}
+    if compression is not None:
+        opts['compression'] = compression
+        opts['compression_opts'] = compression_opts
+    with h5py.File(filename, 'w') as f:
+        _vtkhdf_write(f.create_group('VTKHDF'), dataset, opts)
+
+
+def _vtkhdf_type(group):
+    vtk_type = group.attrs['Type']
+    return vtk_type.decode() if isinstance(vtk_type, bytes) else str(vtk_type)
+
+
+def _vtkhdf_read_arrays(mesh, group, arrays, point_slice, cell_slice, cell_index=None):
+    """Read point, cell and field arrays in ``arrays`` from a VTKHDF group."""
+    for group_name, data, index in (('PointData', mesh.point_arrays, point_slice),
+                                    ('CellData', mesh.cell_arrays, cell_slice)):
+        if group_name not in group:
+            continue
+        for name, dset in group[group_name].items():
+            if arrays is not None and name not in arrays:
+                continue
+            values = dset[index]
+            if dset.ndim >= 3:  # image data stored as (z, y, x[, n])
+                values = values.reshape((-1,) + dset.shape[3:])
+            if cell_index is not None and group_name == 'CellData':
+                values = values[cell_index]
+            data[name] = values
+    if 'FieldData' in group:
+        for name, dset in group['FieldData'].items():
+            if arrays is None or name in arrays:
+                mesh.field_arrays[name] = dset[()]
+    return mesh
+
+
+def _vtkhdf_partition_range(n_parts, partitions):
+    if partitions is None:
+        return 0, n_parts
+    if isinstance(partitions, (int, np.integer)):
+        partitions = (partitions, partitions + 1)
+    elif isinstance(partitions, range):
+        if partitions.step != 1:
+            raise ValueError('Partition ranges must be contiguous.')
+        partitions = (partitions.start, partitions.stop)
+    start, stop = partitions
+    if not 0 <= start < stop <= n_parts:
+        raise ValueError(f'Invalid partition range {partitions} for {n_parts} partitions.')
+    return start, stop
+
+
+def _vtkhdf_read_topology(group, start, stop, point_base):
+    """Read and merge the offsets and connectivity of a partition range."""
+    n_cells = group['NumberOfCells'][()]
+    n_conn = group['NumberOfConnectivityIds'][()]
+    cell_start = np.concatenate(([0], np.cumsum(n_cells)))
+    conn_start = np.concatenate(([0], np.cumsum(n_conn)))
+
+    # every partition stores n_cells + 1 local offsets
+    offsets = group['Offsets'][cell_start[start] + start:cell_start[stop] + stop]
+    connectivity = group['Connectivity'][conn_start[start]:conn_start[stop]]
+
+    sizes = n_cells[start:stop] + 1
+    ends = np.cumsum(sizes) - 1
+    keep = np.ones(offsets.size, np.bool_)
+    keep[ends[:-1]] = False
+    offsets = offsets + np.repeat(conn_start[start:stop] - conn_start[start], sizes)
+    connectivity = connectivity + np.repeat(point_base, n_conn[start:stop])
+    return (offsets[keep].astype(pyvista.ID_TYPE, copy=False),
+            connectivity.astype(pyvista.ID_TYPE, copy=False),
+            n_cells[start:stop])
+
+
+def _vtkhdf_read_points(group, start, stop):
+    n_points = group['NumberOfPoints'][()]
+    point_start = np.concatenate(([0], np.cumsum(n_points)))
+    points = group['Points'][point_start[start]:point_start[stop]]
+    point_base = point_start[start:stop] - point_start[start]
+    return points, slice(point_start[start], point_start[stop]), point_base
+
+
+def _vtkhdf_read_unstructured(group, arrays, partitions):
+    from pyvista.utilities.cells import CellArray
+    start, stop = _vtkhdf_partition_range(len(group['NumberOfPoints']), partitions)
+    points, point_slice, point_base = _vtkhdf_read_points(group, start, stop)
+    offsets, connectivity, n_cells = _vtkhdf_read_topology(group, start, stop, point_base)
+    cell_start = np.concatenate(([0], np.cumsum(group['NumberOfCells'][()])))
+    cell_slice = slice(cell_start[start], cell_start[stop])
+
+    grid = pyvista.UnstructuredGrid()
+    grid.SetPoints(pyvista.vtk_points(points, deep=False))
+    celltypes = np.ascontiguousarray(group['Types'][cell_slice], np.uint8)
+    vtk_celltypes = numpy_to_vtk(celltypes, deep=False)
+    if VTK9:
+        grid.SetCells(vtk_celltypes, CellArray.from_arrays(offsets, connectivity))
+    else:
+        from pyvista.utilities.cells import numpy_to_idarr
+        legacy_offset = offsets[:-1] + np.arange(offsets.size - 1, dtype=pyvista.ID_TYPE)
+        grid.SetCells(vtk_celltypes, numpy_to_idarr(legacy_offset),
+                      CellArray.from_arrays(offsets, connectivity))
+    return _vtkhdf_read_arrays(grid, group, arrays, point_slice, cell_slice)
+
+
+def _vtkhdf_read_polydata(group, arrays, partitions):
+    from pyvista.utilities.cells import CellArray
+    start, stop = _vtkhdf_partition_range(len(group['NumberOfPoints']), partitions)
+    points, point_slice, point_base = _vtkhdf_read_points(group, start, stop)
+
+    mesh = pyvista.PolyData()
+    mesh.SetPoints(pyvista.vtk_points(points, deep=False))
+    # VTK orders cells by topology, while the file orders them by
+    # partition and then by topology
+    counts = []
+    for topology, _, setter in _VTKHDF_TOPOLOGIES:
+        offsets, connectivity, n_cells = _vtkhdf_read_topology(group[topology], start,
+                                                               stop, point_base)
+        getattr(mesh, setter)(CellArray.from_arrays(offsets, connectivity))
+        counts.append(n_cells)
+    counts = np.array(counts)  # (n_topologies, n_partitions)
+
+    all_counts = np.array([group[topology]['NumberOfCells'][()]
+                           for topology, _, _ in _VTKHDF_TOPOLOGIES])
+    part_start = np.concatenate(([0], np.cumsum(all_counts.sum(axis=0))))
+    cell_slice = slice(part_start[start], part_start[stop])
+    topo_start = np.cumsum(counts, axis=0) - counts + (part_start[start:stop] - part_start[start])
+    cell_index = np.concatenate([np.arange(s, s + n) for s, n in
+                                 zip(topo_start.ravel(), counts.ravel())] + [np.empty(0, int)])
+    return _vtkhdf_read_arrays(mesh, group, arrays, point_slice, cell_slice, cell_index)
+
+
+def _vtkhdf_read_image(group, arrays, extent):
+    whole = np.array(group.attrs['WholeExtent'])
+    origin = np.array(group.attrs['Origin'], float)
+    spacing = np.array(group.attrs['Spacing'], float)
+    if extent is None:
+        extent = whole
+    extent = np.array(extent)
+    if extent.shape != (6,) or np.any(extent[::2] < whole[::2]) or \
+            np.any(extent[1::2] > whole[1::2]) or np.any(extent[1::2] < extent[::2]):
+        raise ValueError(f'Extent {tuple(extent)} is not within the whole extent {tuple(whole)}.')
+
+    lo = extent[::2] - whole[::2]
+    hi = extent[1::2] - whole[::2]
+    n_cells = np.maximum(whole[1::2] - whole[::2], 1)
+    point_slice = tuple(slice(lo[i], hi[i] + 1) for i in (2, 1, 0))
+    cell_slice = tuple(slice(min(lo[i], n_cells[i] - 1), max(hi[i], lo[i] + 1))
+                       for i in (2, 1, 0))
+
+    grid = pyvista.UniformGrid(extent[1::2] - extent[::2] + 1, spacing,
+                               origin + spacing * extent[::2])
+    return _vtkhdf_read_arrays(grid, group, arrays, point_slice, cell_slice)
+
+
+def _vtkhdf_read_assembly(root, assembly, arrays):
+    multi = pyvista.MultiBlock()
+    children = sorted(assembly.items(), key=lambda item: item[1].attrs['Index'])
+    for name, child in children:
+        if 'Type' in child.attrs and _vtkhdf_type(child) == 'Empty':
+            multi[-1, name] = None
+        elif 'Type' in child.attrs:
+            multi[-1, name] = _vtkhdf_read(child, arrays)
+        else:
+            multi[-1, name] = _vtkhdf_read_assembly(root, child, arrays)
+    return multi
+
+
+def _vtkhdf_read(group, arrays=None, extent=None, partitions=None):
+    vtk_type = _vtkhdf_type(group)
+    if extent is not None and vtk_type != 'ImageData':
+        raise ValueError('`extent` can only be used with ImageData.')
+    if partitions is not None and vtk_type not in ('UnstructuredGrid', 'PolyData'):
+        raise ValueError('`partitions` can only be used with UnstructuredGrid and PolyData.')
+    if vtk_type == 'ImageData':
+        return _vtkhdf_read_image(group, arrays, extent)
+    elif vtk_type == 'UnstructuredGrid':
+        return _vtkhdf_read_unstructured(group, arrays, partitions)
+    elif vtk_type == 'PolyData':
+        return _vtkhdf_read_polydata(group, arrays, partitions)
+    elif vtk_type == 'MultiBlockDataSet':
+        return _vtkhdf_read_assembly(group, group['Assembly'], arrays)
+    raise TypeError(f'VTKHDF type {vtk_type} is not supported.')
+
+
+def read_vtkhdf(filename, arrays=None, extent=None, partitions=None):
+    """Read a VTKHDF (HDF5) file, or a subset of one.
+
+    Only the requested part of the file is read from disk.  Requires
+    ``h5py``.
+
+    Parameters
+    ----------
+    filename : str, pathlib.Path
+        File to read.
+
+    arrays : list(str), optional
+        Names of the point, cell and field arrays to load.  By
+        default, all arrays are loaded.  Pass an empty list to load
+        only the geometry.
+
+    extent : sequence(int), optional
+        For image data, the point extent ``(i0, i1, j0, j1, k0, k1)``
+        to read.  Bounds are inclusive.
+
+    partitions : int or tuple(int), optional
+        For unstructured grids and polydata written as partitions, a
+        partition index or a ``(start, stop)`` range of partitions to
+        read.  The selected partitions are merged into one dataset.
+
+    Return
+    ------
+    mesh : pyvista.DataSet or pyvista.MultiBlock
+        Dataset read from the file.
+
+    Examples
+    --------
+    Load only the ``'temperature'`` array of the first octant of an image
+
+    >>> import pyvista
+    >>> image = pyvista.read_vtkhdf('volume.vtkhdf', arrays=['temperature'],
+    ...                             extent=(0, 63, 0, 63, 0, 63))  # doctest:+SKIP
+
+    """
+    h5py = _import_h5py()
+    filename = os.path.abspath(os.path.expanduser(str(filename)))
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f'File ({filename}) not found')
+    with h5py.File(filename, 'r') as f:
+        return _vtkhdf_read(f['VTKHDF'], arrays, extent, partitions)
@@ -1,11 +1,16 @@
 """Supporting functions for polydata and grid objects."""
 
 import collections.abc
+import contextlib
 import enum
+import json
 import logging
+import os
 import signal
 import sys
+import time
 import warnings
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from threading import Thread
 import threading
 import traceback
@@ -16,7 +21,7 @@ import vtk
 import vtk.util.numpy_support as nps
 
 import pyvista
-from .fileio import from_meshio
+from .fileio import from_meshio, VTK9
 
 
 class FieldAssociation(enum.Enum):
@@ -532,6 +537,10 @@ def wrap(dataset):
             return pyvista.PolyData(dataset)
         elif dataset.ndim == 3:
             mesh = pyvista.UniformGrid(dataset.shape)
+            # VTK uses x-fastest ordering, so a Fortran-contiguous
+            # volume in native byte order is shared without a copy
+            if not (dataset.flags['F_CONTIGUOUS'] and dataset.dtype.isnative):
+                dataset = np.asfortranarray(dataset, dataset.dtype.newbyteorder('='))
             mesh['values'] = dataset.ravel(order='F')
             mesh.active_scalars_name = 'values'
             return mesh
@@ -541,12 +550,22 @@ def wrap(dataset):
     elif is_meshio_mesh(dataset):
         return from_meshio(dataset)
     elif dataset.__class__.__name__ == 'Trimesh':
+        vertices = np.asarray(dataset.vertices)
+        tri = np.asarray(dataset.faces)
+        if VTK9:
+            from pyvista.utilities.cells import CellArray
+            # triangles are used as the connectivity array directly
+            # and only the offsets are allocated
+            offsets = np.arange(0, tri.size + 1, 3, dtype=pyvista.ID_TYPE)
+            mesh = pyvista.PolyData()
+            mesh.SetPoints(vtk_points(vertices, deep=False))
+            mesh.SetPolys(CellArray.from_arrays(offsets, tri.ravel()))
+            return mesh
         # trimesh doesn't pad faces
-        n_face = dataset.faces.shape[0]
-        faces = np.empty((n_face, 4), dataset.faces.dtype)
-        faces[:, 1:] = dataset.faces
+        faces = np.empty((tri.shape[0], 4), pyvista.ID_TYPE)
+        faces[:, 1:] = tri
         faces[:, 0] = 3
-        return pyvista.PolyData(np.asarray(dataset.vertices), faces)
+        return pyvista.PolyData(vertices, faces)
     else:
         raise NotImplementedError(f'Type ({type(dataset)}) not able to be wrapped into a PyVista mesh.')
     try:
@@ -705,6 +724,96 @@ def threaded(fn):
     return wrapper
 
 
+_SMP_N_THREADS = 0
+
+
+def set_n_threads(n=None):
+    """Set the number of threads used by VTK's SMP-parallel filters.
+
+    This configures ``vtkSMPTools`` globally and applies to all filters
+    run afterwards, for example ``contour`` on volumes.  It has no
+    effect when VTK was built with the ``'Sequential'`` backend.
+
+    Parameters
+    ----------
+    n : int, optional
+        Maximum number of threads.  ``None`` or ``0`` restores the
+        backend default, which is usually the number of cores.
+
+    Examples
+    --------
+    Cap VTK to two threads on a shared node.
+
+    >>> import pyvista
+    >>> pyvista.set_n_threads(2)
+
+    Restore the default number of threads.
+
+    >>> pyvista.set_n_threads()
+
+    """
+    global _SMP_N_THREADS
+    n = 0 if n is None else int(n)
+    if n < 0:
+        raise ValueError('The number of threads must be non-negative.')
+    vtk.vtkSMPTools.Initialize(n)
+    _SMP_N_THREADS = n
+
+
+def get_n_threads():
+    """Return the number of threads VTK's SMP-parallel filters will use."""
+    return vtk.vtkSMPTools.GetEstimatedNumberOfThreads()
+
+
+def smp_backend():
+    """Return the name of the SMP backend VTK was built with.
+
+    VTK before 9.1 does not report its backend.  There, ``'Sequential'``
+    is returned when VTK runs a single thread although more were
+    requested with :func:`pyvista.set_n_threads`, and ``None`` when
+    the backend is unknown.  The SMP settings are left unchanged.
+
+    """
+    smp = vtk.vtkSMPTools
+    if hasattr(smp, 'GetBackend'):
+        return smp.GetBackend()
+    # a sequential build ignores any requested number of threads
+    if _SMP_N_THREADS > 1 and smp.GetEstimatedNumberOfThreads() == 1:
+        return 'Sequential'
+    return None
+
+
+@contextlib.contextmanager
+def n_threads(n):
+    """Limit the threads of VTK's SMP-parallel filters within a context.
+
+    The previous setting of :func:`pyvista.set_n_threads` is restored
+    on exit.  As ``vtkSMPTools`` is global, this also applies to
+    filters run concurrently from other threads.
+
+    Parameters
+    ----------
+    n : int
+        Maximum number of threads.  ``None`` or ``0`` uses the backend
+        default.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> from pyvista import examples
+    >>> volume = examples.load_uniform()
+    >>> with pyvista.n_threads(1):
+    ...     iso = volume.contour()
+
+    """
+    previous = _SMP_N_THREADS
+    set_n_threads(n)
+    try:
+        yield
+    finally:
+        set_n_threads(previous)
+
+
 class conditional_decorator:
     """Conditional decorator for methods."""
 
@@ -788,6 +897,329 @@ class ProgressMonitor():
             signal.signal(signal.SIGINT, self._old_handler)
 
 
+class FilterFuture(Future):
+    """Future of a filter submitted with :func:`pyvista.DataObject.submit`.
+
+    Besides the standard :class:`concurrent.futures.Future` interface,
+    the progress of the running VTK algorithm can be read or observed
+    and a running filter can be cancelled.  Cancellation calls
+    ``AbortExecuteOn`` on the algorithm at its next progress event.
+
+    """
+
+    _local = threading.local()
+
+    def __init__(self):
+        """Initialize the future."""
+        super().__init__()
+        self._progress = 0.0
+        self._progress_callbacks = []
+        self._abort = False
+        self._aborted = False
+        self._abort_lock = threading.RLock()
+
+    @classmethod
+    def current(cls):
+        """Return the future of the filter running on this thread, if any."""
+        return getattr(cls._local, 'future', None)
+
+    @property
+    def progress(self):
+        """Return the progress of the running algorithm between 0 and 1."""
+        return self._progress
+
+    def add_progress_callback(self, fn):
+        """Call ``fn(future, progress)`` on every progress event.
+
+        The callback is called from the worker thread, so GUI
+        applications should forward the value to their event loop.
+
+        """
+        self._progress_callbacks.append(fn)
+
+    def cancel(self):
+        """Cancel the filter.
+
+        Pending filters never start and running filters are aborted.
+        Returns ``False`` if the filter has already finished.
+
+        """
+        if super().cancel():
+            return True
+        with self._abort_lock:
+            if self.done():
+                return False
+            self._abort = True
+            return True
+
+    def cancelled(self):
+        """Return ``True`` if the filter was cancelled."""
+        return self._aborted or super().cancelled()
+
+    def _on_progress(self, obj, event):
+        """Observe the progress events of the running algorithm."""
+        if self._abort:
+            obj.AbortExecuteOn()
+        self._progress = obj.GetProgress()
+        for fn in self._progress_callbacks:
+            try_callback(fn, self, self._progress)
+        # VTK holds the GIL while executing, so release it here to let
+        # the submitting thread run
+        time.sleep(0)
+
+    def _run(self, func, args, kwargs):
+        """Run ``func`` on the worker thread and resolve the future."""
+        if not self.set_running_or_notify_cancel():
+            return
+        FilterFuture._local.future = self
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            result, error = None, exc
+        else:
+            error = None
+        finally:
+            FilterFuture._local.future = None
+        with self._abort_lock:
+            if self._abort:
+                self._aborted = True
+                self.set_exception(CancelledError())
+            elif error is not None:
+                self.set_exception(error)
+            else:
+                self.set_result(result)
+
+
+class _FilterPool:
+    """Managed thread pool running submitted filters."""
+
+    def __init__(self, max_workers=1):
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs):
+        """Run ``func`` on the pool and return a :class:`FilterFuture`."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='pyvista-filter')
+            executor = self._executor
+        future = FilterFuture()
+        executor.submit(future._run, func, args, kwargs)
+        return future
+
+    def shutdown(self, wait=True):
+        """Shut down the pool, optionally waiting for running filters."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_FILTER_POOL = _FilterPool()
+
+
+def set_filter_workers(max_workers=1):
+    """Configure the thread pool used by :func:`pyvista.DataObject.submit`.
+
+    Filters submitted to the previous pool are allowed to finish.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of filters run concurrently.
+
+    """
+    global _FILTER_POOL
+    if max_workers < 1:
+        raise ValueError('`max_workers` must be positive.')
+    old_pool = _FILTER_POOL
+    _FILTER_POOL = _FilterPool(max_workers)
+    old_pool.shutdown(wait=True)
+
+
+def _submit_filter(func, *args, **kwargs):
+    """Run a filter on the managed filter pool."""
+    return _FILTER_POOL.submit(func, *args, **kwargs)
+
+
+_PROFILES = []
+
+
+class Profile:
+    """Filter invocations recorded by :func:`pyvista.profile`.
+
+    Each entry of ``records`` is a dictionary with the keys:
+
+    * ``'filter'``: name of the pyvista filter method.
+    * ``'algorithm'``: class name of the VTK algorithm.
+    * ``'thread'``: identifier of the thread running the algorithm.
+    * ``'start'``: start time in seconds since the profile began.
+    * ``'wall_time'``: duration of the algorithm update in seconds.
+    * ``'output_time'``: seconds spent wrapping the output.
+    * ``'input_points'``, ``'input_cells'``, ``'output_points'`` and
+      ``'output_cells'``: sizes summed over all ports.
+    * ``'memory'``: bytes held by the input and output arrays once the
+      algorithm has run, an upper bound of its peak array memory.
+    * ``'progress'``: list of ``(time, progress)`` VTK progress events.
+
+    """
+
+    _COLUMNS = (('filter', 'Filter', '{}'), ('algorithm', 'Algorithm', '{}'),
+                ('input_points', 'In points', '{}'), ('input_cells', 'In cells', '{}'),
+                ('output_points', 'Out points', '{}'), ('output_cells', 'Out cells', '{}'),
+                ('wall_time', 'Time (ms)', '{:.3f}'), ('memory', 'Memory (MiB)', '{:.2f}'),
+                ('progress', 'Events', '{}'))
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self.records = []
+        self._t0 = time.perf_counter()
+
+    def table(self):
+        """Return the records as a formatted text table."""
+        rows = [[title for _, title, _ in self._COLUMNS]]
+        for record in self.records:
+            values = dict(record, wall_time=record['wall_time']*1000,
+                          memory=record['memory']/2**20, progress=len(record['progress']))
+            rows.append([fmt.format(values[key]) for key, _, fmt in self._COLUMNS])
+        widths = [max(len(row[i]) for row in rows) for i in range(len(self._COLUMNS))]
+        lines = ['  '.join(value.ljust(width) if i < 2 else value.rjust(width)
+                           for i, (value, width) in enumerate(zip(row, widths)))
+                 for row in rows]
+        lines.insert(1, '-'*len(lines[0]))
+        return '\n'.join(lines)
+
+    def to_chrome_trace(self, filename=None):
+        """Export the records in the Chrome trace event format.
+
+        The trace can be opened in ``chrome://tracing`` or Perfetto.
+
+        Parameters
+        ----------
+        filename : str, optional
+            Write the trace as JSON to this file.
+
+        Return
+        ------
+        trace : dict
+            The trace events.
+
+        """
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            args = {key: record[key] for key in ('algorithm', 'input_points', 'input_cells',
+                                                 'output_points', 'output_cells', 'memory',
+                                                 'output_time')}
+            events.append({'name': record['filter'], 'cat': 'filter', 'ph': 'X',
+                           'ts': record['start']*1e6, 'dur': record['wall_time']*1e6,
+                           'pid': pid, 'tid': record['thread'], 'args': args})
+            for tstamp, progress in record['progress']:
+                events.append({'name': 'progress', 'cat': 'filter', 'ph': 'C',
+                               'ts': tstamp*1e6, 'pid': pid, 'tid': record['thread'],
+                               'args': {record['algorithm']: progress}})
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+        if filename is not None:
+            with open(filename, 'w') as f:
+                json.dump(trace, f)
+        return trace
+
+    def __repr__(self):
+        """Return the table of records."""
+        return self.table()
+
+
+@contextlib.contextmanager
+def profile():
+    """Record timing and memory of the filters run within a context.
+
+    Every VTK algorithm updated by a pyvista filter is recorded, see
+    :class:`pyvista.Profile`.  Filters run without overhead when no
+    profile is active.
+
+    Examples
+    --------
+    >>> import pyvista
+    >>> with pyvista.profile() as prof:
+    ...     _ = pyvista.Sphere().decimate(0.5)
+    >>> prof.records[0]['algorithm']
+    'vtkQuadricDecimation'
+    >>> trace = prof.to_chrome_trace()
+
+    """
+    prof = Profile()
+    _PROFILES.append(prof)
+    try:
+        yield prof
+    finally:
+        _PROFILES.remove(prof)
+
+
+def _data_object_sizes(data_object):
+    """Return the number of points, cells and bytes of a data object."""
+    if data_object is None:
+        return 0, 0, 0
+    n_points = getattr(data_object, 'GetNumberOfPoints', lambda: 0)()
+    n_cells = getattr(data_object, 'GetNumberOfCells', lambda: 0)()
+    return n_points, n_cells, data_object.GetActualMemorySize()*1024
+
+
+_PROFILE_LOCAL = threading.local()
+
+
+def _input_objects(alg):
+    """Return the input data objects of an algorithm."""
+    return [alg.GetInputDataObject(port, conn)
+            for port in range(alg.GetNumberOfInputPorts())
+            for conn in range(alg.GetNumberOfInputConnections(port))]
+
+
+def _profile_start(alg, name):
+    """Start recording an algorithm update in the active profiles."""
+    record = {'filter': name, 'algorithm': alg.GetClassName(),
+              'thread': threading.get_ident(), 'output_time': 0.0, 'progress': []}
+    sizes = [_data_object_sizes(obj) for obj in _input_objects(alg)]
+    record['input_points'] = sum(size[0] for size in sizes)
+    record['input_cells'] = sum(size[1] for size in sizes)
+
+    def on_progress(obj, event):
+        record['progress'].append((time.perf_counter(), obj.GetProgress()))
+
+    observer = alg.AddObserver(vtk.vtkCommand.ProgressEvent, on_progress)
+    record['start'] = time.perf_counter()
+    return list(_PROFILES), record, observer
+
+
+def _profile_stop(alg, token):
+    """Finish the record started by ``_profile_start``."""
+    profiles, record, observer = token
+    record['wall_time'] = time.perf_counter() - record['start']
+    alg.RemoveObserver(observer)
+    sizes = [_data_object_sizes(alg.GetOutputDataObject(port))
+             for port in range(alg.GetNumberOfOutputPorts())]
+    record['output_points'] = sum(size[0] for size in sizes)
+    record['output_cells'] = sum(size[1] for size in sizes)
+    record['memory'] = (sum(size[2] for size in sizes) +
+                        sum(_data_object_sizes(obj)[2] for obj in _input_objects(alg)))
+    records = []
+    for prof in profiles:
+        records.append(dict(record, start=record['start'] - prof._t0,
+                            progress=[(t - prof._t0, value)
+                                      for t, value in record['progress']]))
+        prof.records.append(records[-1])
+    _PROFILE_LOCAL.last = (id(alg), records)
+
+
+def _profile_output(alg, elapsed):
+    """Add the time spent wrapping the output of ``alg`` to its records."""
+    last = getattr(_PROFILE_LOCAL, 'last', None)
+    if last is not None and last[0] == id(alg):
+        for record in last[1]:
+            record['output_time'] += elapsed
+
+
 def abstract_class(cls_):
     """Decorate a class, overriding __new__.
 
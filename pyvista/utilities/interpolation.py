@@ -0,0 +1,270 @@
+"""Precomputed sparse interpolation between datasets.
+
+The weights used by ``vtkProbeFilter`` and ``vtkPointInterpolator`` only
+depend on the geometry of the meshes.  Computing them once as a sparse
+matrix allows interpolating any number of arrays, for example the
+timesteps of a simulation, with a sparse matrix-vector product.
+
+"""
+import numpy as np
+import vtk
+
+import pyvista
+from pyvista.utilities.cells import dataset_cells
+
+
+class InterpolationOperator:
+    """Sparse linear operator interpolating arrays onto target points.
+
+    Row ``i`` of the operator holds the source points ``indices`` and
+    ``weights`` interpolating target point ``i``, in compressed sparse
+    row (CSR) layout.  Create operators with
+    :func:`pyvista.DataSetFilters.probe_operator` or
+    :func:`pyvista.DataSetFilters.interpolation_operator`.
+
+    Parameters
+    ----------
+    indptr : np.ndarray
+        Start of each row in ``indices``, followed by its length.
+
+    indices : np.ndarray
+        Source point of each weight.
+
+    weights : np.ndarray
+        Interpolation weights.
+
+    n_sources : int
+        Number of points of the source.
+
+    cell_ids : np.ndarray, optional
+        Source cell of each target point, ``-1`` when there is none.
+        Required to interpolate cell data.
+
+    valid_mask : np.ndarray, optional
+        Whether each target point was interpolated.  Invalid points are
+        given ``null_value``.  All points are valid by default.
+
+    null_value : float, optional
+        Value of the invalid points.
+
+    """
+
+    def __init__(self, indptr, indices, weights, n_sources, cell_ids=None,
+                 valid_mask=None, null_value=0.0):
+        """Initialize the operator."""
+        self.indptr = np.asarray(indptr, dtype=pyvista.ID_TYPE)
+        self.indices = np.asarray(indices, dtype=pyvista.ID_TYPE)
+        self.weights = np.asarray(weights, dtype=float)
+        self.n_sources = n_sources
+        self.n_targets = self.indptr.size - 1
+        self.cell_ids = cell_ids
+        if valid_mask is None:
+            valid_mask = np.ones(self.n_targets, dtype=bool)
+        self.valid_mask = np.asarray(valid_mask, dtype=bool)
+        self.null_value = null_value
+        self._rows = np.repeat(np.arange(self.n_targets), np.diff(self.indptr))
+        self._sparse = None
+
+    def __repr__(self):
+        """Return the representation of the operator."""
+        return (f'{type(self).__name__}({self.n_targets} targets, '
+                f'{self.n_sources} sources, {self.weights.size} weights)')
+
+    def to_sparse(self):
+        """Return the operator as a ``scipy.sparse.csr_matrix``.
+
+        Requires ``scipy``.
+
+        """
+        if self._sparse is None:
+            from scipy.sparse import csr_matrix
+            self._sparse = csr_matrix((self.weights, self.indices, self.indptr),
+                                      shape=(self.n_targets, self.n_sources))
+        return self._sparse
+
+    def apply(self, values):
+        """Interpolate point data of the source onto the target points.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Array of the source points, with one row per point.  Any
+            number of components, such as vectors, is supported.
+
+        Return
+        ------
+        interpolated : np.ndarray
+            Array of the target points, with the same components as
+            ``values``.
+
+        """
+        values = np.asarray(values)
+        if values.shape[0] != self.n_sources:
+            raise ValueError(f'Array length ({values.shape[0]}) must match the number '
+                             f'of source points ({self.n_sources}).')
+        flat = values.reshape(self.n_sources, -1)
+        try:
+            sparse = self.to_sparse()
+        except ImportError:
+            result = np.empty((self.n_targets, flat.shape[1]))
+            for i in range(flat.shape[1]):
+                result[:, i] = np.bincount(self._rows, self.weights * flat[self.indices, i],
+                                           minlength=self.n_targets)
+        else:
+            result = np.asarray(sparse @ flat, dtype=float)
+        result[~self.valid_mask] = self.null_value
+        return result.reshape((self.n_targets,) + values.shape[1:])
+
+    def apply_cell_data(self, values):
+        """Interpolate cell data of the source onto the target points.
+
+        Each target point takes the value of its source cell.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Array of the source cells, with one row per cell.
+
+        Return
+        ------
+        interpolated : np.ndarray
+            Array of the target points.
+
+        """
+        if self.cell_ids is None:
+            raise ValueError('This operator does not interpolate cell data.')
+        values = np.asarray(values)
+        result = values[self.cell_ids].astype(np.result_type(values, self.null_value))
+        result[self.cell_ids < 0] = self.null_value
+        return result
+
+
+def _simplex_weights(points, corners):
+    """Return the barycentric weights of points in simplices.
+
+    ``corners`` is ``(n, k, 3)`` for simplices of ``k`` points.  Points
+    are projected onto the simplex of lines and triangles.  The weights
+    of degenerate simplices are NaN.
+
+    """
+    edges = corners[:, 1:] - corners[:, :1]
+    offset = points - corners[:, 0]
+    # least squares solution of edges.T @ w = offset
+    gram = np.einsum('nij,nkj->nik', edges, edges)
+    rhs = np.einsum('nij,nj->ni', edges, offset)
+    # the determinant of a degenerate simplex is negligible against the
+    # product of its squared edge lengths, its upper bound
+    regular = np.linalg.det(gram) > 1e-12 * np.prod(np.einsum('nii->ni', gram), axis=1)
+    coords = np.full(rhs.shape, np.nan)
+    coords[regular] = np.linalg.solve(gram[regular], rhs[regular][..., None])[..., 0]
+    return np.concatenate((1 - coords.sum(1, keepdims=True), coords), axis=1)
+
+
+def _box_weights(points, corners, clamp=False):
+    """Return the multilinear weights of points in pixels and voxels.
+
+    Points outside of the cells are clamped to them when ``clamp`` is
+    set, as done when probing image data.
+
+    """
+    lower = corners.min(1)
+    extent = corners.max(1) - lower
+    active = np.nonzero(extent.max(0) > 0)[0]
+    extent[extent == 0] = 1
+    pcoords = (points - lower) / extent
+    if clamp:
+        pcoords = pcoords.clip(0, 1)
+    # the first axis varies fastest in the point order of these cells
+    weights = np.ones((points.shape[0], 1))
+    for axis in active:
+        t = pcoords[:, axis:axis + 1]
+        weights = np.concatenate((weights * (1 - t), weights * t), axis=1)
+    return weights
+
+
+_SIMPLEX_TYPES = (vtk.VTK_LINE, vtk.VTK_TRIANGLE, vtk.VTK_TETRA)
+
+
+def cell_weights(dataset, cell_ids, points):
+    """Return the interpolation weights of points in cells of a dataset.
+
+    Parameters
+    ----------
+    dataset : pyvista.Common
+        Dataset containing the cells.
+
+    cell_ids : np.ndarray
+        Cell containing each point.
+
+    points : np.ndarray
+        ``(n, 3)`` coordinates of the points.
+
+    Return
+    ------
+    indptr : np.ndarray
+        Start of the weights of each point, followed by their number.
+
+    indices : np.ndarray
+        Point id of each weight.
+
+    weights : np.ndarray
+        Weights of the points of each cell.
+
+    """
+    offsets, connectivity, cell_types = dataset_cells(dataset)
+    cell_ids = np.asarray(cell_ids, dtype=pyvista.ID_TYPE)
+    points = np.asarray(points, dtype=float)
+    sizes = np.diff(offsets)[cell_ids]
+    types = cell_types[cell_ids]
+    if isinstance(dataset, vtk.vtkStructuredGrid):
+        # structured grids report voxels, which are not axis aligned
+        box_types = ()
+    else:
+        box_types = (vtk.VTK_PIXEL, vtk.VTK_VOXEL)
+    clamp = isinstance(dataset, (vtk.vtkImageData, vtk.vtkRectilinearGrid))
+
+    indptr = np.zeros(cell_ids.size + 1, pyvista.ID_TYPE)
+    indices = np.empty(sizes.sum(), pyvista.ID_TYPE)
+    weights = np.empty(sizes.sum())
+    np.cumsum(sizes, out=indptr[1:])
+    source_points = dataset.points
+    generic = np.ones(cell_ids.size, dtype=bool)
+    for cell_type in np.unique(types):
+        group = np.nonzero(types == cell_type)[0]
+        if cell_type == vtk.VTK_VERTEX:
+            group_weights = np.ones((group.size, 1))
+        elif cell_type in _SIMPLEX_TYPES or cell_type in box_types:
+            size = {vtk.VTK_LINE: 2, vtk.VTK_TRIANGLE: 3, vtk.VTK_TETRA: 4,
+                    vtk.VTK_PIXEL: 4, vtk.VTK_VOXEL: 8}[cell_type]
+            ids = connectivity[offsets[cell_ids[group]][:, None] + np.arange(size)]
+            corners = source_points[ids].astype(float)
+            if cell_type in _SIMPLEX_TYPES:
+                group_weights = _simplex_weights(points[group], corners)
+                # degenerate simplices are left to EvaluatePosition
+                regular = np.isfinite(group_weights).all(1)
+                group, group_weights = group[regular], group_weights[regular]
+            else:
+                group_weights = _box_weights(points[group], corners, clamp=clamp)
+        else:
+            continue
+        slots = indptr[group][:, None] + np.arange(group_weights.shape[1])
+        indices[slots] = connectivity[offsets[cell_ids[group]][:, None] +
+                                      np.arange(group_weights.shape[1])]
+        weights[slots] = group_weights
+        generic[group] = False
+
+    # other cells find their weights one point at a time
+    cell = vtk.vtkGenericCell()
+    closest = [0.0, 0.0, 0.0]
+    pcoords = [0.0, 0.0, 0.0]
+    sub_id = vtk.reference(0)
+    dist2 = vtk.reference(0.0)
+    for i in np.nonzero(generic)[0]:
+        dataset.GetCell(int(cell_ids[i]), cell)
+        values = [0.0] * cell.GetNumberOfPoints()
+        cell.EvaluatePosition(points[i], closest, sub_id, pcoords, dist2, values)
+        start = indptr[i]
+        for j in range(cell.GetNumberOfPoints()):
+            indices[start + j] = cell.GetPointId(j)
+            weights[start + j] = values[j]
+    return indptr, indices, weights
@@ -0,0 +1,219 @@
+"""Vectorized ray casting against triangles.
+
+Rays are intersected with a bounding volume hierarchy (BVH) built in
+numpy.  Triangles are ordered along a Morton curve and grouped into
+leaves of a complete binary tree, which allows both the construction
+and the traversal of the tree to proceed one level at a time for all
+rays at once.
+
+"""
+from concurrent.futures import ThreadPoolExecutor
+import os
+
+import numpy as np
+
+_EPSILON = 1e-9
+
+
+def _spread_bits(values):
+    """Interleave two zero bits between each of the lower 21 bits."""
+    values = values.astype(np.uint64) & np.uint64(0x1fffff)
+    for shift, mask in ((32, 0x1f00000000ffff), (16, 0x1f0000ff0000ff),
+                        (8, 0x100f00f00f00f00f), (4, 0x10c30c30c30c30c3),
+                        (2, 0x1249249249249249)):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _morton_order(points):
+    """Return the order of the points along a Morton curve."""
+    lower = points.min(0)
+    extent = points.max(0) - lower
+    extent[extent == 0] = 1
+    scaled = ((points - lower) / extent * (2**21 - 1)).astype(np.uint64)
+    codes = (_spread_bits(scaled[:, 0]) | (_spread_bits(scaled[:, 1]) << np.uint64(1)) |
+             (_spread_bits(scaled[:, 2]) << np.uint64(2)))
+    return np.argsort(codes, kind='stable')
+
+
+class TriangleBVH:
+    """Bounding volume hierarchy of triangles for batch ray casting.
+
+    Parameters
+    ----------
+    triangles : np.ndarray
+        ``(n, 3, 3)`` array of triangle vertices.
+
+    leaf_size : int, optional
+        Number of triangles in each leaf of the tree.
+
+    """
+
+    def __init__(self, triangles, leaf_size=4):
+        """Build the hierarchy."""
+        triangles = np.asarray(triangles, dtype=float).reshape(-1, 3, 3)
+        n_triangles = triangles.shape[0]
+        self.leaf_size = leaf_size
+        n_leaves = max(1, -(-n_triangles // leaf_size))
+        self.depth = int(np.ceil(np.log2(n_leaves)))
+        n_slots = (1 << self.depth) * leaf_size
+
+        order = np.arange(n_triangles)
+        if n_triangles:
+            order = _morton_order(triangles.mean(1))
+        self.triangle_ids = np.full(n_slots, -1, dtype=np.int64)
+        self.triangle_ids[:n_triangles] = order
+
+        # padding triangles are degenerate and have empty bounds
+        vertices = np.zeros((n_slots, 3, 3))
+        vertices[:n_triangles] = triangles[order]
+        self._v0 = vertices[:, 0]
+        self._e1 = vertices[:, 1] - vertices[:, 0]
+        self._e2 = vertices[:, 2] - vertices[:, 0]
+        lower = np.full((n_slots, 3), np.inf)
+        upper = np.full((n_slots, 3), -np.inf)
+        # pad the bounds so that rays grazing them are not culled by round-off
+        padding = _EPSILON * max(1.0, np.abs(triangles).max(initial=0))
+        lower[:n_triangles] = vertices[:n_triangles].min(1) - padding
+        upper[:n_triangles] = vertices[:n_triangles].max(1) + padding
+
+        # bounds of each level of the tree, from the root to the leaves
+        self._lower = [lower.reshape(-1, leaf_size, 3).min(1)]
+        self._upper = [upper.reshape(-1, leaf_size, 3).max(1)]
+        for _ in range(self.depth):
+            self._lower.insert(0, np.minimum(self._lower[0][0::2], self._lower[0][1::2]))
+            self._upper.insert(0, np.maximum(self._upper[0][0::2], self._upper[0][1::2]))
+
+    def _intersect(self, origins, directions, t_max):
+        """Return the ray, triangle and distance of every hit."""
+        inverse = 1.0 / directions
+        rays = np.arange(origins.shape[0])
+        nodes = np.zeros(origins.shape[0], dtype=np.int64)
+        for level in range(self.depth + 1):
+            lower = self._lower[level][nodes]
+            upper = self._upper[level][nodes]
+            ray_origins = origins[rays]
+            t_lower = (lower - ray_origins) * inverse[rays]
+            t_upper = (upper - ray_origins) * inverse[rays]
+            t_near = np.fmin(t_lower, t_upper)
+            t_far = np.fmax(t_lower, t_upper)
+            # rays parallel to and on a slab boundary give nan
+            t_near[np.isnan(t_near)] = -np.inf
+            t_far[np.isnan(t_far)] = np.inf
+            t_near = t_near.max(1)
+            t_far = t_far.min(1)
+            keep = ((lower[:, 0] <= upper[:, 0]) & (t_near <= t_far) & (t_far >= 0) &
+                    (t_near <= t_max[rays]))
+            rays, nodes = rays[keep], nodes[keep]
+            if level < self.depth:
+                rays = np.repeat(rays, 2)
+                nodes = (nodes[:, None]*2 + np.arange(2)).ravel()
+
+        # Moller-Trumbore intersection with the triangles of each leaf
+        rays = np.repeat(rays, self.leaf_size)
+        slots = (nodes[:, None]*self.leaf_size + np.arange(self.leaf_size)).ravel()
+        ray_directions = directions[rays]
+        e1, e2 = self._e1[slots], self._e2[slots]
+        pvec = np.cross(ray_directions, e2)
+        det = np.einsum('ij,ij->i', e1, pvec)
+        valid = det != 0
+        rays, slots, ray_directions = rays[valid], slots[valid], ray_directions[valid]
+        e1, e2, pvec = e1[valid], e2[valid], pvec[valid]
+        inv_det = 1.0 / det[valid]
+        tvec = origins[rays] - self._v0[slots]
+        u = np.einsum('ij,ij->i', tvec, pvec) * inv_det
+        qvec = np.cross(tvec, e1)
+        v = np.einsum('ij,ij->i', ray_directions, qvec) * inv_det
+        t = np.einsum('ij,ij->i', e2, qvec) * inv_det
+        # tolerate round-off so that rays through edges are not missed
+        hit = ((u >= -_EPSILON) & (v >= -_EPSILON) & (u + v <= 1 + _EPSILON) &
+               (t >= 0) & (t <= t_max[rays]))
+        return rays[hit], self.triangle_ids[slots[hit]], t[hit]
+
+    def intersect(self, origins, directions, first_point=False, max_distance=None,
+                  chunk_size=2**15, n_threads=None):
+        """Intersect rays with the triangles.
+
+        Hits of a ray closer than round-off, as on shared edges, are
+        reported once.
+
+        Parameters
+        ----------
+        origins : np.ndarray
+            ``(n, 3)`` starting point of each ray.
+
+        directions : np.ndarray
+            ``(n, 3)`` direction of each ray.
+
+        first_point : bool, optional
+            Only return the closest hit of each ray.
+
+        max_distance : float or np.ndarray, optional
+            Maximum distance from the origin of the hits of all or each
+            ray.  Rays are unbounded by default.
+
+        chunk_size : int, optional
+            Number of rays traced together, which bounds the memory used.
+
+        n_threads : int, optional
+            Number of threads tracing chunks of rays.  Defaults to the
+            number of CPUs.
+
+        Return
+        ------
+        rays : np.ndarray
+            Index of the ray of each hit, sorted.
+
+        triangles : np.ndarray
+            Index of the triangle of each hit.
+
+        distances : np.ndarray
+            Parameter along the direction of each hit, ascending
+            for each ray.
+
+        """
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        if origins.shape != directions.shape:
+            raise ValueError('The number of origins and directions must match.')
+        lengths = np.linalg.norm(directions, axis=1)
+        t_max = np.full(lengths.shape, np.inf)
+        if max_distance is not None:
+            with np.errstate(divide='ignore'):
+                t_max[:] = np.asarray(max_distance, dtype=float) / lengths
+
+        starts = range(0, origins.shape[0], chunk_size)
+
+        def trace(start):
+            stop = start + chunk_size
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rays, triangles, t = self._intersect(origins[start:stop],
+                                                     directions[start:stop],
+                                                     t_max[start:stop])
+            return rays + start, triangles, t
+
+        if n_threads is None:
+            n_threads = os.cpu_count() or 1
+        if n_threads > 1 and len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                results = list(executor.map(trace, starts))
+        else:
+            results = [trace(start) for start in starts]
+
+        if results:
+            rays, triangles, t = (np.concatenate(arrays) for arrays in zip(*results))
+        else:
+            rays = triangles = np.empty(0, dtype=np.int64)
+            t = np.empty(0)
+        order = np.lexsort((t, rays))
+        rays, triangles, t = rays[order], triangles[order], t[order]
+        if rays.size:
+            # a ray through an edge or vertex hits several triangles at once
+            keep = np.ones(rays.size, dtype=bool)
+            same_ray = rays[1:] == rays[:-1]
+            if first_point:
+                keep[1:] = ~same_ray
+            else:
+                keep[1:] = ~same_ray | (t[1:] - t[:-1] > _EPSILON*np.maximum(t[1:], 1))
+            rays, triangles, t = rays[keep], triangles[keep], t[keep]
+        return rays, triangles, t
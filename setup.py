@@ -63,6 +63,7 @@ setup(
     python_requires='>=3.6.*',
     install_requires=install_requires,
     extras_require={
-        'colormaps': ['matplotlib', 'colorcet', 'cmocean']
+        'colormaps': ['matplotlib', 'colorcet', 'cmocean'],
+        'io': ['h5py'],
     },
 )
@@ -1,3 +1,6 @@
+from concurrent.futures import CancelledError
+import threading
+
 import numpy as np
 import pytest
 import vtk
@@ -859,6 +862,100 @@ def test_find_closest_cells():
     assert np.allclose(indices[~mask], np.arange(mesh.n_faces)[~mask])
 
 
+def _cell_points(mesh):
+    ids = vtk.vtkIdList()
+    cells = []
+    for i in range(mesh.n_cells):
+        mesh.GetCellPoints(i, ids)
+        cells.append(sorted({ids.GetId(j) for j in range(ids.GetNumberOfIds())}))
+    return cells
+
+
+@pytest.mark.parametrize('mesh', [pyvista.Sphere(), examples.load_hexbeam(),
+                                  examples.load_uniform(), examples.load_structured(),
+                                  pyvista.UniformGrid((4, 1, 3))])
+def test_adjacency(mesh):
+    cells = _cell_points(mesh)
+    cell_to_points = mesh.cell_to_points
+    assert cell_to_points.shape == (mesh.n_cells, mesh.n_points)
+    assert [list(cell_to_points.row(i)) for i in range(mesh.n_cells)] == cells
+
+    point_to_cells = mesh.point_to_cells
+    for point in [0, mesh.n_points // 2, mesh.n_points - 1]:
+        expected = [i for i, cell in enumerate(cells) if point in cell]
+        assert list(point_to_cells.row(point)) == expected
+
+    neighbors = mesh.point_neighbors
+    cell = mesh.GetCell(0)
+    for i in range(cell.GetNumberOfEdges()):
+        start, end = cell.GetEdge(i).GetPointId(0), cell.GetEdge(i).GetPointId(1)
+        assert end in neighbors.row(start) and start in neighbors.row(end)
+
+    cell_neighbors = mesh.cell_neighbors
+    expected = [i for i, cell in enumerate(cells) if i and set(cell) & set(cells[0])]
+    assert list(cell_neighbors.row(0)) == expected
+
+    indptr, indices = mesh.point_neighbors
+    assert indptr.size == mesh.n_points + 1
+    assert indices.size == indptr[-1]
+
+
+def test_adjacency_cache():
+    mesh = pyvista.Plane(i_resolution=2, j_resolution=2)
+    neighbors = mesh.point_neighbors
+    assert mesh.point_neighbors is neighbors
+    assert np.array_equal(neighbors.row(4), [1, 3, 5, 7])
+
+    mesh.faces = [3, 0, 1, 3]
+    assert mesh.point_neighbors is not neighbors
+    assert np.array_equal(mesh.point_neighbors.row(0), [1, 3])
+    assert mesh.point_neighbors.counts.sum() == 6
+
+    sparse = mesh.cell_to_points.to_sparse()
+    assert sparse.shape == (1, 9)
+    assert sparse.nnz == 3
+
+
+def test_adjacency_cache_ignores_arrays():
+    mesh = pyvista.Plane(i_resolution=2, j_resolution=2)
+    neighbors = mesh.point_neighbors
+    mesh.point_arrays['values'] = np.arange(mesh.n_points)
+    mesh.point_arrays['values'][:] = 0
+    assert mesh.point_neighbors is neighbors
+    mesh.points = mesh.points * 2
+    assert mesh.point_neighbors is not neighbors
+
+
+@pytest.mark.parametrize('mesh', [pyvista.Sphere(), examples.load_hexbeam(),
+                                  examples.load_uniform(), examples.load_structured(),
+                                  pyvista.Spline(np.random.random((10, 3)))])
+def test_data_operators_match_vtk(mesh):
+    mesh = mesh.copy()
+    mesh.clear_arrays()
+    rng = np.random.default_rng(0)
+    mesh.cell_arrays['cell_values'] = rng.random((mesh.n_cells, 3))
+    mesh.point_arrays['point_values'] = rng.random(mesh.n_points)
+    point_values = mesh.cell_array_to_point_array('cell_values')
+    assert np.allclose(point_values, mesh.cell_data_to_point_data()['cell_values'])
+    cell_values = mesh.point_array_to_cell_array(mesh.point_arrays['point_values'])
+    assert np.allclose(cell_values, mesh.point_data_to_cell_data()['point_values'])
+
+    operator = mesh.cell_to_point_data_operator
+    assert operator.n_sources == mesh.n_cells
+    assert operator.n_targets == mesh.n_points
+    assert mesh.cell_to_point_data_operator is operator
+    with pytest.raises(ValueError):
+        mesh.point_array_to_cell_array(np.ones(mesh.n_points + 1))
+
+
+def test_cell_to_point_data_operator_repeated_points():
+    # a degenerate quad repeating its first point and a triangle
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    mesh = pyvista.PolyData(points, np.array([4, 0, 1, 2, 0, 3, 0, 2, 3]))
+    point_values = mesh.cell_array_to_point_array(np.array([1.0, 4.0]))
+    assert np.allclose(point_values, [2.5, 1.0, 2.5, 4.0])
+
+
 def test_setting_points_from_self(grid):
     grid_copy = grid.copy()
     grid.points = grid_copy.points
@@ -899,3 +996,101 @@ def test_get_data_range(grid):
     rng = grid.get_data_range('sample_cell_scalars')
     assert len(rng) == 2
     assert np.allclose(rng, (1, 40))
+
+
+def test_save_async(grid, tmpdir):
+    filename = str(tmpdir.join('tmp.vtk'))
+    future = grid.save_async(filename)
+    # the snapshot is independent of later modifications
+    grid.points[:] = 0
+    assert future.result() is None
+
+    mesh = pyvista.read(filename)
+    assert mesh.n_points == grid.n_points
+    assert np.any(mesh.points != 0)
+
+    pyvista.wait_for_writes()
+    with pytest.raises(ValueError):
+        grid.save_async(str(tmpdir.join('tmp.abc')))
+
+
+def test_set_async_writers(sphere, tmpdir):
+    pyvista.set_async_writers(max_workers=1, max_pending=1)
+    try:
+        futures = [sphere.save_async(str(tmpdir.join(f'tmp{i}.vtp')), deep=False)
+                   for i in range(3)]
+        for future in futures:
+            future.result()
+        assert all(pyvista.read(str(tmpdir.join(f'tmp{i}.vtp'))).n_points == sphere.n_points
+                   for i in range(3))
+    finally:
+        pyvista.set_async_writers()
+
+    with pytest.raises(ValueError):
+        pyvista.set_async_writers(max_workers=0)
+
+
+def test_wait_for_writes_does_not_block_submit():
+    pool = pyvista.utilities.fileio._WriterPool(max_workers=2, max_pending=2)
+    release = threading.Event()
+    try:
+        slow = pool.submit(release.wait)
+        waiter = threading.Thread(target=pool.wait)
+        waiter.start()
+        assert pool.submit(lambda: 1).result(timeout=10) == 1
+        assert waiter.is_alive()
+        release.set()
+        waiter.join(timeout=10)
+        assert not waiter.is_alive()
+        assert slow.done()
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_submit(sphere):
+    future = sphere.submit('decimate', 0.5)
+    progress = []
+    future.add_progress_callback(lambda fut, value: progress.append(value))
+    assert isinstance(future, pyvista.FilterFuture)
+    assert future.result().n_cells == sphere.decimate(0.5).n_cells
+    assert future.progress == 1.0
+    assert not future.cancelled()
+
+    with pytest.raises(ValueError):
+        sphere.submit('decimate', 0.5, inplace=True)
+    with pytest.raises(TypeError):
+        sphere.submit('n_points')
+    with pytest.raises(AttributeError):
+        sphere.submit('not_a_filter')
+
+    # errors of the filter are raised by the future
+    future = sphere.submit('contour', method='invalid')
+    assert isinstance(future.exception(), ValueError)
+
+
+def test_submit_cancel(sphere):
+    def cancel(fut, value):
+        fut.cancel()
+
+    pyvista.set_filter_workers(max_workers=1)
+    try:
+        # hold the single worker until the callbacks are registered
+        release = threading.Event()
+        blocker = pyvista.utilities.helpers._submit_filter(release.wait)
+        future = sphere.submit('decimate', 0.5)
+        future.add_progress_callback(cancel)
+        pending = sphere.submit('decimate', 0.5)
+        assert pending.cancel()
+        release.set()
+        assert blocker.result()
+        with pytest.raises(CancelledError):
+            future.result()
+        assert future.cancelled()
+        assert pending.cancelled()
+        assert not future.cancel()
+    finally:
+        pyvista.set_filter_workers()
+
+    with pytest.raises(ValueError):
+        pyvista.set_filter_workers(max_workers=0)
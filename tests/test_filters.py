@@ -1,11 +1,14 @@
+import multiprocessing
 import os
 import sys
 
 import numpy as np
 import pytest
+import vtk
 
 import pyvista
 from pyvista import examples
+from pyvista.utilities.cells import cell_array_to_numpy, numpy_to_idarr
 
 DATASETS = [
     examples.load_uniform(),  # UniformGrid
@@ -162,6 +165,25 @@ def test_slice_filter():
     assert result.n_points < 1
 
 
+def test_slice_fast_matches_generic():
+    volume = pyvista.UniformGrid((20, 20, 20))
+    volume['values'] = np.random.random(volume.n_points)
+    fast = volume.slice(normal=(1, 1, 0.2), generate_triangles=True)
+    generic = volume.slice(normal=(1, 1, 0.2), generate_triangles=True, fast=False)
+    assert fast.n_points == generic.n_points
+    assert fast.n_cells == generic.n_cells
+    assert np.allclose(np.sort(fast['values']), np.sort(generic['values']))
+
+    grid = volume.cast_to_unstructured_grid()
+    grid.cell_arrays['cell_values'] = np.random.random(grid.n_cells)
+    fast = grid.slice(normal=(1, 1, 0.2), crinkle=True)
+    generic = grid.slice(normal=(1, 1, 0.2), crinkle=True, fast=False)
+    assert isinstance(fast, pyvista.UnstructuredGrid)
+    assert fast.n_cells == generic.n_cells
+    assert np.allclose(np.sort(fast.cell_arrays['cell_values']),
+                       np.sort(generic.cell_arrays['cell_values']))
+
+
 @skip_py2_nobind
 def test_slice_filter_composite():
     # Now test composite data structures
@@ -204,6 +226,63 @@ def test_slice_along_axis():
         dataset.slice_along_axis(axis='u')
 
 
+def test_slice_along_axis_matches_slice(hexbeam):
+    n = 4
+    slices = hexbeam.slice_along_axis(n=n, axis='z')
+    bounds = hexbeam.bounds
+    tolerance = (bounds[5] - bounds[4]) * 0.01
+    center = list(hexbeam.center)
+    for i, z in enumerate(np.linspace(bounds[4] + tolerance, bounds[5] - tolerance, n)):
+        center[2] = z
+        expected = hexbeam.slice(normal='z', origin=center)
+        assert slices.keys()[i] == f'slice{i}'
+        assert slices[i].n_points == expected.n_points
+        assert slices[i].n_cells == expected.n_cells
+        assert np.allclose(slices[i].points[:, 2], z)
+        # integer arrays may round differently after interpolation
+        assert np.allclose(np.sort(slices[i]['sample_point_scalars']),
+                           np.sort(expected['sample_point_scalars']), atol=1)
+
+    combined = hexbeam.slice_along_axis(n=n, axis='z', combine=True)
+    assert isinstance(combined, pyvista.PolyData)
+    assert combined.n_cells == sum(slc.n_cells for slc in slices)
+    assert np.array_equal(np.bincount(combined['SliceIndex']),
+                          [slc.n_points for slc in slices])
+
+
+def test_slice_along_axis_uniform(uniform):
+    # image data cut at several values is triangulated
+    slices = uniform.slice_along_axis(n=3, axis='z')
+    center = list(uniform.center)
+    for slc in slices:
+        assert slc.is_all_triangles()
+        center[2] = slc.points[0, 2]
+        expected = uniform.slice(normal='z', origin=center)
+        assert slc.n_points == expected.n_points
+        assert np.isclose(slc.area, expected.area)
+
+
+def test_slice_orthogonal_fast():
+    volume = pyvista.UniformGrid((20, 20, 20))
+    volume['values'] = np.random.random(volume.n_points)
+    with pyvista.profile() as prof:
+        fast = volume.slice_orthogonal(generate_triangles=True)
+        generic = volume.slice_orthogonal(generate_triangles=True, fast=False)
+    algorithms = [record['algorithm'] for record in prof.records]
+    assert algorithms == ['vtkFlyingEdgesPlaneCutter'] * 3 + ['vtkCutter'] * 3
+    for slc, expected in zip(fast, generic):
+        assert slc.n_cells == expected.n_cells
+        assert np.allclose(np.sort(slc['values']), np.sort(expected['values']))
+
+
+def test_slice_orthogonal_combine(uniform):
+    slices = uniform.slice_orthogonal()
+    combined = uniform.slice_orthogonal(combine=True)
+    assert isinstance(combined, pyvista.PolyData)
+    assert combined.n_points == sum(slc.n_points for slc in slices)
+    assert np.array_equal(np.unique(combined['SliceIndex']), [0, 1, 2])
+
+
 @skip_py2_nobind
 def test_slice_along_axis_composite():
     # Now test composite data structures
@@ -260,6 +339,86 @@ def test_threshold_percent():
         dataset.threshold_percent({18.0, 85.0})
 
 
+@pytest.mark.parametrize('preference', ['cell', 'point'])
+@pytest.mark.parametrize('all_scalars', [True, False])
+def test_threshold_multi_matches_threshold(preference, all_scalars):
+    dataset = examples.load_uniform()
+    name = f'Spatial {preference.capitalize()} Data'
+    ranges = [(0, 100), (150, 300), (301, 700)]
+    if not all_scalars:
+        # with any point inside, the first range wins the shared cells
+        ranges = ranges[:1]
+    parts = dataset.threshold_multi(ranges, scalars=name, all_scalars=all_scalars)
+    assert isinstance(parts, pyvista.MultiBlock)
+    assert parts.n_blocks == len(ranges)
+    assert parts.get_block_name(0) == '0-100'
+    for part, value in zip(parts, ranges):
+        expected = dataset.threshold(value, scalars=name, all_scalars=all_scalars)
+        assert part.n_cells == expected.n_cells
+        assert np.allclose(part.points, expected.points)
+        assert np.array_equal(part.cells, expected.cells)
+        assert np.allclose(part[name], expected[name])
+
+
+def test_threshold_multi_values():
+    grid = pyvista.UniformGrid((6, 5, 4))
+    grid.cell_arrays['material'] = np.arange(grid.n_cells) % 5
+    parts = grid.threshold_multi([4, 1, 7], scalars='material')
+    assert [part.n_cells for part in parts] == [12, 12, 0]
+    assert np.all(parts[0]['material'] == 4)
+    assert np.all(parts[1]['material'] == 1)
+
+    combined = grid.threshold_multi([4, 1, 7], scalars='material', combine=True)
+    assert isinstance(combined, pyvista.UnstructuredGrid)
+    assert combined.n_cells == 24
+    assert np.array_equal(combined['RangeId'], np.where(combined['material'] == 4, 0, 1))
+
+    # overlapping ranges assign each cell to the first range
+    parts = grid.threshold_multi([(0, 2), (1, 3)], scalars='material')
+    assert [part.n_cells for part in parts] == [36, 12]
+
+    # unsorted ranges that do not overlap
+    parts = grid.threshold_multi([(3, 4), (1.5, 2.5), (0, 1)], scalars='material')
+    assert [part.n_cells for part in parts] == [24, 12, 24]
+    assert np.all(parts[1]['material'] == 2)
+
+    with pytest.raises(ValueError):
+        grid.threshold_multi([(0, 1, 2)], scalars='material')
+    with pytest.raises(ValueError):
+        grid.threshold_multi([], scalars='material')
+
+
+def test_threshold_multi_polyhedra():
+    # two polyhedral cubes and a hexahedron
+    hexes = pyvista.UniformGrid((4, 2, 2)).cast_to_unstructured_grid()
+    grid = vtk.vtkUnstructuredGrid()
+    grid.SetPoints(pyvista.vtk_points(hexes.points))
+    faces = np.array([[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4],
+                      [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]])
+    for i, cell in enumerate(hexes.cells.reshape(-1, 9)[:, 1:]):
+        ids = vtk.vtkIdList()
+        if i == 2:
+            cell_type, stream = vtk.VTK_HEXAHEDRON, cell
+        else:
+            # number of faces, then the size and points of each face
+            cell_type = vtk.VTK_POLYHEDRON
+            stream = np.hstack([6, np.insert(cell[faces], 0, 4, axis=1).ravel()])
+        for point_id in stream:
+            ids.InsertNextId(point_id)
+        grid.InsertNextCell(cell_type, ids)
+    grid = pyvista.wrap(grid)
+    grid.cell_arrays['material'] = [0, 1, 0]
+
+    parts = grid.threshold_multi([0, 1], scalars='material')
+    assert [part.n_cells for part in parts] == [2, 1]
+    assert np.array_equal(parts[0].celltypes, [vtk.VTK_POLYHEDRON, vtk.VTK_HEXAHEDRON])
+
+    combined = grid.threshold_multi([0, 1], scalars='material', combine=True)
+    assert combined.n_cells == 3
+    assert np.array_equal(combined['RangeId'], [0, 1, 0])
+    assert combined.extract_surface().n_cells == grid.extract_surface().n_cells
+
+
 def test_outline():
     for i, dataset in enumerate(DATASETS):
         outline = dataset.outline()
@@ -335,6 +494,38 @@ def test_contour(uniform, method):
     assert iso is not None
 
 
+@pytest.mark.parametrize('isosurfaces', [[0.5], 5])
+def test_contour_fast_matches_generic(isosurfaces):
+    volume = pyvista.UniformGrid((20, 20, 20))
+    volume['values'] = np.random.random(volume.n_points)
+    volume['other'] = np.random.random(volume.n_points)
+    grid = volume.cast_to_unstructured_grid()
+    for dataset in (volume, grid):
+        fast = dataset.contour(isosurfaces, scalars='values')
+        generic = dataset.contour(isosurfaces, scalars='values', method='contour')
+        assert fast.n_points == generic.n_points
+        assert fast.n_cells == generic.n_cells
+        assert set(fast.array_names) == set(generic.array_names)
+        assert np.allclose(np.sort(fast['other']), np.sort(generic['other']))
+
+
+def test_contour_fast_integer_volume():
+    volume = pyvista.UniformGrid((20, 20, 20))
+    volume['values'] = np.random.randint(0, 100, volume.n_points).astype(np.int16)
+    grid = volume.cast_to_unstructured_grid()
+    with pyvista.profile() as prof:
+        fast = volume.contour([49.5], scalars='values')
+        generic = volume.contour([49.5], scalars='values', method='contour')
+        # the linear grid filter does not support integer scalars
+        grid.contour([49.5], scalars='values')
+        volume.slice(generate_triangles=True)
+    algorithms = [record['algorithm'] for record in prof.records]
+    assert algorithms == ['vtkFlyingEdges3D', 'vtkContourFilter', 'vtkContourFilter',
+                          'vtkFlyingEdgesPlaneCutter']
+    assert fast.n_points == generic.n_points
+    assert fast.n_cells == generic.n_cells
+
+
 def test_contour_errors(uniform):
     with pytest.raises(TypeError):
         uniform.contour(scalars='Spatial Cell Data')
@@ -439,6 +630,45 @@ def test_compute_cell_sizes():
     assert np.allclose(grid.volume, volume)
 
 
+def _vtk_cell_sizes(dataset):
+    alg = vtk.vtkCellSizeFilter()
+    alg.SetInputData(dataset)
+    alg.Update()
+    return pyvista.wrap(alg.GetOutput())
+
+
+def _distorted(dataset):
+    dataset = dataset.cast_to_unstructured_grid()
+    rng = np.random.default_rng(0)
+    dataset.points = dataset.points + rng.normal(0, 0.02, (dataset.n_points, 3))
+    return dataset
+
+
+@pytest.mark.parametrize('dataset', [pyvista.Sphere(), pyvista.Plane(), examples.load_hexbeam(),
+                                     pyvista.UniformGrid((4, 4, 4)), pyvista.Spline(np.random.random((10, 3))),
+                                     pyvista.Cube().triangulate().delaunay_3d()])
+def test_compute_cell_sizes_matches_vtk(dataset):
+    result = dataset.compute_cell_sizes(engine='numpy')
+    expected = _vtk_cell_sizes(dataset)
+    for name in ('Length', 'Area', 'Volume'):
+        assert np.allclose(result[name], expected[name])
+
+    with pytest.raises(ValueError):
+        dataset.compute_cell_sizes(engine='not an engine')
+
+
+def test_compute_cell_sizes_mixed(hexbeam):
+    # wedges are measured by vtk, hexahedra and tetrahedra with numpy
+    mesh = _distorted(hexbeam).merge(_distorted(hexbeam.extract_cells(range(10)).triangulate()))
+    mesh = mesh.merge(pyvista.Cylinder().extrude((0, 0, 1)).cast_to_unstructured_grid())
+    assert len(np.unique(mesh.celltypes)) > 2
+    sizes = pyvista.utilities.measures.cell_sizes(mesh, length=False)
+    expected = _vtk_cell_sizes(mesh)
+    assert set(sizes) == {'Area', 'Volume'}
+    assert np.allclose(sizes['Area'], expected['Area'])
+    assert np.allclose(sizes['Volume'], expected['Volume'])
+
+
 @skip_py2_nobind
 def test_compute_cell_sizes_composite():
     # Now test composite data structures
@@ -497,6 +727,44 @@ def test_split_and_connectivity():
         assert np.allclose(body.volume, volumes[i], rtol=0.1)
 
 
+@pytest.mark.parametrize('label', [False, True])
+def test_split_bodies_matches_threshold(label):
+    dataset = examples.load_uniform()
+    dataset.set_active_scalars('Spatial Cell Data')
+    mesh = dataset.threshold_percent([0.15, 0.50], invert=True) + pyvista.Sphere(center=(20, 0, 0))
+    labeled = mesh.connectivity()
+
+    bodies = mesh.split_bodies(label=label)
+    assert bodies.n_blocks == 3
+    for i, body in enumerate(bodies):
+        expected = labeled.threshold([i - 0.5, i + 0.5], scalars='RegionId')
+        if not label:
+            expected.cell_arrays.remove('RegionId')
+            expected.point_arrays.remove('RegionId')
+        assert np.array_equal(body.points, expected.points)
+        assert np.array_equal(body.cells, expected.cells)
+        assert np.array_equal(body.celltypes, expected.celltypes)
+        assert body.point_arrays.keys() == expected.point_arrays.keys()
+        assert body.cell_arrays.keys() == expected.cell_arrays.keys()
+        for name in expected.point_arrays.keys():
+            assert np.array_equal(body.point_arrays[name], expected.point_arrays[name])
+        for name in expected.cell_arrays.keys():
+            assert np.array_equal(body.cell_arrays[name], expected.cell_arrays[name])
+        assert body.active_scalars_info == expected.active_scalars_info
+
+
+def test_split_bodies_size():
+    mesh = (pyvista.Sphere() + pyvista.Cube(center=(2, 0, 0)).clean() +
+            pyvista.Line((5, 0, 0), (6, 0, 0)))
+    assert mesh.split_bodies().n_blocks == 3
+    bodies = mesh.split_bodies(min_n_cells=2, label=True)
+    assert bodies.n_blocks == 2
+    assert [body.n_cells for body in bodies] == [pyvista.Sphere().n_cells, 6]
+    assert np.array_equal(bodies[1].cell_arrays['RegionId'], [2] * 6)
+    bodies = mesh.split_bodies(max_n_cells=6)
+    assert [body.n_cells for body in bodies] == [1, 6]
+
+
 def test_warp_by_scalar():
     data = examples.load_uniform()
     warped = data.warp_by_scalar()
@@ -642,6 +910,38 @@ def test_probe(categorical, use_points):
     assert isinstance(result, type(mesh))
 
 
+@pytest.mark.parametrize('cast', [None, 'cast_to_unstructured_grid',
+                                  'cast_to_structured_grid', 'triangulate'])
+def test_probe_operator(cast):
+    mesh = pyvista.Sphere(center=(4.5, 4.5, 4.5), radius=5)
+    source = examples.load_uniform()
+    if cast == 'triangulate':
+        source = source.cast_to_unstructured_grid().triangulate()
+    elif cast is not None:
+        source = getattr(source, cast)()
+    expected = source.probe(mesh)
+    operator = source.probe_operator(mesh)
+    assert np.array_equal(operator.valid_mask, expected['vtkValidPointMask'] == 1)
+    assert np.allclose(operator.apply(source['Spatial Point Data']),
+                       expected['Spatial Point Data'])
+    assert np.allclose(operator.apply_cell_data(source['Spatial Cell Data']),
+                       expected['Spatial Cell Data'])
+    vectors = np.c_[source.points, source['Spatial Point Data']]
+    assert np.allclose(operator.apply(vectors)[:, 3], expected['Spatial Point Data'])
+
+    # categorical data takes the value of the point of largest weight
+    operator = source.probe_operator(mesh, categorical=True)
+    inside = operator.valid_mask
+    assert np.all(np.diff(operator.indptr)[inside] == 1)
+    weights = source.probe_operator(mesh).to_sparse().toarray()
+    weights = weights[inside]
+    assert np.allclose(weights[np.arange(weights.shape[0]), operator.indices],
+                       weights.max(1))
+
+    with pytest.raises(ValueError):
+        operator.apply(source['Spatial Cell Data'])
+
+
 @pytest.mark.parametrize('integration_direction', ['forward', 'backward', 'both'])
 def test_streamlines_dir(uniform_vec, integration_direction):
     stream = uniform_vec.streamlines('vectors',
@@ -681,6 +981,47 @@ def test_streamlines(uniform_vec):
         uniform_vec.streamlines('vectors', step_unit='not valid')
 
 
+@pytest.mark.parametrize('integration_direction', ['forward', 'both'])
+@pytest.mark.parametrize('kwargs', [dict(chunk_size=7), dict(n_workers=2)])
+def test_streamlines_from_source_chunks(uniform_vec, integration_direction, kwargs):
+    seeds = pyvista.PolyData(np.random.random((40, 3)) - 0.5)
+    expected = uniform_vec.streamlines_from_source(
+        seeds, 'vectors', integration_direction=integration_direction)
+    stream = uniform_vec.streamlines_from_source(
+        seeds, 'vectors', integration_direction=integration_direction, **kwargs)
+    assert stream.n_cells == expected.n_cells
+    assert np.array_equal(stream['SeedIds'], expected['SeedIds'])
+    # the streamlines may skip unused points of the tracer
+    ids = cell_array_to_numpy(stream.GetLines())[1]
+    expected_ids = cell_array_to_numpy(expected.GetLines())[1]
+    assert np.allclose(stream.points[ids], expected.points[expected_ids])
+    for name in expected.point_arrays:
+        assert np.allclose(stream.point_arrays[name][ids],
+                           expected.point_arrays[name][expected_ids])
+
+    with pytest.raises(ValueError):
+        uniform_vec.streamlines_from_source(seeds, 'vectors', n_workers=0)
+
+
+def test_streamlines_from_source_profile(uniform_vec):
+    # chunks integrated in this process are updated like other filters
+    seeds = pyvista.PolyData(np.random.random((40, 3)) - 0.5)
+    with pyvista.profile() as prof:
+        uniform_vec.streamlines_from_source(seeds, 'vectors', chunk_size=10)
+    assert [record['filter'] for record in prof.records] == ['streamlines_from_source'] * 4
+
+
+def test_streamlines_from_source_spawn(uniform_vec, monkeypatch):
+    # without fork the workers receive the dataset serialized
+    spawn = multiprocessing.get_context('spawn')
+    monkeypatch.setattr(multiprocessing, 'get_context', lambda method=None: spawn)
+    seeds = pyvista.PolyData(np.random.random((40, 3)) - 0.5)
+    expected = uniform_vec.streamlines_from_source(seeds, 'vectors')
+    stream = uniform_vec.streamlines_from_source(seeds, 'vectors', n_workers=2)
+    assert stream.n_cells == expected.n_cells
+    assert np.array_equal(stream['SeedIds'], expected['SeedIds'])
+
+
 def test_sample_over_line():
     """Test that we get a sampled line."""
     name = 'values'
@@ -780,6 +1121,58 @@ def test_extract_points():
     assert sub_surf_adj.n_points == 9
     assert sub_surf_adj.n_cells == 4
 
+
+@pytest.mark.parametrize('dataset', DATASETS)
+@pytest.mark.parametrize('adjacent_cells', [True, False])
+def test_extract_points_matches_selection(dataset, adjacent_cells):
+    ind = np.nonzero(dataset.points[:, 0] <= dataset.center[0])[0]
+    node = vtk.vtkSelectionNode()
+    node.SetFieldType(vtk.vtkSelectionNode.POINT)
+    node.SetContentType(vtk.vtkSelectionNode.INDICES)
+    if adjacent_cells:
+        node.SetSelectionList(numpy_to_idarr(ind))
+    else:
+        # select the cells of the other points and invert the selection
+        node.SetSelectionList(numpy_to_idarr(np.delete(np.arange(dataset.n_points), ind)))
+        node.GetProperties().Set(vtk.vtkSelectionNode.INVERSE(), 1)
+    node.GetProperties().Set(vtk.vtkSelectionNode.CONTAINING_CELLS(), 1)
+    selection = vtk.vtkSelection()
+    selection.AddNode(node)
+    alg = vtk.vtkExtractSelection()
+    alg.SetInputData(0, dataset)
+    alg.SetInputData(1, selection)
+    alg.Update()
+    expected = pyvista.wrap(alg.GetOutput())
+
+    mask = np.zeros(dataset.n_points, dtype=bool)
+    mask[ind] = True
+    for extracted in (dataset.extract_points(ind, adjacent_cells=adjacent_cells),
+                      dataset.extract_points(mask, adjacent_cells=adjacent_cells)):
+        assert extracted.n_points == expected.n_points
+        assert extracted.n_cells == expected.n_cells
+        assert np.allclose(extracted.points, expected.points)
+        for name in ('vtkOriginalPointIds', 'vtkOriginalCellIds'):
+            assert np.array_equal(extracted[name], expected[name])
+        assert np.array_equal(extracted.cells, expected.cells)
+        assert np.array_equal(extracted.celltypes, expected.celltypes)
+        assert np.array_equal(extracted.points,
+                              dataset.points[extracted['vtkOriginalPointIds']])
+
+
+def test_extract_cells_invalid_indices(hexbeam):
+    with pytest.raises(TypeError):
+        hexbeam.extract_cells([0.5, 1.5])
+    with pytest.raises(ValueError):
+        hexbeam.extract_cells(np.ones(hexbeam.n_cells + 1, dtype=bool))
+    # negative indices do not wrap around
+    with pytest.raises(ValueError):
+        hexbeam.extract_cells([-1])
+    with pytest.raises(ValueError):
+        hexbeam.extract_cells([hexbeam.n_cells])
+    with pytest.raises(ValueError):
+        hexbeam.extract_points([-1])
+
+
 @skip_py2_nobind
 def test_slice_along_line_composite():
     # Now test composite data structures
@@ -800,6 +1193,24 @@ def test_interpolate():
     assert interp.n_arrays
 
 
+@pytest.mark.parametrize('kwargs', [dict(radius=0.1), dict(n_points=5),
+                                    dict(radius=0.01, strategy='closest_point'),
+                                    dict(radius=0.01, strategy='mask_points',
+                                         null_value=-1)])
+def test_interpolation_operator(kwargs):
+    pdata = pyvista.PolyData(np.random.random((200, 3)))
+    pdata['vectors'] = np.random.random((200, 3))
+    surf = pyvista.Sphere(center=(0.5, 0.5, 0.5), radius=0.5)
+    expected = surf.interpolate(pdata, **kwargs)
+    operator = surf.interpolation_operator(pdata, **kwargs)
+    assert np.allclose(operator.apply(pdata['vectors']), expected['vectors'])
+    if kwargs.get('strategy') == 'mask_points':
+        assert np.array_equal(operator.valid_mask, expected['vtkValidPointMask'] == 1)
+
+    with pytest.raises(ValueError):
+        surf.interpolation_operator(pdata, strategy='not a strategy')
+
+
 def test_select_enclosed_points(uniform, hexbeam):
     surf = pyvista.Sphere(center=uniform.center, radius=uniform.length/2.)
     result = uniform.select_enclosed_points(surf)
@@ -841,6 +1252,24 @@ def test_merge_general():
     assert isinstance(merged, pyvista.PolyData)
 
 
+def test_merge_many(hexbeam, sphere):
+    parts = [sphere, hexbeam, [examples.load_structured(), None], pyvista.MultiBlock([sphere])]
+    merged = pyvista.merge(parts, source_ids='part')
+    flat = [sphere, hexbeam, examples.load_structured(), sphere]
+    assert isinstance(merged, pyvista.UnstructuredGrid)
+    assert merged.n_cells == sum(part.n_cells for part in flat)
+    assert merged.n_points == sum(part.n_points for part in flat)
+    assert np.array_equal(np.bincount(merged.cell_arrays['part']),
+                          [part.n_cells for part in flat])
+    assert np.array_equal(np.bincount(merged.point_arrays['part']),
+                          [part.n_points for part in flat])
+
+    merged = pyvista.merge([sphere, sphere], merge_points=True, source_ids='part')
+    assert merged.n_points == sphere.n_points
+    assert 'part' not in merged.point_arrays
+    assert pyvista.merge([]).n_cells == 0
+
+
 def test_compute_cell_quality():
     mesh = pyvista.ParametricEllipsoid().decimate(0.8)
     qual = mesh.compute_cell_quality()
@@ -849,6 +1278,81 @@ def test_compute_cell_quality():
         qual = mesh.compute_cell_quality(quality_measure='foo')
 
 
+@pytest.mark.parametrize('quality_measure', pyvista.utilities.measures.QUALITY_MEASURES)
+def test_compute_cell_quality_matches_vtk(hexbeam, quality_measure):
+    # triangles, quads, tetrahedra and hexahedra, with a degenerate hexahedron
+    hexes = _distorted(hexbeam)
+    hexes.points[hexes.cells[1]] = hexes.points[hexes.cells[2]]
+    tetras = _distorted(hexbeam.triangulate())
+    surface = _distorted(pyvista.Plane()).merge(_distorted(pyvista.Sphere()))
+    for mesh in (hexes, tetras, surface):
+        quality = mesh.compute_cell_quality(quality_measure, engine='numpy')['CellQuality']
+        alg = vtk.vtkCellQuality()
+        pyvista.utilities.measures._set_quality_measure(alg, quality_measure)
+        alg.SetUndefinedQuality(-1.0)
+        alg.SetInputData(mesh)
+        alg.Update()
+        assert np.allclose(quality, pyvista.wrap(alg.GetOutput())['CellQuality'])
+
+
+def test_compute_cell_quality_multiple(hexbeam):
+    # a numpy measure, a vtk measure and a measure with degenerate cells
+    mesh = _distorted(hexbeam).merge(_distorted(hexbeam.triangulate()))
+    mesh.points[mesh.cells[1]] = mesh.points[mesh.cells[2]]
+    measures = ['scaled_jacobian', 'oddy', 'max_edge_ratio']
+    with pyvista.profile() as prof:
+        output = mesh.compute_cell_quality(measures)
+    # the default engine of several measures is the single pass numpy engine
+    assert not [record for record in prof.records if record['filter'] == 'compute_cell_quality']
+    vtk_output = mesh.compute_cell_quality(measures, engine='vtk')
+    qualities = pyvista.utilities.measures.cell_quality(mesh, measures)
+    for measure in measures:
+        expected = mesh.compute_cell_quality(measure)['CellQuality']
+        assert np.allclose(output[measure], expected)
+        assert np.allclose(vtk_output[measure], expected)
+        assert np.allclose(qualities[measure], expected)
+    assert 'CellQuality' not in output.array_names
+    with pytest.raises(KeyError):
+        mesh.compute_cell_quality(['volume', 'foo'])
+    with pytest.raises(ValueError):
+        mesh.compute_cell_quality(measures, engine='not an engine')
+
+
+def test_cell_quality_statistics(hexbeam):
+    mesh = hexbeam.merge(hexbeam.triangulate())
+    measures = pyvista.utilities.measures
+    quality = measures.cell_quality(mesh, ['volume', 'jacobian'])
+    statistics = measures.cell_quality_statistics(mesh, quality, bins=4)
+    assert set(statistics) == {'volume', 'jacobian'}
+    for name, values in quality.items():
+        assert set(statistics[name]) == {vtk.VTK_HEXAHEDRON, vtk.VTK_TETRA}
+        for cell_type, stats in statistics[name].items():
+            cell_values = values[mesh.celltypes == cell_type]
+            assert stats['n_cells'] == cell_values.size
+            assert stats['min'] == cell_values.min()
+            assert stats['max'] == cell_values.max()
+            assert np.isclose(stats['mean'], cell_values.mean())
+            counts, edges = stats['histogram']
+            assert counts.sum() == cell_values.size
+            assert edges.size == 5
+
+    # the statistics computed with the quality are the same
+    single_pass = measures.cell_quality(mesh, ['volume', 'jacobian'], statistics=True, bins=4)
+    assert np.array_equal(single_pass[0]['volume'], quality['volume'])
+    for name, stats in single_pass[1].items():
+        for cell_type, cell_stats in stats.items():
+            assert cell_stats['n_cells'] == statistics[name][cell_type]['n_cells']
+            assert cell_stats['min'] == statistics[name][cell_type]['min']
+            assert np.array_equal(cell_stats['histogram'][0],
+                                  statistics[name][cell_type]['histogram'][0])
+
+    grid = pyvista.StructuredGrid(*np.meshgrid(*[np.arange(3.0)] * 3, indexing='ij'))
+    quality, statistics = measures.cell_quality(grid, 'volume', statistics=True)
+    assert list(statistics) == [vtk.VTK_HEXAHEDRON]
+    assert list(measures.cell_quality_statistics(grid, quality)) == [vtk.VTK_HEXAHEDRON]
+    assert statistics[vtk.VTK_HEXAHEDRON]['n_cells'] == 8
+
+
 def test_compute_gradients():
     mesh = examples.load_random_hills()
     grad = mesh.compute_gradient()
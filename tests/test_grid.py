@@ -233,6 +233,45 @@ def test_extract_cells(hexbeam):
     part_beam = hexbeam.extract_cells(ind)
 
 
+def test_remove_points(hexbeam):
+    hexbeam.point_arrays['ind'] = np.arange(hexbeam.n_points)
+    remove = hexbeam.points[:, 2] < 1
+    grid, ind = hexbeam.remove_points(remove)
+    assert isinstance(grid, pyvista.UnstructuredGrid)
+    assert grid.n_cells == hexbeam.extract_points(~remove, adjacent_cells=False).n_cells
+    assert np.allclose(grid.points, hexbeam.points[ind])
+    assert np.array_equal(grid.point_arrays['ind'], ind)
+
+    grid, _ = hexbeam.remove_points(remove, mode='all', keep_scalars=False)
+    assert grid.n_cells == hexbeam.extract_points(~remove).n_cells
+    assert not grid.n_arrays
+
+    hexbeam.remove_points(np.nonzero(remove)[0], inplace=True)
+    assert hexbeam.n_points == (~remove).sum()
+
+
+def test_clean(hexbeam):
+    hexbeam.point_arrays['ind'] = np.arange(hexbeam.n_points)
+    grid = hexbeam.merge(hexbeam, inplace=False, merge_points=False)
+    assert grid.n_points == 2 * hexbeam.n_points
+    cleaned = grid.clean()
+    assert cleaned.n_points == hexbeam.n_points
+    assert cleaned.n_cells == grid.n_cells
+    assert np.allclose(cleaned.points, hexbeam.points[cleaned.point_arrays['ind']])
+
+    # tetrahedra collapsed to a triangle are removed
+    points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [0, 0, 1e-8]], float)
+    cells = np.array([4, 0, 1, 2, 3, 4, 0, 1, 2, 4])
+    tets = pyvista.UnstructuredGrid(cells, np.full(2, vtk.VTK_TETRA, np.uint8), points)
+    assert tets.clean().n_cells == 2
+    cleaned = tets.clean(tolerance=1e-6)
+    assert cleaned.n_cells == 1
+    assert cleaned.n_points == 4
+
+    tets.clean(tolerance=1e-6, inplace=True)
+    assert tets.n_cells == 1
+
+
 def test_merge(hexbeam):
     grid = hexbeam.copy()
     grid.points[:, 0] += 1
@@ -1,3 +1,7 @@
+import json
+
+import pytest
+import vtk
 import pyvista
 import trimesh
 import numpy as np
@@ -12,3 +16,126 @@ def test_wrap_trimesh():
 
     assert np.allclose(tmesh.vertices, mesh.points)
     assert np.allclose(tmesh.faces, mesh.faces[1:])
+
+
+def test_wrap_trimesh_no_copy():
+    tmesh = trimesh.creation.icosphere()
+    mesh = pyvista.wrap(tmesh)
+    assert np.shares_memory(mesh.points, tmesh.vertices)
+    assert np.array_equal(mesh.faces.reshape(-1, 4)[:, 1:], tmesh.faces)
+
+
+def test_wrap_volume():
+    data = np.random.random((4, 5, 6))
+    mesh = pyvista.wrap(data)
+    assert mesh.dimensions == [4, 5, 6]
+    assert np.array_equal(mesh['values'], data.ravel(order='F'))
+
+    data = np.asfortranarray(data)
+    mesh = pyvista.wrap(data)
+    assert np.shares_memory(mesh['values'], data)
+
+    data = data.astype('>f8')
+    mesh = pyvista.wrap(data)
+    assert np.array_equal(mesh['values'], data.ravel(order='F'))
+
+
+def test_to_trimesh(sphere):
+    sphere.points = sphere.points.astype(np.float64)
+    tmesh = sphere.to_trimesh()
+    assert isinstance(tmesh, trimesh.Trimesh)
+    assert np.shares_memory(tmesh.vertices, sphere.points)
+    assert np.array_equal(tmesh.faces, sphere.faces.reshape(-1, 4)[:, 1:])
+
+    mesh = pyvista.wrap(tmesh)
+    assert np.allclose(mesh.points, sphere.points)
+    assert np.array_equal(mesh.faces, sphere.faces)
+
+    quad = pyvista.Plane(i_resolution=2, j_resolution=2)
+    tmesh = quad.to_trimesh()
+    assert tmesh.faces.shape == (8, 3)
+
+
+def test_n_threads():
+    backend = pyvista.smp_backend()
+    assert backend is None or isinstance(backend, str)
+    with pytest.raises(ValueError):
+        pyvista.set_n_threads(-1)
+
+    pyvista.set_n_threads(2)
+    try:
+        with pyvista.n_threads(1):
+            assert pyvista.get_n_threads() == 1
+            iso = pyvista.Sphere().elevation().contour(3)
+            assert iso.n_points
+        assert pyvista.utilities.helpers._SMP_N_THREADS == 2
+    finally:
+        pyvista.set_n_threads()
+    assert pyvista.utilities.helpers._SMP_N_THREADS == 0
+
+
+def test_smp_backend_read_only(monkeypatch):
+    class SMPTools:
+        """The SMP tools of a sequential VTK 9.0 build."""
+
+        @staticmethod
+        def Initialize(n):
+            raise AssertionError('smp_backend must not change the SMP settings')
+
+        @staticmethod
+        def GetEstimatedNumberOfThreads():
+            return 1
+
+    helpers = pyvista.utilities.helpers
+    monkeypatch.setattr(helpers.vtk, 'vtkSMPTools', SMPTools)
+    assert pyvista.smp_backend() is None
+    monkeypatch.setattr(helpers, '_SMP_N_THREADS', 2)
+    assert pyvista.smp_backend() == 'Sequential'
+
+
+def test_profile(sphere, tmpdir):
+    with pyvista.profile() as prof:
+        sphere.decimate(0.5)
+        with pyvista.profile() as inner:
+            sphere.slice()
+    assert not pyvista.utilities.helpers._PROFILES
+    assert [record['filter'] for record in prof.records] == ['decimate', 'slice']
+    assert [record['filter'] for record in inner.records] == ['slice']
+
+    record = prof.records[0]
+    assert record['algorithm'] == 'vtkQuadricDecimation'
+    assert record['input_cells'] == sphere.n_cells
+    assert 0 < record['output_cells'] < sphere.n_cells
+    assert record['wall_time'] > 0
+    assert record['memory'] > 0
+    assert record['progress'][-1][1] == 1.0
+    assert 'vtkQuadricDecimation' in prof.table()
+
+    filename = str(tmpdir.join('trace.json'))
+    trace = prof.to_chrome_trace(filename)
+    with open(filename) as f:
+        assert json.load(f) == trace
+    assert {event['name'] for event in trace['traceEvents']} == {'decimate', 'slice', 'progress'}
+
+
+def test_profile_filter_names(sphere):
+    # these filters update their algorithms in private helpers
+    with pyvista.profile() as prof:
+        sphere.clip()
+        sphere.slice_along_axis(n=2)
+        sphere.slice_orthogonal()
+    names = {record['filter'] for record in prof.records}
+    assert names == {'clip', 'slice_along_axis', 'slice_orthogonal'}
+
+
+def test_profile_failed_update():
+    class FailingAlgorithm(vtk.vtkPolyDataAlgorithm):
+        def Update(self):
+            raise RuntimeError('update failed')
+
+    alg = FailingAlgorithm()
+    with pyvista.profile() as prof:
+        with pytest.raises(RuntimeError):
+            pyvista.core.filters._update_alg(alg, name='failing')
+    assert not alg.HasObserver(vtk.vtkCommand.ProgressEvent)
+    assert [record['filter'] for record in prof.records] == ['failing']
@@ -31,6 +31,32 @@ def test_meshio(mesh_in, tmpdir):
         assert np.allclose(v, mesh.cell_arrays[k.replace(" ", "_")])
 
 
+def test_from_meshio_native_dtypes(tmpdir):
+    import meshio
+    points = np.random.random((8, 3)).astype(np.float32)
+    cells = [
+        ("triangle", np.array([[0, 1, 2], [2, 3, 4]])),
+        ("quad", np.array([[0, 1, 2, 3]])),
+        ("triangle", np.array([[5, 6, 7]])),
+    ]
+    mesh_in = meshio.Mesh(points, cells,
+                          point_data={"ids": np.arange(8, dtype=np.int32)},
+                          cell_data={"data": [np.array([1., 2.]), np.array([3.]), np.array([4.])]})
+    mesh = pyvista.from_meshio(mesh_in)
+
+    assert mesh.points.dtype == np.float32
+    assert mesh.point_arrays["ids"].dtype == np.int32
+    assert np.array_equal(mesh.celltypes, [5, 5, 9, 5])
+    assert np.array_equal(mesh.cell_arrays["data"], [1, 2, 3, 4])
+
+    # cell order and cell data survive a round trip through mixed blocks
+    filename = str(tmpdir.join("mixed.vtu"))
+    pyvista.save_meshio(filename, mesh)
+    mesh_out = pyvista.read_meshio(filename)
+    assert np.array_equal(mesh_out.cells, mesh.cells)
+    assert np.array_equal(mesh_out.cell_arrays["data"], [1, 2, 3, 4])
+
+
 def test_pathlib_read_write(tmpdir, sphere):
     path = pathlib.Path(str(tmpdir.mkdir("tmpdir").join('tmp.vtk')))
     pyvista.save_meshio(path, sphere)
@@ -51,3 +77,17 @@ def test_file_format():
 
     with pytest.raises((KeyError, WriteError)):
         pyvista.save_meshio("foo.npy", beam, file_format="npy")
+
+
+@pytest.mark.parametrize("n_points", [4, 0])
+def test_meshio_no_cells(n_points, tmpdir):
+    filename = str(tmpdir.join("empty.vtk"))
+    if n_points:
+        mesh_in = pyvista.UnstructuredGrid(np.empty(0, int), np.empty(0, np.uint8),
+                                           np.random.random((n_points, 3)))
+    else:
+        mesh_in = pyvista.PolyData()
+    pyvista.save_meshio(filename, mesh_in)
+    mesh = pyvista.read_meshio(filename)
+    assert mesh.n_cells == 0
+    assert mesh.n_points == n_points
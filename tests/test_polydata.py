@@ -9,6 +9,7 @@ import pyvista
 from pyvista import examples
 from pyvista.plotting import system_supports_plotting
 from pyvista.core.errors import NotAllTrianglesError
+from pyvista.utilities.cells import CellArray, cell_array_to_numpy
 
 radius = 0.5
 SPHERE = pyvista.Sphere(radius, theta_resolution=10, phi_resolution=10)
@@ -189,6 +190,39 @@ def test_geodesic_distance(sphere):
     assert isinstance(distance, float)
 
 
+def test_geodesic_distance_field(sphere):
+    field = sphere.geodesic_distance_field([0, 10])
+    distances = field.point_arrays['GeodesicDistance']
+    sources = field.point_arrays['GeodesicSource']
+    assert distances[0] == distances[10] == 0
+    assert set(np.unique(sources)) == {0, 10}
+    for end_vertex in [50, sphere.n_points - 1]:
+        expected = min(sphere.geodesic_distance(0, end_vertex),
+                       sphere.geodesic_distance(10, end_vertex))
+        assert np.isclose(distances[end_vertex], expected)
+
+    sphere.geodesic_distance_field(0, inplace=True)
+    assert 'GeodesicDistance' in sphere.point_arrays
+
+    with pytest.raises(IndexError):
+        sphere.geodesic_distance_field([sphere.n_points])
+
+
+def test_geodesic_paths(sphere):
+    end_vertices = [1, 50, sphere.n_points - 1]
+    paths = sphere.geodesic_paths(0, end_vertices)
+    assert paths.n_blocks == 3
+    for end_vertex, path in zip(end_vertices, paths):
+        ids = path.point_arrays['vtkOriginalPointIds']
+        assert ids[0] == end_vertex and ids[-1] == 0
+        assert np.allclose(path.points, sphere.points[ids])
+        length = np.sum(path.compute_cell_sizes()['Length'])
+        assert np.isclose(length, sphere.geodesic_distance(0, end_vertex))
+
+    with pytest.raises(IndexError):
+        sphere.geodesic_paths(0, [-1])
+
+
 def test_ray_trace():
     sphere = SPHERE.copy()
     points, ind = sphere.ray_trace([0, 0, 0], [1, 1, 1])
@@ -216,6 +250,43 @@ def test_multi_ray_trace():
     assert np.any(ind_t)
 
 
+def test_cast_rays():
+    sphere = SPHERE.copy()
+    origins = [[0, 0, 0], [0, 0, 0], [0, 0, 0], [2, 2, 2]]
+    directions = [[1, 0, 0], [0, 1, 0], [0, 0, -1], [1, 0, 0]]
+    points, rays, cells = sphere.cast_rays(origins, directions, first_point=True)
+    assert np.array_equal(rays, [0, 1, 2])
+    assert np.allclose(np.linalg.norm(points, axis=1), 0.5, atol=0.05)
+    for point, ray in zip(points, rays):
+        vtk_point, _ = sphere.ray_trace(origins[ray], directions[ray], first_point=True)
+        assert np.allclose(point, vtk_point, atol=1e-5)
+
+    # all hits through the sphere, ordered along the ray
+    points, rays, cells = sphere.cast_rays([[-1, 0.01, 0.02]], [[1, 0, 0]])
+    assert np.array_equal(rays, [0, 0])
+    assert points[0, 0] < points[1, 0]
+    points, rays, cells = sphere.cast_rays([[-1, 0.01, 0.02]], [[1, 0, 0]], max_distance=1)
+    assert np.array_equal(rays, [0])
+
+    # the cached hierarchy follows changes of the mesh, but not of its arrays
+    bvh = pyvista.core.filters._ray_bvh(sphere)
+    sphere.point_arrays['values'] = np.arange(sphere.n_points)
+    assert pyvista.core.filters._ray_bvh(sphere)[0] is bvh[0]
+    sphere.points *= 2
+    assert pyvista.core.filters._ray_bvh(sphere)[0] is not bvh[0]
+    points, rays, cells = sphere.cast_rays([[0, 0, 0]], [[1, 0, 0]])
+    assert np.allclose(np.linalg.norm(points, axis=1), 1, atol=0.1)
+
+
+def test_cast_rays_polygons():
+    plane = pyvista.Plane(i_resolution=2, j_resolution=2)
+    origins = [[-0.25, -0.25, 1], [0.25, 0.25, 1], [0.25, -0.25, -1]]
+    directions = [[0, 0, -1], [0, 0, -1], [0, 0, -1]]
+    points, rays, cells = plane.cast_rays(origins, directions)
+    assert np.array_equal(rays, [0, 1])
+    assert np.array_equal(cells, [plane.find_closest_cell(point) for point in points])
+
+
 @pytest.mark.skipif(not system_supports_plotting(), reason="Requires system to support plotting")
 def test_plot_curvature():
     sphere = SPHERE.copy()
@@ -410,6 +481,36 @@ def test_decimate_pro():
     assert mesh.n_faces < sphere.n_faces
 
 
+@pytest.mark.parametrize('method', ['quadric', 'pro'])
+def test_lod_pyramid(method, tmpdir, monkeypatch):
+    monkeypatch.setattr(pyvista, 'READ_CACHE_PATH', str(tmpdir))
+    sphere = pyvista.Sphere(theta_resolution=40, phi_resolution=40)
+    sphere['x'] = sphere.points[:, 0]
+    sphere.cell_arrays['ids'] = np.arange(sphere.n_cells)
+    pyramid = sphere.lod_pyramid([0.5, 0.9], method=method, cache=True)
+    assert isinstance(pyramid, pyvista.MultiBlock)
+    assert pyramid.n_blocks == 3
+    assert pyramid[0] is sphere
+    n_cells = [level.n_cells for level in pyramid]
+    assert n_cells[0] > n_cells[1] > n_cells[2]
+    for level in pyramid:
+        assert 'x' in level.point_arrays
+        assert 'ids' in level.cell_arrays
+        assert np.allclose(level['x'], level.points[:, 0], atol=0.1)
+    assert pyramid[2].field_arrays['TargetReduction'][0] == 0.9
+
+    # load the levels from the cache
+    cached = sphere.lod_pyramid([0.5, 0.9], method=method, cache=True)
+    assert len(os.listdir(str(tmpdir))) == 2
+    for level, cached_level in zip(pyramid, cached):
+        assert np.allclose(level.points, cached_level.points)
+
+    with pytest.raises(ValueError):
+        sphere.lod_pyramid([0.9, 0.5])
+    with pytest.raises(ValueError):
+        sphere.lod_pyramid(method='not a method')
+
+
 def test_compute_normals():
     sphere = SPHERE.copy()
     sphere_normals = SPHERE.copy()
@@ -469,6 +570,28 @@ def test_clean(sphere):
     assert cleaned.n_points == mesh.n_points
 
 
+def test_clean_numpy(sphere):
+    sphere.point_arrays['ids'] = np.arange(sphere.n_points)
+    mesh = sphere + sphere
+    cleaned = mesh.clean(engine='numpy')
+    expected = mesh.clean()
+    assert np.array_equal(cleaned.points, expected.points)
+    assert np.array_equal(cleaned.faces, expected.faces)
+    assert np.array_equal(cleaned.point_arrays['ids'], expected.point_arrays['ids'])
+
+    cleaned = mesh.clean(point_merging=False, engine='numpy')
+    assert cleaned.n_points == mesh.n_points
+
+    # repeated points are skipped and collapsed faces removed
+    points = np.array([[0, 0, 0], [0, 1, 0], [1, 0, 0], [1, 1, 0]], float)
+    faces = np.array([3, 0, 1, 1, 3, 0, 1, 2, 4, 0, 1, 1, 2, 5, 0, 1, 2, 3, 0])
+    cleaned = pyvista.PolyData(points, faces).clean(engine='numpy')
+    assert np.array_equal(cleaned.faces, [3, 0, 1, 2, 3, 0, 1, 2, 4, 0, 1, 2, 3])
+
+    with pytest.raises(ValueError):
+        mesh.clean(engine='not an engine')
+
+
 def test_area():
     dense_sphere = SPHERE_DENSE.copy()
     radius = 0.5
@@ -516,11 +639,40 @@ def test_remove_points_all():
     assert sphere_copy.n_faces == sphere.n_faces - 1
 
 
-def test_remove_points_fail(sphere, plane):
-    # not triangles:
-    with pytest.raises(NotAllTrianglesError):
-        plane.remove_points([0])
-
+def test_remove_points_mixed_cells(plane):
+    plane.cell_arrays['ind'] = np.arange(plane.n_cells)
+    remove = plane.points[:, 0] < plane.center[0]
+    mesh, ind = plane.remove_points(remove)
+    assert mesh.n_cells == plane.n_cells // 2
+    assert np.allclose(mesh.points, plane.points[ind])
+    assert not remove[ind].any()
+    kept = mesh.cell_arrays['ind']
+    assert np.array_equal(mesh.faces, plane.extract_cells(kept).cells)
+
+    mesh = pyvista.PolyData(np.random.random((8, 3)))
+    mesh.verts = np.array([1, 7])
+    mesh.lines = np.array([3, 0, 1, 2, 2, 3, 4])
+    mesh.faces = np.array([4, 2, 4, 5, 6, 3, 4, 5, 6])
+    mesh.cell_arrays['ind'] = np.arange(mesh.n_cells)
+    reduced, ind = mesh.remove_points([0, 2])
+    assert np.array_equal(ind, [3, 4, 5, 6, 7])
+    assert np.array_equal(reduced.cell_arrays['ind'], [0, 2, 4])
+    assert reduced.GetNumberOfVerts() == 1
+    assert reduced.GetNumberOfLines() == 1
+    assert np.array_equal(reduced.faces, [3, 1, 2, 3])
+
+    # polygons and triangle strips keep their kind
+    mesh = pyvista.PolyData(np.random.random((12, 3)), np.array([5, 0, 1, 2, 3, 4]))
+    mesh.SetStrips(CellArray([5, 5, 6, 7, 8, 9]))
+    reduced, ind = mesh.remove_points([11])
+    assert reduced.GetNumberOfPolys() == 1
+    assert reduced.GetNumberOfStrips() == 1
+    assert np.array_equal(reduced.faces, [5, 0, 1, 2, 3, 4])
+    offsets, connectivity = cell_array_to_numpy(reduced.GetStrips())
+    assert np.array_equal(connectivity, [5, 6, 7, 8, 9])
+
+
+def test_remove_points_fail(sphere):
     # invalid bool mask size
     with pytest.raises(ValueError):
         sphere.remove_points(np.ones(10, np.bool_))
@@ -83,6 +83,37 @@ def test_read(tmpdir, use_pathlib):
     assert multi[1].n_blocks == 2
 
 
+def test_read_cache(tmpdir, monkeypatch):
+    cache_path = str(tmpdir.join('cache'))
+    monkeypatch.setattr(pyvista, 'READ_CACHE_PATH', cache_path)
+    filename = str(tmpdir.join('beam.vtk'))
+    beam = pyvista.UnstructuredGrid(ex.hexbeamfile)
+    beam.save(filename, binary=False)
+
+    mesh = pyvista.read(filename, cache=True)
+    assert len(os.listdir(cache_path)) == 1
+    cached = pyvista.read(filename, cache=True)
+    assert isinstance(cached, pyvista.UnstructuredGrid)
+    assert np.allclose(cached.points, mesh.points)
+    assert np.array_equal(cached.cells, mesh.cells)
+    assert cached.array_names == mesh.array_names
+
+    # a modified file gets a new entry and the old one is evicted
+    beam.points[0] = 10
+    beam.save(filename, binary=False)
+    os.utime(filename, ns=(0, 0))
+    monkeypatch.setattr(pyvista, 'READ_CACHE_MAX_SIZE', 1)
+    mesh = pyvista.read(filename, cache=True)
+    assert np.allclose(mesh.points[0], 10)
+    assert len(os.listdir(cache_path)) == 0
+
+    monkeypatch.setattr(pyvista, 'READ_CACHE_MAX_SIZE', 2**30)
+    pyvista.read([filename, ex.antfile], cache=True)
+    assert len(os.listdir(cache_path)) == 2
+    pyvista.clear_read_cache()
+    assert len(os.listdir(cache_path)) == 0
+
+
 def test_get_array():
     grid = pyvista.UnstructuredGrid(ex.hexbeamfile)
     # add array to both point/cell data with same name
@@ -212,6 +243,25 @@ def test_convert_id_list():
     assert np.allclose(converted, ids)
 
 
+def test_cell_weights_degenerate():
+    # a regular tetrahedron and a flat one
+    points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 0]], float)
+    cells = np.array([4, 0, 1, 2, 3, 4, 0, 1, 2, 4])
+    grid = pyvista.UnstructuredGrid(cells, np.full(2, vtk.VTK_TETRA, np.uint8), points)
+    probes = np.array([[0.1, 0.2, 0.3], [0.2, 0.2, 0]])
+    indptr, indices, weights = pyvista.utilities.interpolation.cell_weights(
+        grid, [0, 1], probes)
+    assert np.array_equal(indptr, [0, 4, 8])
+    assert np.array_equal(indices, [0, 1, 2, 3, 0, 1, 2, 4])
+    assert np.allclose(weights[:4], [0.4, 0.1, 0.2, 0.3])
+
+    cell = grid.GetCell(1)
+    expected = [0.0] * 4
+    cell.EvaluatePosition(probes[1], [0.0] * 3, vtk.reference(0), [0.0] * 3,
+                          vtk.reference(0.0), expected)
+    assert np.allclose(weights[4:], expected)
+
+
 def test_progress_monitor():
     mesh = pyvista.Sphere()
     ugrid = mesh.delaunay_3d(progress_bar=True)
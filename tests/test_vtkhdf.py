@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+import pyvista
+from pyvista import examples
+
+h5py = pytest.importorskip('h5py')
+
+beam = examples.load_hexbeam()
+uniform = examples.load_uniform()
+
+
+def assert_arrays_equal(mesh_a, mesh_b):
+    for name in mesh_a.point_arrays:
+        assert np.array_equal(mesh_a.point_arrays[name], mesh_b.point_arrays[name])
+    for name in mesh_a.cell_arrays:
+        assert np.array_equal(mesh_a.cell_arrays[name], mesh_b.cell_arrays[name])
+
+
+@pytest.mark.parametrize('mesh_in', [beam, uniform, examples.load_airplane()])
+def test_vtkhdf_round_trip(mesh_in, tmpdir):
+    filename = str(tmpdir.join('mesh.vtkhdf'))
+    pyvista.save_vtkhdf(filename, mesh_in)
+    mesh = pyvista.read(filename)
+    assert type(mesh) is type(mesh_in)
+    assert np.allclose(mesh.points, mesh_in.points)
+    assert mesh.n_cells == mesh_in.n_cells
+    assert_arrays_equal(mesh_in, mesh)
+
+    with h5py.File(filename, 'r') as f:
+        assert f['VTKHDF'].attrs['Type'].decode() in ('UnstructuredGrid', 'ImageData',
+                                                      'PolyData')
+
+
+def test_vtkhdf_arrays_subset(tmpdir):
+    filename = str(tmpdir.join('beam.vtkhdf'))
+    pyvista.save_vtkhdf(filename, beam, compression='lzf')
+    mesh = pyvista.read_vtkhdf(filename, arrays=['sample_cell_scalars'])
+    assert mesh.array_names == ['sample_cell_scalars']
+    assert np.array_equal(mesh.cells, beam.cells)
+
+    mesh = pyvista.read_vtkhdf(filename, arrays=[])
+    assert mesh.n_arrays == 0
+
+
+def test_vtkhdf_image_extent(tmpdir):
+    filename = str(tmpdir.join('uniform.vtkhdf'))
+    pyvista.save_vtkhdf(filename, uniform)
+    extent = (2, 5, 1, 4, 3, 7)
+    subset = pyvista.read_vtkhdf(filename, extent=extent)
+    expected = uniform.extract_subset(extent)
+    assert subset.dimensions == expected.dimensions
+    assert np.allclose(subset.bounds, expected.bounds)
+    assert_arrays_equal(expected, subset)
+
+    with pytest.raises(ValueError):
+        pyvista.read_vtkhdf(filename, extent=(0, 20, 0, 1, 0, 1))
+    with pytest.raises(ValueError):
+        pyvista.read_vtkhdf(filename, partitions=0)
+
+
+def test_vtkhdf_partitions(tmpdir, sphere):
+    sphere.cell_arrays['id'] = np.arange(sphere.n_cells)
+    cube = pyvista.Cube()
+    cube.cell_arrays['id'] = np.arange(cube.n_cells) + sphere.n_cells
+    filename = str(tmpdir.join('parts.vtkhdf'))
+    pyvista.save_vtkhdf(filename, [sphere, cube])
+
+    merged = pyvista.read_vtkhdf(filename)
+    assert merged.n_points == sphere.n_points + cube.n_points
+    assert np.array_equal(merged.cell_arrays['id'], np.arange(merged.n_cells))
+
+    second = pyvista.read_vtkhdf(filename, partitions=1)
+    assert np.allclose(second.points, cube.points)
+    assert np.array_equal(second.faces, cube.faces)
+    assert np.array_equal(second.cell_arrays['id'], cube.cell_arrays['id'])
+
+    grids = [part.cast_to_unstructured_grid() for part in (sphere, cube)]
+    pyvista.save_vtkhdf(filename, grids)
+    first = pyvista.read_vtkhdf(filename, partitions=(0, 1))
+    assert np.array_equal(first.cells, grids[0].cells)
+    merged = pyvista.read_vtkhdf(filename)
+    assert np.allclose(merged.points[sphere.n_points:], cube.points)
+
+    with pytest.raises(ValueError):
+        pyvista.read_vtkhdf(filename, partitions=(1, 3))
+    with pytest.raises(TypeError):
+        pyvista.save_vtkhdf(filename, [sphere, grids[0]])
+
+
+def test_vtkhdf_multiblock(tmpdir, sphere):
+    multi = pyvista.MultiBlock({'beam': beam, 'sphere': sphere})
+    multi[-1, 'nested'] = pyvista.MultiBlock([uniform, None])
+    filename = str(tmpdir.join('multi.vtkhdf'))
+    pyvista.save_vtkhdf(filename, multi)
+
+    mesh = pyvista.read(filename)
+    assert isinstance(mesh, pyvista.MultiBlock)
+    assert mesh.keys() == ['beam', 'sphere', 'nested']
+    assert isinstance(mesh['nested'][0], pyvista.UniformGrid)
+    assert mesh['nested'][1] is None
+    assert_arrays_equal(beam, mesh['beam'])
+
+
+def test_vtkhdf_multiblock_duplicate_names(tmpdir, sphere):
+    multi = pyvista.MultiBlock()
+    multi[-1, 'mesh'] = sphere
+    multi[-1, 'mesh'] = beam
+    multi[-1, 'mesh'] = pyvista.MultiBlock([uniform])
+    filename = str(tmpdir.join('multi.vtkhdf'))
+    pyvista.save_vtkhdf(filename, multi)
+
+    mesh = pyvista.read(filename)
+    assert mesh.n_blocks == 3
+    assert mesh.keys() == ['mesh', 'mesh_1', 'mesh_2']
+    assert_arrays_equal(sphere, mesh[0])
+    assert_arrays_equal(beam, mesh[1])
+    assert isinstance(mesh[2][0], pyvista.UniformGrid)
+
+    # the renamed leaves must not collide with later names
+    multi = pyvista.MultiBlock()
+    for name, block in [('mesh', sphere), ('mesh_1', beam), ('mesh', uniform),
+                        ('Assembly', sphere)]:
+        multi[-1, name] = block
+    pyvista.save_vtkhdf(filename, multi)
+    mesh = pyvista.read(filename)
+    assert mesh.keys() == ['mesh', 'mesh_1', 'mesh_2', 'Assembly']
+    assert_arrays_equal(beam, mesh[1])
+    assert isinstance(mesh[2], pyvista.UniformGrid)
+    assert_arrays_equal(sphere, mesh[3])